@@ -30,7 +30,8 @@ from train_control_platform import (
     UDPReceiver,
     MQTTParameterSync,
     TrainConfigManager,
-    TrainConfig
+    TrainConfig,
+    serve_dash_app
 )
 
 
@@ -478,7 +479,7 @@ class MultiTrainApp:
         for train_id in self.train_dashboards.keys():
             print(f"  - http://{host}:{port}/train/{train_id}")
 
-        self.app.run(host=host, port=port, debug=debug, use_reloader=False)
+        serve_dash_app(self.app, host, port, debug=debug, use_reloader=False)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,40 @@
+"""MQTTParameterSync message handling, exercised without a broker"""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    # Importing the platform builds the default dashboard, which reads its config from the cwd
+    monkeypatch.chdir(tmp_path)
+    import train_control_platform as tcp
+    return tcp.MQTTParameterSync()
+
+
+def _deliver(sync, topic, payload):
+    sync._on_message(None, None, SimpleNamespace(topic=topic, payload=payload))
+
+
+def test_known_topic_pushes_once(sync):
+    pushed = []
+    sync.websocket_callback = pushed.append
+
+    _deliver(sync, sync.mqtt_topics['kp_status'], b'1.5')
+
+    assert len(pushed) == 1
+    assert sync.confirmed_params['kp'] == 1.5
+
+
+def test_unknown_topic_pushes_nothing(sync):
+    pushed = []
+    sync.websocket_callback = pushed.append
+
+    _deliver(sync, 'trenes/unknown/status', b'1.5')
+
+    assert pushed == []
+    assert sync.confirmation_count == 0
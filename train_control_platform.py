@@ -17,29 +17,52 @@ Author: Generated for UAI SIMU Project
 """
 
 import dash
-from dash import dcc, html, Input, Output, State, callback_context
+from dash import dcc, html, Input, Output, State, Patch, callback_context
 from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+import numpy as np
 import paho.mqtt.publish as publish
 import paho.mqtt.client as mqtt
-import csv
 import socket
+import selectors
 import threading
+import collections
 import queue
 import time
 import os
+import re
+import sys
 import glob
+import io
 import traceback
+import atexit
 from datetime import datetime
 import psutil
 import json
-import uuid
+from flask import Response
+import functools
 from dataclasses import dataclass
 from typing import Dict, Optional
 import logging
 
+# Hot-path diagnostics (per packet / per MQTT message) go through this logger at DEBUG so they cost
+# nothing unless enabled, e.g. logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder for config files; stdlib json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional production WSGI server; falls back to the Flask development server
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
 # =============================================================================
 # Configuration Constants
 # =============================================================================
@@ -49,13 +72,34 @@ DEFAULT_UDP_PORT = 5555
 DEFAULT_MQTT_PORT = 1883
 DEFAULT_MQTT_BROKER = '127.0.0.1'
 UDP_TIMEOUT = 1.0  # seconds
+UDP_BUFFER_SIZE = 1024  # bytes per datagram
+UDP_RECV_BATCH = 64  # max datagrams drained per receiver wakeup (recvmmsg-sized batch)
+UDP_RCVBUF_SIZE = 12 * 1024 * 1024  # requested kernel receive buffer (Linux caps it at net.core.rmem_max)
+UDP_PENDING_BATCHES = 256  # received batches waiting for the processing thread before the oldest is dropped
+UDP_DROP_REPORT_INTERVAL = 5.0  # seconds between backlog-overflow warnings (drops are counted in between)
 MQTT_KEEPALIVE = 60  # seconds
+# Seconds of slider quiet before the last value is published: long enough to coalesce a burst of
+# slider/keyboard steps into one message, short enough that the ESP32 still feels immediate
+MQTT_PUBLISH_DEBOUNCE = 0.2
+MQTT_OUTBOX_BATCH = 32  # queued publishes sent per burst by the publisher thread
+# Control-plane topics published with QoS 1: experiment start/stop toggles and the deadband apply command
+MQTT_CONTROL_TOPIC_KEYS = ('sync', 'step_sync', 'deadband_sync', 'deadband_apply')
+MQTT_CONTROL_ACK_TIMEOUT = 1.0  # seconds the publisher thread waits for a burst's QoS 1 acknowledgement
 
 # Dashboard Configuration
 DASHBOARD_HOST = '127.0.0.1'
 DASHBOARD_PORT = 8050
 DATA_REFRESH_INTERVAL = 1000  # milliseconds
 MQTT_STATUS_REFRESH_INTERVAL = 200  # milliseconds
+WSGI_CALLBACK_THREADS = 8  # waitress worker threads left for concurrent Dash callbacks
+# An open event stream pins a waitress worker for its whole lifetime, so streams get their own share
+# of threads and are capped (pages beyond the cap get 503 and retry); shared by every dashboard in the process
+SSE_MAX_STREAMS = 8
+WSGI_THREADS = WSGI_CALLBACK_THREADS + SSE_MAX_STREAMS
+SSE_KEEPALIVE = 5.0  # seconds between keep-alive comments on an idle event stream (detects closed tabs)
+SSE_MAX_LIFETIME = 60.0  # seconds before a stream ends and the browser reconnects (recycles its thread)
+SSE_REFUSED_RETRY = 10.0  # seconds before a page retries a stream refused with 503
+SSE_DATA_MIN_INTERVAL = 0.1  # seconds between "new data" events on a busy stream (coalesces bursts)
 
 # PID Control Limits
 PID_KP_MAX = 250
@@ -66,8 +110,60 @@ REFERENCE_MAX = 100
 
 # File Configuration
 NETWORK_CONFIG_FILE = 'network_config.json'
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translations')
+NETWORK_IFADDRS_TTL = 30  # seconds a detected interface list is reused (the Refresh button bypasses it)
+CONFIG_SAVE_DELAY = 1.0  # seconds to coalesce network config changes before writing the file
+ACTIVE_CSV_RECHECK_INTERVAL = 2.0  # seconds a resolved "newest CSV" path is reused before re-globbing
 CSV_FILE_PREFIX = 'experiment_'
 MAX_DATA_QUEUE_SIZE = 1000
+TELEMETRY_RING_SIZE = 65536  # samples kept in memory per data manager for plotting
+PLOT_MAX_POINTS = 2000  # longer series are LTTB-downsampled before being sent to the browser
+# PID tab control (slider or typed-value send store, un-prefixed id) -> parameter / MQTT topic key it sets
+PID_PARAM_CONTROLS = {
+    'kp-slider': 'kp', 'kp-send-store': 'kp',
+    'ki-slider': 'ki', 'ki-send-store': 'ki',
+    'kd-slider': 'kd', 'kd-send-store': 'kd',
+    'reference-slider': 'reference', 'ref-send-store': 'reference',
+}
+# Typed inputs with a send button: '<name>-input' + '<name>-send-btn' feed '<name>-send-store' in the browser
+TYPED_SEND_CONTROLS = ('kp', 'ki', 'kd', 'ref', 'amplitude', 'duration')
+PID_PARAM_LABELS = {'kp': 'Kp', 'ki': 'Ki', 'kd': 'Kd', 'reference': 'Ref'}
+CONFIRMED_DISPLAY_KEYS = ('kp', 'ki', 'kd', 'reference')  # order of the confirmed-parameter status line
+STATUS_CACHE_SIZE = 16  # rendered parameter-status variants kept before the cache is reset
+HISTORICAL_CSV_COLUMNS = ('time_event', 'input', 'referencia')  # PID CSV columns the historical graph plots
+_HISTORICAL_CSV_DTYPES = dict.fromkeys(HISTORICAL_CSV_COLUMNS, np.float64)
+LANGUAGE_OPTIONS = [  # language dropdown entries (shared, never mutated)
+    {'label': '🇪🇸 Español', 'value': 'es'},
+    {'label': '🇺🇸 English', 'value': 'en'}
+]
+# Header texts switched in the browser on a language change, in LANGUAGE_CLIENTSIDE_JS output order
+LANGUAGE_HEADER_KEYS = ('title', 'subtitle', 'language', 'start_experiment', 'stop_experiment')
+MODE_BADGES = {  # tab value -> (header badge text, color); other tabs show the PID badge
+    'control-tab': ('PID Control', '#007BFF'),
+    'step-response-tab': ('Step Response', '#28A745'),
+    'deadband-tab': ('Deadband Cal', '#FFA500'),
+}
+MAIN_TABS = (  # (translation key, tab value) in display order
+    ('network_tab', 'network-tab'),
+    ('deadband_tab', 'deadband-tab'),
+    ('control_tab', 'control-tab'),
+    ('step_response_tab', 'step-response-tab'),
+    ('data_tab', 'data-tab'),
+)
+GRAPH_BUILD_INTERVAL = 0.5  # seconds between background rebuilds of the realtime figure (only when data changed)
+# relayoutData keys that carry a user zoom/pan range
+ZOOM_RANGE_KEYS = ('xaxis.range[0]', 'xaxis.range[1]', 'yaxis.range[0]', 'yaxis.range[1]')
+# Shared by every figure and never mutated (Plotly copies layout values, but rejects read-only mappings)
+GRAPH_MARGIN = {'l': 40, 'r': 20, 't': 40, 'b': 40}
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024  # bytes buffered by the open CSV handle
+CSV_FLUSH_ROWS = 64  # flush the CSV handle after this many rows
+CSV_FLUSH_INTERVAL = 0.5  # ...or once this many seconds have passed since the last flush
+WEBSOCKET_PUSH_INTERVAL = 0.05  # seconds new samples are coalesced into one push notification (20 Hz)
+
+# Pre-encoded MQTT control payloads (paho sends bytes as-is instead of re-encoding str on every publish)
+MQTT_PAYLOAD_TRUE = b'True'
+MQTT_PAYLOAD_FALSE = b'False'
+MQTT_PAYLOAD_REQUEST = b'1'
 
 # MQTT Topics
 MQTT_TOPICS = {
@@ -108,6 +204,249 @@ MQTT_TOPICS = {
     'deadband_apply': 'trenes/deadband/apply'
 }
 
+# ESP32 confirmation topics handled by MQTTParameterSync:
+# (MQTT_TOPICS key, params dict attribute, params key, cast, log label)
+STATUS_TOPIC_HANDLERS = (
+    ('kp_status', 'confirmed_params', 'kp', float, 'Kp'),
+    ('ki_status', 'confirmed_params', 'ki', float, 'Ki'),
+    ('kd_status', 'confirmed_params', 'kd', float, 'Kd'),
+    ('ref_status', 'confirmed_params', 'reference', float, 'Reference'),
+    ('step_amplitude_status', 'step_confirmed_params', 'amplitude', float, 'Step Amplitude'),
+    ('step_time_status', 'step_confirmed_params', 'time', float, 'Step Time'),
+    ('step_direction_status', 'step_confirmed_params', 'direction', int, 'Step Direction'),
+    ('step_vbatt_status', 'step_confirmed_params', 'vbatt', float, 'Step VBatt'),
+)
+
+MQTT_PAYLOAD_DECIMALS = 4  # finer than any slider/input step in the dashboard
+
+
+def encode_mqtt_number(value):
+    """Encode a numeric parameter as a short ASCII payload (the firmware parses it with toFloat/toInt)"""
+    # Fixed-point keeps float noise like 0.30000000000000004 and exponent notation off the wire
+    text = f"{float(value):.{MQTT_PAYLOAD_DECIMALS}f}".rstrip('0').rstrip('.')
+    return text.encode('ascii') if text not in ('', '-0') else b'0'
+
+_clock_cache = (None, '')
+
+def format_clock(epoch=None):
+    """HH:MM:SS wall-clock string for a UNIX time, formatted at most once per second"""
+    global _clock_cache
+    second = int(time.time() if epoch is None else epoch)
+    cached_second, text = _clock_cache
+    if second != cached_second:
+        text = time.strftime('%H:%M:%S', time.localtime(second))
+        _clock_cache = (second, text)  # Single tuple swap keeps readers consistent across threads
+    return text
+
+def lttb_indices(x, y, n_out=PLOT_MAX_POINTS):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling of (x, y)
+
+    First and last points are always kept; every bucket in between contributes the point
+    forming the largest triangle with the previous pick and the next bucket's average.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    picked = np.empty(n_out, dtype=np.intp)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+def downsample_series(x, y, n_out=PLOT_MAX_POINTS):
+    """LTTB-downsample one plotted series, returning (x, y) arrays"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = lttb_indices(x, y, n_out)
+    return x[keep], y[keep]
+
+def read_json(path):
+    """Read a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        payload = f.read()
+    return orjson.loads(payload) if orjson else json.loads(payload)
+
+def write_json_atomic(path, data):
+    """Write JSON to a temp file and atomically swap it in, so a crash never leaves a truncated config"""
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+class TranslationCatalog(dict):
+    """Language code -> UI strings, each language read from TRANSLATIONS_DIR/<lang>.json on first use"""
+
+    def __missing__(self, language):
+        # Intern keys so t('literal') lookups match by identity instead of comparing characters
+        strings = {sys.intern(key): text
+                   for key, text in read_json(os.path.join(TRANSLATIONS_DIR, f'{language}.json')).items()}
+        self[language] = strings
+        return strings
+
+
+# Shared by every dashboard instance (one per train), so each language file is read once per process
+TRANSLATIONS = TranslationCatalog()
+
+
+@functools.lru_cache(maxsize=None)
+def translate(language, key):
+    """UI string for key in language (falls back to the key); catalogs never change, so results are memoized"""
+    return TRANSLATIONS[language].get(key, key)
+
+
+# Free event-stream slots, shared by every dashboard of the process (they share one server), see _event_stream()
+_SSE_SLOTS = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+
+
+def serve_dash_app(app, host, port, debug=False, use_reloader=False, dev_server=False):
+    """Serve a Dash app with waitress when available, else the Flask development server"""
+    if waitress_serve and not debug and not dev_server:
+        print(f"[SERVER] Serving with waitress ({WSGI_THREADS} threads) on http://{host}:{port}")
+        waitress_serve(app.server, host=host, port=port, threads=WSGI_THREADS)
+    else:
+        if not waitress_serve:
+            print("[SERVER] waitress not installed - using Flask development server")
+        app.run(host=host, port=port, debug=debug, use_reloader=use_reloader)
+
+# Dashboard color scheme, shared by all dashboard instances
+UI_COLORS = {
+    'primary': '#1f2937',      # Dark gray
+    'secondary': '#3b82f6',    # Blue
+    'accent': '#10b981',       # Green
+    'background': '#f8fafc',   # Light gray
+    'surface': '#ffffff',      # White
+    'text': '#1f2937',         # Dark gray
+    'text_light': '#6b7280',   # Medium gray
+    'success': '#10b981',      # Green
+    'warning': '#f59e0b',      # Yellow
+    'danger': '#ef4444',       # Red
+    'train_primary': '#dc2626', # Train red
+    'train_secondary': '#1e40af' # Train blue
+}
+
+# Shared label styles, reused by reference across tab layouts (plain dicts: Dash cannot serialize mappingproxy)
+STYLE_LABEL_SMALL = {'fontWeight': '500', 'color': UI_COLORS['text'], 'fontSize': '12px', 'marginBottom': '4px'}
+STYLE_LABEL_FIELD = {'fontWeight': '500', 'fontSize': '13px'}
+STYLE_LABEL_BLOCK = {'fontWeight': '500', 'fontSize': '13px', 'marginBottom': '8px', 'display': 'block'}
+
+# Browser-side zoom tracking: folds a graph's relayoutData into its zoom store (same keys as
+# TrainControlDashboard.zoom_state); the server reads the store only when it rebuilds the figure
+ZOOM_STATE_CLIENTSIDE_JS = """
+function(relayout, current) {
+    if (!relayout) {
+        return window.dash_clientside.no_update;
+    }
+    const keys = ['xaxis.range[0]', 'xaxis.range[1]', 'yaxis.range[0]', 'yaxis.range[1]'];
+    const state = Object.assign({user_has_zoomed: false}, current || {});
+    let changed = false;
+    keys.forEach((key) => {
+        if (key in relayout) {
+            state[key] = relayout[key];
+            state.user_has_zoomed = true;
+            changed = true;
+        }
+    });
+    // Double-click resets the zoom
+    if ('xaxis.autorange' in relayout || 'yaxis.autorange' in relayout) {
+        keys.forEach((key) => { state[key] = null; });
+        state.user_has_zoomed = false;
+        changed = true;
+    }
+    return changed ? state : window.dash_clientside.no_update;
+}
+"""
+
+# Browser-side gate for the typed-value send buttons: a value the input rejected (empty, out of
+# min/max, off-step) is null and never reaches the server; a valid one is forwarded to the send store
+SEND_GATE_CLIENTSIDE_JS = """
+function(n_clicks, value) {
+    if (!n_clicks || value === null || value === undefined || Number.isNaN(value)) {
+        return window.dash_clientside.no_update;
+    }
+    return {value: value, n: n_clicks};
+}
+"""
+
+# Opens the dashboard event stream once per page and writes each named event into its store
+# (config.stores maps event name -> store id, e.g. pid -> pid-confirmed-store)
+EVENT_STREAM_CLIENTSIDE_JS = """
+function(config) {
+    if (!config || !window.EventSource) {
+        return;
+    }
+    window.trainEventStreams = window.trainEventStreams || {};
+    if (window.trainEventStreams[config.url]) {
+        return;
+    }
+    const open = () => {
+        const source = new EventSource(config.url);
+        Object.entries(config.stores).forEach(([name, store]) => {
+            source.addEventListener(name, (event) => {
+                window.dash_clientside.set_props(store, {data: JSON.parse(event.data)});
+            });
+        });
+        // While the stream is down (refused, reconnecting) the page falls back to polling
+        source.onopen = () => window.dash_clientside.set_props(config.fallback, {disabled: true});
+        // The browser reconnects on its own after a stream ends, but not after a refusal (503)
+        source.onerror = () => {
+            window.dash_clientside.set_props(config.fallback, {disabled: false});
+            if (source.readyState === EventSource.CLOSED) {
+                setTimeout(open, config.retry);
+            }
+        };
+        window.trainEventStreams[config.url] = source;
+    };
+    open();
+}
+"""
+
+# Language switch in the browser: header texts and tab labels come from language-strings
+# (see TrainControlDashboard._language_strings); the server only observes language-store
+LANGUAGE_CLIENTSIDE_JS = """
+function(language, strings) {
+    const entry = strings && strings[language];
+    if (!entry) {
+        throw window.dash_clientside.PreventUpdate;
+    }
+    const tabs = entry.tabs.map(([label, value]) => ({namespace: 'dash_core_components', type: 'Tab',
+                                                      props: {label: label, value: value}}));
+    return [{language: language}, ...entry.header, tabs];
+}
+"""
+
+# Browser-side renderer for the PID tab's confirmed-parameter line (fed by pid-confirmed-store)
+PID_STATUS_CLIENTSIDE_JS = """
+function(data) {
+    if (!data) {
+        return window.dash_clientside.no_update;
+    }
+    const span = (children, style) => ({namespace: 'dash_html_components', type: 'Span',
+                                        props: {children: children, style: style}});
+    if (data.state !== 'confirmed') {
+        return span(data.text, {color: data.colors.warning, fontSize: '13px'});
+    }
+    return span([
+        data.label,
+        span(data.params, {color: data.colors.success, fontWeight: 'bold'}),
+        span(' \u2713', {color: data.colors.success, marginLeft: '5px'}),
+        span(' (' + data.time + ')', {color: data.colors.text_light, fontSize: '11px', marginLeft: '8px'})
+    ], {fontSize: '13px'});
+}
+"""
+
 # =============================================================================
 # Train Configuration Management
 # =============================================================================
@@ -145,8 +484,7 @@ class TrainConfigManager:
         """Load train configurations from JSON file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+                config_data = read_json(self.config_file)
 
                 self.admin_password = config_data.get('admin_password', 'admin123')
                 self.dashboard_host = config_data.get('dashboard_host', '127.0.0.1')
@@ -213,8 +551,7 @@ class TrainConfigManager:
                 'dashboard_port': self.dashboard_port
             }
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_json_atomic(self.config_file, config_data)
 
             print(f"[CONFIG] Saved {len(self.trains)} train configurations")
         except Exception as e:
@@ -284,15 +621,52 @@ class MQTTParameterSync:
         # Callback for when parameters are confirmed
         self.on_params_updated = None
         self.on_step_params_updated = None
+        self.websocket_callback = None  # Set by the dashboard for push notifications
+        # Bumped on every confirmation; the event stream compares it to notice new ones
+        self.confirmation_count = 0
+
+        # Confirmation topic -> (params dict, key, cast, log label) for O(1) dispatch in _on_message
+        self._topic_handlers = self._build_topic_handlers()
+        # Received topic -> handler entry, caching misses (None) too; cleared whenever the table is rebuilt
+        self._resolve_topic = functools.lru_cache(maxsize=1024)(self._match_topic)
+
+    def _build_topic_handlers(self):
+        """Build the status-topic dispatch table from the instance topics"""
+        # Resolved per instance: multi-train dashboards use train-prefixed topics
+        return {
+            self.mqtt_topics[topic_key]: (getattr(self, params_attr), key, cast, label)
+            for topic_key, params_attr, key, cast, label in STATUS_TOPIC_HANDLERS
+        }
+
+    def _match_topic(self, topic):
+        """Find the handler for a received topic: exact entry first, then any '+'/'#' filter"""
+        handler = self._topic_handlers.get(topic)
+        if handler is None:
+            for topic_filter, entry in self._topic_handlers.items():
+                if ('+' in topic_filter or '#' in topic_filter) and mqtt.topic_matches_sub(topic_filter, topic):
+                    return entry
+        return handler
 
     def connect(self, broker_ip, broker_port=None):
-        """Connect to MQTT broker"""
+        """Connect to MQTT broker (keeps the existing connection if the broker is unchanged)"""
         try:
+            broker_port = broker_port or DEFAULT_MQTT_PORT
+            if self.client and (broker_ip, broker_port) == (self.broker_ip, self.broker_port):
+                if self.client.is_connected():
+                    return True
+                # loop_start() keeps retrying in the background; this just nudges it now
+                self.client.reconnect()
+                return True
+            if self.client:
+                # Broker changed: retire the old client so its network thread does not linger
+                self.disconnect()
+
             self.broker_ip = broker_ip
-            self.broker_port = broker_port or DEFAULT_MQTT_PORT
+            self.broker_port = broker_port
 
             self.client = mqtt.Client()
             self.client.on_connect = self._on_connect
+            self.client.on_disconnect = self._on_disconnect
             self.client.on_message = self._on_message
 
             self.client.connect(broker_ip, self.broker_port, MQTT_KEEPALIVE)
@@ -314,97 +688,65 @@ class MQTTParameterSync:
         """Called when MQTT client connects"""
         if rc == 0:
             self.connected = True
-            timestamp = time.strftime('%H:%M:%S')
+            timestamp = format_clock()
             print(f"[MQTT {timestamp}] Parameter sync connected successfully")
-            # Subscribe to parameter confirmation topics (using instance topics)
-            topics = [
-                self.mqtt_topics['kp_status'],
-                self.mqtt_topics['ki_status'],
-                self.mqtt_topics['kd_status'],
-                self.mqtt_topics['ref_status']
-            ]
-            for topic in topics:
-                result = client.subscribe(topic)
-                print(f"[MQTT {timestamp}] Subscribed to {topic}, result: {result}")
-
-            # Subscribe to step response confirmation topics (using instance topics)
-            step_topics = [
-                self.mqtt_topics['step_amplitude_status'],
-                self.mqtt_topics['step_time_status'],
-                self.mqtt_topics['step_direction_status'],
-                self.mqtt_topics['step_vbatt_status']
-            ]
-            for topic in step_topics:
-                result = client.subscribe(topic)
-                print(f"[MQTT {timestamp}] Subscribed to {topic}, result: {result}")
+            # Parameter messages are tiny; don't let Nagle hold them back waiting for an ACK
+            sock = client.socket()
+            if sock is not None:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError as e:
+                    print(f"[MQTT {timestamp}] Could not set TCP_NODELAY: {e}")
+            # (Re)subscribing below: rebuild the dispatch table in case topics changed since __init__
+            self._topic_handlers = self._build_topic_handlers()
+            self._resolve_topic.cache_clear()
+            # Subscribe to every PID/step confirmation topic in a single SUBSCRIBE packet (QoS 0)
+            result = client.subscribe([(topic, 0) for topic in self._topic_handlers])
+            print(f"[MQTT {timestamp}] Subscribed to {len(self._topic_handlers)} status topics, result: {result}")
 
             # Request current parameters from ESP32 (using instance topics)
             print(f"[MQTT {timestamp}] Requesting current parameters from ESP32...")
-            client.publish(self.mqtt_topics['request_params'], "1")
-            client.publish(self.mqtt_topics['step_request_params'], "1")
+            client.publish(self.mqtt_topics['request_params'], MQTT_PAYLOAD_REQUEST, qos=0, retain=False)
+            client.publish(self.mqtt_topics['step_request_params'], MQTT_PAYLOAD_REQUEST, qos=0, retain=False)
         else:
             print(f"[MQTT ERROR] Parameter sync failed with code {rc}")
 
+    def _on_disconnect(self, client, userdata, rc):
+        """Called when the broker connection drops (paho reconnects on its own)"""
+        self.connected = False
+        if rc != 0:
+            print(f"[MQTT {format_clock()}] Parameter sync disconnected unexpectedly (rc={rc}), reconnecting...")
+
     def _on_message(self, client, userdata, msg):
         """Called when a message is received"""
         try:
             topic = msg.topic
             value = float(msg.payload.decode())
-
-            timestamp = time.strftime('%H:%M:%S')
-            print(f"[MQTT {timestamp}] Received message: {topic} = {value}")
+            logger.debug("[MQTT] Received message: %s = %s", topic, value)
 
             # Update confirmed parameters based on topic (using instance topics)
-            if topic == self.mqtt_topics['kp_status']:
-                self.confirmed_params['kp'] = value
-                print(f"[MQTT {timestamp}] Updated Kp to {value}")
-            elif topic == self.mqtt_topics['ki_status']:
-                self.confirmed_params['ki'] = value
-                print(f"[MQTT {timestamp}] Updated Ki to {value}")
-            elif topic == self.mqtt_topics['kd_status']:
-                self.confirmed_params['kd'] = value
-                print(f"[MQTT {timestamp}] Updated Kd to {value}")
-            elif topic == self.mqtt_topics['ref_status']:
-                self.confirmed_params['reference'] = value
-                print(f"[MQTT {timestamp}] Updated Reference to {value}")
-            # Handle step response parameter confirmations (using instance topics)
-            elif topic == self.mqtt_topics['step_amplitude_status']:
-                self.step_confirmed_params['amplitude'] = value
-                print(f"[MQTT {timestamp}] Updated Step Amplitude to {value}")
-            elif topic == self.mqtt_topics['step_time_status']:
-                self.step_confirmed_params['time'] = value
-                print(f"[MQTT {timestamp}] Updated Step Time to {value}")
-            elif topic == self.mqtt_topics['step_direction_status']:
-                self.step_confirmed_params['direction'] = int(value)
-                print(f"[MQTT {timestamp}] Updated Step Direction to {int(value)}")
-            elif topic == self.mqtt_topics['step_vbatt_status']:
-                self.step_confirmed_params['vbatt'] = value
-                print(f"[MQTT {timestamp}] Updated Step VBatt to {value}")
+            handler = self._resolve_topic(topic)
+            if handler:
+                params, key, cast, label = handler
+                params[key] = cast(value)
+                logger.debug("[MQTT] Updated %s to %s", label, params[key])
             else:
-                print(f"[MQTT {timestamp}] Unknown status topic: {topic}")
+                logger.debug("[MQTT] Unknown status topic: %s", topic)
+                return  # Nothing changed, so no dashboard/WebSocket notification
 
-            print(f"[MQTT {timestamp}] Current confirmed params: {self.confirmed_params}")
-            print(f"[MQTT {timestamp}] Current step confirmed params: {self.step_confirmed_params}")
+            self.confirmation_count += 1
 
             # Notify dashboard of parameter update
             if self.on_params_updated:
-                print(f"[MQTT {timestamp}] Calling dashboard callback...")
                 self.on_params_updated(self.confirmed_params.copy())
             else:
-                print(f"[MQTT {timestamp}] No dashboard callback set!")
-            
-            # Push via WebSocket if available
-            if hasattr(self, 'websocket_callback') and self.websocket_callback:
-                try:
-                    self.websocket_callback({'type': 'mqtt_update', 'params': self.confirmed_params})
-                except:
-                    pass
+                logger.debug("[MQTT] No dashboard callback set")
             
             # Push via WebSocket if available
-            if hasattr(self, 'websocket_callback') and self.websocket_callback:
+            if self.websocket_callback:
                 try:
                     self.websocket_callback({'type': 'mqtt_update', 'params': self.confirmed_params})
-                except:
+                except Exception:
                     pass
 
         except Exception as e:
@@ -416,23 +758,54 @@ class MQTTParameterSync:
         return self.confirmed_params.copy()
 
 
+# Interface-name classification rules, checked in order by NetworkManager._classify_interface()
+_IFACE_PREFIX_RULES = (
+    ('Bridge', re.compile(r'^bridge')),               # macOS bridge interfaces
+    ('VPN', re.compile(r'^(?:utun|ipsec)')),          # macOS VPN/tunnel interfaces
+    ('Apple Network', re.compile(r'^(?:awdl|llw)')),  # macOS Apple Wireless Direct Link
+)
+# Hotspots can have names like: ap0, or virtual interfaces ending in -v
+_IFACE_HOTSPOT_RE = re.compile(r'hotspot|^ap.?$|^.{9,}-v$')
+_IFACE_HOTSPOT_IP_PREFIXES = ('10.42.', '10.43.')  # Common Ubuntu hotspot ranges
+_IFACE_NAME_RULES = (
+    ('WiFi', re.compile(r'wifi|wlan|wireless|wlp')),
+    ('Ethernet', re.compile(r'ethernet|eth|enp|eno')),
+    ('Virtual', re.compile(r'vethernet|vmware|virtualbox|docker|veth')),
+    ('VLAN', re.compile(r'vlan')),
+)
+
+
 class NetworkManager:
     """Handles network interface detection and configuration"""
 
     def __init__(self):
         self.interfaces = {}
+        self._interfaces_detected_at = None  # time.monotonic() of the last OS scan
         self.selected_ip = None
         self.mqtt_broker_ip = '127.0.0.1'  # Default to localhost
         self.udp_port = 5555
         self.mqtt_port = 1883
         self.language = 'es'  # Default language
         self.config_file = 'network_config.json'
+        # Setters mark the config dirty; one timer write covers a burst of changes
+        self._config_lock = threading.Lock()
+        self._config_dirty = False
+        self._config_timer = None
+        atexit.register(self.flush_config)
         self.load_config()
         # Detect interfaces at startup to ensure dropdown is populated
         self.detect_interfaces()
 
-    def detect_interfaces(self):
-        """Detect all available network interfaces and their IP addresses"""
+    def detect_interfaces(self, force=False):
+        """Detect all available network interfaces and their IP addresses
+
+        Tab renders and auto-apply call this in bursts, so a scan is reused for
+        NETWORK_IFADDRS_TTL seconds unless force=True (user-driven refresh).
+        """
+        detected_at = self._interfaces_detected_at
+        if not force and detected_at is not None and time.monotonic() - detected_at < NETWORK_IFADDRS_TTL:
+            return self.interfaces
+
         interfaces = {}
 
         try:
@@ -468,6 +841,7 @@ class NetworkManager:
             }
 
         self.interfaces = interfaces
+        self._interfaces_detected_at = time.monotonic()
         return interfaces
 
     def _classify_interface(self, interface_name, ip):
@@ -483,36 +857,19 @@ class NetworkManager:
                 return 'WiFi/Ethernet'  # Could be either, user will know from IP
             else:
                 return 'Ethernet/WiFi'
-        # macOS bridge interfaces
-        elif name_lower.startswith('bridge'):
-            return 'Bridge'
-        # macOS VPN/tunnel interfaces
-        elif name_lower.startswith('utun') or name_lower.startswith('ipsec'):
-            return 'VPN'
-        # macOS Apple Wireless Direct Link
-        elif name_lower.startswith('awdl') or name_lower.startswith('llw'):
-            return 'Apple Network'
+        for interface_type, pattern in _IFACE_PREFIX_RULES:
+            if pattern.search(name_lower):
+                return interface_type
         # Ubuntu/Linux hotspot detection
-        # Hotspots can have names like: wlp3s0, ap0, or virtual interfaces ending in -v
-        elif ('hotspot' in name_lower or
-              (name_lower.startswith('ap') and len(name_lower) <= 3) or
-              (name_lower.endswith('-v') and len(name_lower) > 10) or
-              ip.startswith('10.42.') or  # Common Ubuntu hotspot range
-              ip.startswith('10.43.')):   # Alternative hotspot range
+        if _IFACE_HOTSPOT_RE.search(name_lower) or ip.startswith(_IFACE_HOTSPOT_IP_PREFIXES):
             return 'Hotspot'
-        # Linux WiFi interfaces
-        elif 'wifi' in name_lower or 'wlan' in name_lower or 'wireless' in name_lower or 'wlp' in name_lower:
-            return 'WiFi'
-        # Linux Ethernet interfaces
-        elif 'ethernet' in name_lower or 'eth' in name_lower or 'enp' in name_lower or 'eno' in name_lower:
-            return 'Ethernet'
-        # Virtual machines and containers
-        elif 'vethernet' in name_lower or 'vmware' in name_lower or 'virtualbox' in name_lower or 'docker' in name_lower or 'veth' in name_lower:
-            return 'Virtual'
-        elif 'vlan' in name_lower:
-            return 'VLAN'
+        # Linux WiFi / Ethernet interfaces, virtual machines and containers, VLANs
+        for interface_type, pattern in _IFACE_NAME_RULES:
+            if pattern.search(name_lower):
+                return interface_type
+
         # IP-based classification
-        elif ip.startswith('192.168.137'):
+        if ip.startswith('192.168.137'):
             return 'Shared Network'
         elif ip.startswith('192.168.1'):
             return 'Home Network'
@@ -558,24 +915,41 @@ class NetworkManager:
         """Load network configuration from file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.selected_ip = config.get('selected_ip')
-                    self.mqtt_broker_ip = config.get('mqtt_broker_ip', '127.0.0.1')
-                    
-                    # Fix: MQTT broker should be on same IP as selected interface, not localhost
-                    if self.selected_ip and (not self.mqtt_broker_ip or self.mqtt_broker_ip == '127.0.0.1'):
-                        self.mqtt_broker_ip = self.selected_ip
-                        print(f"[CONFIG FIX] Updated MQTT broker from localhost to {self.mqtt_broker_ip}")
-                    
-                    self.udp_port = config.get('udp_port', 5555)
-                    self.mqtt_port = config.get('mqtt_port', 1883)
-                    self.language = config.get('language', 'es')
-                    print(f"Loaded network config: IP={self.selected_ip}, MQTT={self.mqtt_broker_ip}, Language={self.language}")
+                config = read_json(self.config_file)
+                self.selected_ip = config.get('selected_ip')
+                self.mqtt_broker_ip = config.get('mqtt_broker_ip', '127.0.0.1')
+                
+                # Fix: MQTT broker should be on same IP as selected interface, not localhost
+                if self.selected_ip and (not self.mqtt_broker_ip or self.mqtt_broker_ip == '127.0.0.1'):
+                    self.mqtt_broker_ip = self.selected_ip
+                    print(f"[CONFIG FIX] Updated MQTT broker from localhost to {self.mqtt_broker_ip}")
+                
+                self.udp_port = config.get('udp_port', 5555)
+                self.mqtt_port = config.get('mqtt_port', 1883)
+                self.language = config.get('language', 'es')
+                print(f"Loaded network config: IP={self.selected_ip}, MQTT={self.mqtt_broker_ip}, Language={self.language}")
         except Exception as e:
             print(f"Error loading network config: {e}")
 
     def save_config(self):
+        """Schedule a coalesced write of the network configuration"""
+        with self._config_lock:
+            self._config_dirty = True
+            if self._config_timer is None:
+                self._config_timer = threading.Timer(CONFIG_SAVE_DELAY, self.flush_config)
+                self._config_timer.daemon = True
+                self._config_timer.start()
+
+    def flush_config(self):
+        """Write the network configuration to file if it changed"""
+        with self._config_lock:
+            self._config_timer = None
+            if not self._config_dirty:
+                return
+            self._config_dirty = False
+            self._write_config()
+
+    def _write_config(self):
         """Save network configuration to file"""
         try:
             config = {
@@ -583,10 +957,9 @@ class NetworkManager:
                 'mqtt_broker_ip': self.mqtt_broker_ip,
                 'udp_port': self.udp_port,
                 'mqtt_port': self.mqtt_port,
-            'language': self.language
+                'language': self.language
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            write_json_atomic(self.config_file, config)
             print(f"Saved network config: IP={self.selected_ip}, UDP:{self.udp_port}, MQTT:{self.mqtt_port}, Language={self.language}")
         except Exception as e:
             print(f"Error saving network config: {e}")
@@ -627,25 +1000,95 @@ class NetworkManager:
 
         return None, False
 
+class TelemetryRing:
+    """Fixed-size ring of numeric samples stored column-wise (one numpy array per field)
+
+    Single producer (the UDP receiver thread) writes the slot and then advances
+    `head`, so readers only need to read `head` once to get a consistent window.
+    """
+
+    # Touched once per packet; slots make these attribute reads/writes cheaper than a __dict__
+    __slots__ = ('fields', 'capacity', 'columns', '_column_list', 'head', 'generation')
+
+    def __init__(self, fields, capacity=TELEMETRY_RING_SIZE):
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self.columns = {name: np.empty(capacity, dtype=np.float64) for name in self.fields}
+        self._column_list = [self.columns[name] for name in self.fields]
+        self.head = 0  # Total samples ever written
+        self.generation = 0  # Bumped by clear(): tells a refilled ring apart from the previous session
+
+    def __len__(self):
+        return min(self.head, self.capacity)
+
+    def append(self, values):
+        """Write one sample; missing trailing values are stored as NaN"""
+        slot = self.head % self.capacity
+        for column, value in zip(self._column_list, values):
+            column[slot] = value
+        for column in self._column_list[len(values):]:
+            column[slot] = np.nan
+        self.head += 1
+
+    def snapshot(self, fields=None):
+        """Return the buffered samples as chronologically ordered column copies
+
+        Pass `fields` to copy only the columns a caller plots instead of every field.
+        """
+        columns = self.columns if fields is None else {name: self.columns[name] for name in fields}
+        head = self.head
+        count = min(head, self.capacity)
+        start = (head - count) % self.capacity
+        if start + count <= self.capacity:
+            return {name: col[start:start + count].copy() for name, col in columns.items()}
+        return {name: np.concatenate((col[start:], col[:head % self.capacity]))
+                for name, col in columns.items()}
+
+    def clear(self):
+        """Forget all samples (new experiment session)"""
+        self.head = 0
+        self.generation += 1
+
+
 class DataManager:
     """Manages thread-safe data sharing between UDP receiver and dashboard"""
 
+    # Numeric columns kept in the in-memory telemetry ring (matches the CSV header)
+    TELEMETRY_FIELDS = ('time_event', 'input', 'referencia', 'error', 'kp', 'ki', 'kd', 'output_PID')
+    # latest_data keys for TELEMETRY_FIELDS[1:] (time_event is kept as the raw 'timestamp' string)
+    LATEST_DATA_KEYS = ('distance', 'referencia', 'error', 'kp', 'ki', 'kd', 'output_pid')
+    WEBSOCKET_UPDATE_TYPE = 'data_update'
+    WEBSOCKET_BATCH_TYPE = 'data_batch'
+    VECTOR_PARSE = True  # PID rows are plain numeric columns, so bursts can be parsed by numpy in one call
+
     def __init__(self, train_id: str = ""):
         self.train_id = train_id  # Train identifier for multi-train support
-        self.data_queue = queue.Queue(maxsize=1000)
+        self.data_queue = collections.deque(maxlen=MAX_DATA_QUEUE_SIZE)  # Recent samples; oldest fall off
         self.latest_data = {}
         self.experiment_active = False
         self._csv_file = None  # Private variable
+        self._csv_handle = None  # Kept open for the whole session, see _open_csv()
+        self._rows_since_flush = 0
+        self._last_csv_flush = time.monotonic()
         self.data_lock = threading.Lock()
         self.initialized = False
 
         # Data reception statistics
         self.total_packets = 0
-        self.last_packet_time = None
+        self.last_packet_time = None  # time.monotonic() of the last datagram; wall clock derived on read
         self.connection_status = "Waiting for data"
 
         # WebSocket callback for push notifications
         self.websocket_callback = None
+        self._ws_pending = 0  # samples since the last push (only counted: graphs read the telemetry ring)
+        self._ws_timer = None
+        self._ws_lock = threading.Lock()
+
+        # Recent samples for plotting without re-reading the CSV
+        self.telemetry = TelemetryRing(self.TELEMETRY_FIELDS)
+
+        # Make sure buffered rows reach disk on interpreter shutdown
+        atexit.register(self.close_csv)
 
     @property
     def csv_file(self):
@@ -655,6 +1098,11 @@ class DataManager:
     def csv_file(self, value):
         self._csv_file = value
 
+    @property
+    def active_csv_path(self):
+        """The session CSV this manager is writing to, or None while no file is open"""
+        return self._csv_file if self._csv_handle else None
+
     def set_csv_file(self, filename):
         """Set the CSV file for data storage"""
         # Prepend train ID to filename if specified
@@ -666,95 +1114,179 @@ class DataManager:
 
         self.csv_file = filename
         self.initialized = True
+        self.telemetry.clear()
         # Create CSV with headers
         try:
-            with open(filename, 'w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(['time_event', 'input', 'referencia', 'error', 'kp', 'ki', 'kd', 'output_PID'])
+            self._open_csv(filename, ['time_event', 'input', 'referencia', 'error', 'kp', 'ki', 'kd', 'output_PID'])
         except Exception as e:
             print(f"Error creating CSV file: {e}")
             self.initialized = False
 
-    def add_data(self, data_string):
-        """Add new data from UDP receiver"""
-        try:
-            with self.data_lock:
-                # Update statistics
-                self.total_packets += 1
-                self.last_packet_time = datetime.now()
-                self.connection_status = "Connected"
-
-                # Parse data - ESP32 sends: time_event,input,referencia,error,kp,ki,kd,output_PID
-                data_parts = data_string.strip().split(',')
-                if len(data_parts) >= 2:
-                    timestamp = data_parts[0]
-                    distance = float(data_parts[1]) if len(data_parts) > 1 else 0
-
-                    # Parse additional fields if available
-                    referencia = float(data_parts[2]) if len(data_parts) > 2 else None
-                    error = float(data_parts[3]) if len(data_parts) > 3 else None
-                    kp = float(data_parts[4]) if len(data_parts) > 4 else None
-                    ki = float(data_parts[5]) if len(data_parts) > 5 else None
-                    kd = float(data_parts[6]) if len(data_parts) > 6 else None
-                    output_pid = float(data_parts[7]) if len(data_parts) > 7 else None
-
-                    self.latest_data = {
-                        'timestamp': timestamp,
-                        'distance': distance,
-                        'referencia': referencia,
-                        'error': error,
-                        'kp': kp,
-                        'ki': ki,
-                        'kd': kd,
-                        'output_pid': output_pid,
-                        'full_data': data_string,
-                        'packet_count': self.total_packets
-                    }
+    def _open_csv(self, filename, header):
+        """Create the session CSV with its header and keep the handle open for appends"""
+        # Binary mode: rows go straight into the buffer without a text-encoding layer
+        handle = open(filename, 'wb', buffering=CSV_WRITE_BUFFER_SIZE)
+        handle.write((','.join(header) + '\n').encode('utf-8'))
+        handle.flush()
+        with self.data_lock:
+            previous, self._csv_handle = self._csv_handle, handle
+            self._rows_since_flush = 0
+            self._last_csv_flush = time.monotonic()
+        if previous:
+            previous.close()
+
+    def _write_csv_line(self, line):
+        """Append one raw data line (bytes) to the open CSV (caller holds data_lock)"""
+        self._csv_handle.write(line)
+        self._csv_handle.write(b'\n')
+        self._rows_since_flush += 1
+        # Size threshold bounds memory during bursts; time threshold keeps slow streams visible on disk
+        now = time.monotonic()
+        if self._rows_since_flush >= CSV_FLUSH_ROWS or now - self._last_csv_flush >= CSV_FLUSH_INTERVAL:
+            self._csv_handle.flush()
+            self._rows_since_flush = 0
+            self._last_csv_flush = now
+
+    def flush_csv(self):
+        """Push buffered CSV rows to disk (before downloads or at experiment end)"""
+        with self.data_lock:
+            if self._csv_handle:
+                self._csv_handle.flush()
+                self._rows_since_flush = 0
+                self._last_csv_flush = time.monotonic()
 
-                    # Add to queue for dashboard with overflow detection
-                    if not self.data_queue.full():
-                        self.data_queue.put(self.latest_data)
-                    else:
-                        # Queue is full - data will be dropped
-                        if self.total_packets % 100 == 0:  # Log occasionally
-                            print(f"[WARNING] Data queue full - dropping packet {self.total_packets}")
-                    
-                    # Push update via WebSocket
-                    if self.websocket_callback:
-                        try:
-                            self.websocket_callback({'type': 'data_update', 'data': self.latest_data})
-                        except:
-                            pass  # Don't let WebSocket errors break data collection
-
-                    # Write to CSV (always write if file is set, for real-time monitoring)
-                    if self.csv_file:
-                        try:
-                            with open(self.csv_file, 'a', newline='') as file:
-                                file.write(data_string + '\n')
-                                file.flush()  # Ensure data is written to disk immediately
-                        except Exception as write_error:
-                            print(f"CSV write error: {write_error}")
-
-                    # Packet info is now displayed in the dashboard only
+    def close_csv(self):
+        """Flush and close the session CSV handle"""
+        with self.data_lock:
+            handle, self._csv_handle = self._csv_handle, None
+        if handle:
+            handle.close()
+
+    def add_data(self, data_string, received_at=None):
+        """Add new data from UDP receiver (raw datagram bytes, or a str line)"""
+        if isinstance(data_string, str):
+            data_string = data_string.encode('utf-8')
+        with self.data_lock:
+            sample = self._ingest(data_string, received_at or time.monotonic())
+        if sample is not None:
+            self._push_websocket({'type': self.WEBSOCKET_UPDATE_TYPE, 'count': 1})
 
-                else:
-                    if self.total_packets % 100 == 1:  # Only show errors occasionally
-                        print(f"Data format error - expected at least 2 fields, got {len(data_parts)}")
+    def add_batch(self, lines, received_at=None):
+        """Add a burst of raw datagrams (bytes) under one lock acquisition; WebSocket pushes are coalesced"""
+        received_at = received_at or time.monotonic()
+        with self.data_lock:
+            samples = self._ingest_batch(lines, received_at)
+        self._queue_websocket_samples([sample for sample in samples if sample is not None])
+
+    def _queue_websocket_samples(self, samples):
+        """Coalesce new samples so the dashboard gets at most one notification per WEBSOCKET_PUSH_INTERVAL"""
+        if not samples or not self.websocket_callback:
+            return
+        with self._ws_lock:
+            self._ws_pending += len(samples)
+            if self._ws_timer is None:
+                self._ws_timer = threading.Timer(WEBSOCKET_PUSH_INTERVAL, self._flush_websocket_samples)
+                self._ws_timer.daemon = True
+                self._ws_timer.start()
+
+    def _flush_websocket_samples(self):
+        """Push one batch notification for the coalesced samples"""
+        with self._ws_lock:
+            self._ws_timer = None
+            count, self._ws_pending = self._ws_pending, 0
+        if count:
+            self._push_websocket({'type': self.WEBSOCKET_BATCH_TYPE, 'count': count})
+
+    def _push_websocket(self, message):
+        """Hand a message to the dashboard WebSocket queue, if one is attached"""
+        if self.websocket_callback:
+            try:
+                self.websocket_callback(message)
+            except Exception:
+                pass  # Don't let WebSocket errors break data collection
+
+    def _ingest_batch(self, lines, received_at):
+        """Ingest a burst (caller holds data_lock); returns the parsed samples"""
+        if self.VECTOR_PARSE:
+            try:
+                # One C-level pass over the whole burst; ragged or non-numeric rows raise ValueError
+                matrix = np.loadtxt(lines, delimiter=',', comments=None, dtype=np.float64, ndmin=2)
+            except ValueError:
+                matrix = None
+            if matrix is not None and matrix.shape[0] == len(lines) and matrix.shape[1] >= 2:
+                samples = []
+                for line, values in zip(lines, matrix[:, :len(self.TELEMETRY_FIELDS)].tolist()):
+                    self._count_packet(received_at)
+                    try:
+                        samples.append(self._record_sample(line, line.strip().partition(b',')[0], values))
+                    except Exception as e:
+                        logger.warning("Data processing error: %s", e)
+                return samples
+        # Irregular burst (or a manager with per-line rules): parse line by line
+        return [self._ingest(line, received_at) for line in lines]
+
+    def _count_packet(self, received_at):
+        """Update reception statistics for one datagram (caller holds data_lock)"""
+        self.total_packets += 1
+        self.last_packet_time = received_at
+        self.connection_status = "Connected"
+
+    def _ingest(self, data_string, received_at):
+        """Parse and record one PID line (caller holds data_lock); returns the sample or None"""
+        try:
+            self._count_packet(received_at)
+
+            # Parse data - ESP32 sends: time_event,input,referencia,error,kp,ki,kd,output_PID
+            data_parts = data_string.strip().split(b',')
+            if len(data_parts) >= 2:
+                # One C-level float pass over the known columns (float() accepts bytes); missing trailing fields stay None
+                values = list(map(float, data_parts[:len(self.TELEMETRY_FIELDS)]))
+                return self._record_sample(data_string, data_parts[0], values)
+            else:
+                if self.total_packets % 100 == 1:  # Only show errors occasionally
+                    print(f"Data format error - expected at least 2 fields, got {len(data_parts)}")
 
         except Exception as e:
-            print(f"Data processing error: {e}")
+            logger.warning("Data processing error: %s", e)
+        return None
+
+    def _record_sample(self, data_string, timestamp, values):
+        """Store one parsed PID sample in latest_data, the ring, the queue and the CSV"""
+        # Build the sample fully, then publish it with one reference swap (never mutated afterwards)
+        sample = dict.fromkeys(self.LATEST_DATA_KEYS)
+        sample.update(zip(self.LATEST_DATA_KEYS, values[1:]))
+        sample['timestamp'] = timestamp.decode('ascii', 'replace')
+        sample['full_data'] = data_string.decode('utf-8', 'replace')
+        sample['packet_count'] = self.total_packets
+        self.latest_data = sample
+
+        self.telemetry.append(values)
+
+        # Keep the most recent samples for the dashboard
+        self.data_queue.append(self.latest_data)
+
+        # Write to CSV only while an experiment is recording; idle monitoring just feeds the graphs
+        if self.experiment_active and self._csv_handle:
+            try:
+                self._write_csv_line(data_string)
+            except Exception as write_error:
+                logger.warning("CSV write error: %s", write_error)
+
+        # Packet info is now displayed in the dashboard only
+        return self.latest_data
 
     def get_latest_data(self):
         """Get the latest data for dashboard"""
-        with self.data_lock:
-            return self.latest_data.copy() if self.latest_data else {}
+        # latest_data is replaced wholesale, never mutated in place, so a plain read is consistent
+        latest = self.latest_data
+        return latest.copy() if latest else {}
 
     def get_connection_stats(self):
         """Get connection statistics for dashboard"""
         with self.data_lock:
             # Check if connection is stale (no data for 5 seconds)
-            if self.last_packet_time:
-                time_since_last = (datetime.now() - self.last_packet_time).total_seconds()
+            if self.last_packet_time is not None:
+                time_since_last = time.monotonic() - self.last_packet_time
                 if time_since_last > 5:
                     status = self.dashboard.t('connection_lost') if hasattr(self, 'dashboard') else "Connection lost"
                 else:
@@ -765,7 +1297,7 @@ class DataManager:
             return {
                 'status': status,
                 'total_packets': self.total_packets,
-                'last_packet_time': self.last_packet_time.strftime("%H:%M:%S") if self.last_packet_time else "Never",
+                'last_packet_time': format_clock(time.time() - time_since_last) if self.last_packet_time is not None else "Never",
                 'experiment_active': self.experiment_active
             }
 
@@ -776,11 +1308,18 @@ class DataManager:
     def stop_experiment(self):
         """Stop data collection experiment"""
         self.experiment_active = False
+        self.flush_csv()
 
 
 class StepResponseDataManager(DataManager):
     """Manages step response experiment data with different CSV format"""
 
+    TELEMETRY_FIELDS = ('time2sinc', 'time_event', 'motor_dir', 'v_batt',
+                        'output_G', 'step_input', 'PWM_input', 'applied_step')
+    WEBSOCKET_UPDATE_TYPE = 'step_data_update'
+    WEBSOCKET_BATCH_TYPE = 'step_data_batch'
+    VECTOR_PARSE = False  # Repeated header lines and 7/8-column firmware need per-line rules
+
     def __init__(self, train_id: str = ""):
         super().__init__(train_id)
         self.step_active = False
@@ -801,97 +1340,88 @@ class StepResponseDataManager(DataManager):
         """Create CSV with step response headers"""
         self.csv_file = filename
         self.initialized = True
+        self.telemetry.clear()
         try:
-            with open(filename, 'w', newline='') as file:
-                writer = csv.writer(file)
-                # NEW: Added 'applied_step' column to show when step is actually applied (0 for baseline samples)
-                writer.writerow(['time2sinc', 'time_event', 'motor_dir', 'v_batt',
-                               'output_G', 'step_input', 'PWM_input', 'applied_step'])
+            # NEW: Added 'applied_step' column to show when step is actually applied (0 for baseline samples)
+            self._open_csv(filename, ['time2sinc', 'time_event', 'motor_dir', 'v_batt',
+                                      'output_G', 'step_input', 'PWM_input', 'applied_step'])
             print(f"Created step response CSV: {filename}")
         except Exception as e:
             print(f"Error creating step response CSV: {e}")
             self.initialized = False
     
-    def add_data(self, data_string):
+    def _ingest(self, data_string, received_at):
         """Parse step response data format: time2sinc,time_event,motor_dir,v_batt,output_G,step_input,PWM_input,applied_step"""
         try:
-            with self.data_lock:
-                # Update statistics
-                self.total_packets += 1
-                self.last_packet_time = datetime.now()
-                self.connection_status = "Connected"
-
-                # Skip header lines that ESP32 sends repeatedly
-                if data_string.strip().startswith('time2sinc'):
-                    return
-
-                # Parse step response data
-                data_parts = data_string.strip().split(',')
-                if len(data_parts) >= 8:
-                    # NEW: Parse 8 fields including applied_step
-                    self.latest_data = {
-                        'time2sinc': float(data_parts[0]),
-                        'time_event': float(data_parts[1]),
-                        'motor_dir': int(float(data_parts[2])),
-                        'v_batt': float(data_parts[3]),
-                        'output_G': float(data_parts[4]),
-                        'step_input': float(data_parts[5]),
-                        'PWM_input': float(data_parts[6]),
-                        'applied_step': float(data_parts[7]),  # NEW: 0 for baseline, then StepAmplitude
-                        'full_data': data_string,
-                        'packet_count': self.total_packets
-                    }
-                elif len(data_parts) >= 7:
-                    # Backward compatibility for old firmware without applied_step field
-                    self.latest_data = {
-                        'time2sinc': float(data_parts[0]),
-                        'time_event': float(data_parts[1]),
-                        'motor_dir': int(float(data_parts[2])),
-                        'v_batt': float(data_parts[3]),
-                        'output_G': float(data_parts[4]),
-                        'step_input': float(data_parts[5]),
-                        'PWM_input': float(data_parts[6]),
-                        'applied_step': float(data_parts[5]),  # Fallback: use step_input
-                        'full_data': data_string,
-                        'packet_count': self.total_packets
-                    }
-                else:
-                    # Invalid data - less than 7 fields
-                    if self.total_packets % 100 == 1:
-                        print(f"Step data format error - expected 8 fields (or 7 for old firmware), got {len(data_parts)}")
-                    return
-
-                # Add to queue for dashboard with overflow detection
-                if not self.data_queue.full():
-                    self.data_queue.put(self.latest_data)
-                else:
-                    # Queue is full - data will be dropped
-                    if self.total_packets % 100 == 0:  # Log occasionally
-                        print(f"[WARNING] Step data queue full - dropping packet {self.total_packets}")
+            # Update statistics
+            self._count_packet(received_at)
 
-                # Push update via WebSocket
-                if self.websocket_callback:
-                    try:
-                        self.websocket_callback({'type': 'step_data_update', 'data': self.latest_data})
-                    except:
-                        pass
+            # Skip header lines that ESP32 sends repeatedly
+            if data_string.strip().startswith(b'time2sinc'):
+                return None
 
-                # Write to CSV
-                if self.csv_file:
-                    try:
-                        with open(self.csv_file, 'a', newline='') as file:
-                            file.write(data_string + '\n')
-                            file.flush()  # Ensure data is written to disk immediately
-                    except Exception as write_error:
-                        print(f"Step CSV write error: {write_error}")
+            # Parse step response data
+            data_parts = data_string.strip().split(b',')
+            if len(data_parts) >= 8:
+                # NEW: Parse 8 fields including applied_step
+                self.latest_data = {
+                    'time2sinc': float(data_parts[0]),
+                    'time_event': float(data_parts[1]),
+                    'motor_dir': int(float(data_parts[2])),
+                    'v_batt': float(data_parts[3]),
+                    'output_G': float(data_parts[4]),
+                    'step_input': float(data_parts[5]),
+                    'PWM_input': float(data_parts[6]),
+                    'applied_step': float(data_parts[7]),  # NEW: 0 for baseline, then StepAmplitude
+                    'full_data': data_string.decode('utf-8', 'replace'),
+                    'packet_count': self.total_packets
+                }
+            elif len(data_parts) >= 7:
+                # Backward compatibility for old firmware without applied_step field
+                self.latest_data = {
+                    'time2sinc': float(data_parts[0]),
+                    'time_event': float(data_parts[1]),
+                    'motor_dir': int(float(data_parts[2])),
+                    'v_batt': float(data_parts[3]),
+                    'output_G': float(data_parts[4]),
+                    'step_input': float(data_parts[5]),
+                    'PWM_input': float(data_parts[6]),
+                    'applied_step': float(data_parts[5]),  # Fallback: use step_input
+                    'full_data': data_string.decode('utf-8', 'replace'),
+                    'packet_count': self.total_packets
+                }
+            else:
+                # Invalid data - less than 7 fields
+                if self.total_packets % 100 == 1:
+                    print(f"Step data format error - expected 8 fields (or 7 for old firmware), got {len(data_parts)}")
+                return None
+
+            self.telemetry.append([self.latest_data[name] for name in self.TELEMETRY_FIELDS])
+
+            # Keep the most recent samples for the dashboard
+            self.data_queue.append(self.latest_data)
+
+            # Write to CSV (only while the experiment is recording)
+            if self.experiment_active and self._csv_handle:
+                try:
+                    self._write_csv_line(data_string)
+                except Exception as write_error:
+                    logger.warning("Step CSV write error: %s", write_error)
+            return self.latest_data
         
         except Exception as e:
-            print(f"Step data processing error: {e}")
+            logger.warning("Step data processing error: %s", e)
+        return None
 
 
 class DeadbandDataManager(DataManager):
     """Manages deadband calibration data"""
 
+    TELEMETRY_FIELDS = ('time_ms', 'pwm', 'distance_cm', 'initial_distance_cm', 'motion_detected')
+    WEBSOCKET_UPDATE_TYPE = 'deadband_data_update'
+    WEBSOCKET_BATCH_TYPE = 'deadband_data_batch'
+    VECTOR_PARSE = False  # Each row also updates the motion/deadband detection state
+
     def __init__(self, train_id: str = ""):
         super().__init__(train_id)
         self.deadband_active = False
@@ -903,6 +1433,7 @@ class DeadbandDataManager(DataManager):
             'initial_distance': [],
             'motion_detected': []
         }
+        self.motion_index = None  # History index of first motion_detected == 1
 
     def create_deadband_csv(self):
         """Create a new deadband calibration CSV file with timestamp"""
@@ -920,83 +1451,69 @@ class DeadbandDataManager(DataManager):
         """Create CSV with deadband calibration headers"""
         self.csv_file = filename
         self.initialized = True
+        self.telemetry.clear()
         try:
-            with open(filename, 'w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(['time_ms', 'pwm', 'distance_cm',
-                               'initial_distance_cm', 'motion_detected'])
+            self._open_csv(filename, ['time_ms', 'pwm', 'distance_cm',
+                                      'initial_distance_cm', 'motion_detected'])
             print(f"Created deadband CSV: {filename}")
         except Exception as e:
             print(f"Error creating deadband CSV: {e}")
             self.initialized = False
 
-    def add_data(self, data_string):
+    def _ingest(self, data_string, received_at):
         """Parse deadband data format: time,pwm,distance,initial_distance,motion_detected"""
         try:
-            with self.data_lock:
-                # Update statistics
-                self.total_packets += 1
-                self.last_packet_time = datetime.now()
-                self.connection_status = "Connected"
-
-                # Parse deadband calibration data
-                data_parts = data_string.strip().split(',')
-                if len(data_parts) >= 5:
-                    self.latest_data = {
-                        'time': float(data_parts[0]),
-                        'pwm': int(float(data_parts[1])),
-                        'distance': float(data_parts[2]),
-                        'initial_distance': float(data_parts[3]),
-                        'motion_detected': int(float(data_parts[4])),
-                        'full_data': data_string,
-                        'packet_count': self.total_packets
-                    }
-
-                    # Store in history for graphing
-                    self.deadband_history['time'].append(self.latest_data['time'])
-                    self.deadband_history['pwm'].append(self.latest_data['pwm'])
-                    self.deadband_history['distance'].append(self.latest_data['distance'])
-                    self.deadband_history['initial_distance'].append(self.latest_data['initial_distance'])
-                    self.deadband_history['motion_detected'].append(self.latest_data['motion_detected'])
-
-                    # Debug: Print motion_detected value periodically
-                    if self.total_packets % 20 == 0:  # Print every 20 packets
-                        print(f"[DEADBAND DEBUG] PWM={self.latest_data['pwm']}, motion_detected={self.latest_data['motion_detected']}, calibrated={self.calibrated_deadband}")
-
-                    # Detect when motion is first detected (motion_detected = 1)
-                    if self.latest_data['motion_detected'] == 1 and self.calibrated_deadband == 0:
-                        self.calibrated_deadband = self.latest_data['pwm']
-                        print(f"[DEADBAND] ✓ Motion detected! Calibrated deadband = {self.calibrated_deadband} PWM")
-
-                    # Add to queue for dashboard with overflow detection
-                    if not self.data_queue.full():
-                        self.data_queue.put(self.latest_data)
-                    else:
-                        # Queue is full - data will be dropped
-                        if self.total_packets % 100 == 0:  # Log occasionally
-                            print(f"[WARNING] Deadband data queue full - dropping packet {self.total_packets}")
-
-                    # Push update via WebSocket
-                    if self.websocket_callback:
-                        try:
-                            self.websocket_callback({'type': 'deadband_data_update', 'data': self.latest_data})
-                        except:
-                            pass
-
-                    # Write to CSV
-                    if self.csv_file:
-                        try:
-                            with open(self.csv_file, 'a', newline='') as file:
-                                file.write(data_string + '\n')
-                                file.flush()  # Ensure data is written to disk immediately
-                        except Exception as write_error:
-                            print(f"Deadband CSV write error: {write_error}")
-                else:
-                    if self.total_packets % 100 == 1:
-                        print(f"Deadband data format error - expected 5 fields, got {len(data_parts)}")
+            # Update statistics
+            self._count_packet(received_at)
+
+            # Parse deadband calibration data
+            data_parts = data_string.strip().split(b',')
+            if len(data_parts) >= 5:
+                self.latest_data = {
+                    'time': float(data_parts[0]),
+                    'pwm': int(float(data_parts[1])),
+                    'distance': float(data_parts[2]),
+                    'initial_distance': float(data_parts[3]),
+                    'motion_detected': int(float(data_parts[4])),
+                    'full_data': data_string.decode('utf-8', 'replace'),
+                    'packet_count': self.total_packets
+                }
+
+                # Store in history for graphing
+                self.deadband_history['time'].append(self.latest_data['time'])
+                self.deadband_history['pwm'].append(self.latest_data['pwm'])
+                self.deadband_history['distance'].append(self.latest_data['distance'])
+                self.deadband_history['initial_distance'].append(self.latest_data['initial_distance'])
+                self.deadband_history['motion_detected'].append(self.latest_data['motion_detected'])
+                if self.motion_index is None and self.latest_data['motion_detected'] == 1:
+                    self.motion_index = len(self.deadband_history['motion_detected']) - 1
+
+                # Debug: Print motion_detected value periodically
+                if self.total_packets % 20 == 0:  # Print every 20 packets
+                    print(f"[DEADBAND DEBUG] PWM={self.latest_data['pwm']}, motion_detected={self.latest_data['motion_detected']}, calibrated={self.calibrated_deadband}")
+
+                # Detect when motion is first detected (motion_detected = 1)
+                if self.latest_data['motion_detected'] == 1 and self.calibrated_deadband == 0:
+                    self.calibrated_deadband = self.latest_data['pwm']
+                    print(f"[DEADBAND] ✓ Motion detected! Calibrated deadband = {self.calibrated_deadband} PWM")
+
+                # Keep the most recent samples for the dashboard
+                self.data_queue.append(self.latest_data)
+
+                # Write to CSV (only while calibration is recording)
+                if self.experiment_active and self._csv_handle:
+                    try:
+                        self._write_csv_line(data_string)
+                    except Exception as write_error:
+                        logger.warning("Deadband CSV write error: %s", write_error)
+                return self.latest_data
+            else:
+                if self.total_packets % 100 == 1:
+                    print(f"Deadband data format error - expected 5 fields, got {len(data_parts)}")
 
         except Exception as e:
-            print(f"Deadband data processing error: {e}")
+            logger.warning("Deadband data processing error: %s", e)
+        return None
 
     def clear_history(self):
         """Clear history data for new calibration run"""
@@ -1007,6 +1524,7 @@ class DeadbandDataManager(DataManager):
             'initial_distance': [],
             'motion_detected': []
         }
+        self.motion_index = None
         self.calibrated_deadband = 0  # Reset calibrated value
         print("Deadband history cleared for new calibration")
 
@@ -1020,13 +1538,22 @@ class UDPReceiver:
         self.ip = ip
         self.port = port
         self.socket = None
+        self.selector = None
+        # Receive buffers reused for every batch instead of allocating bytes per datagram
+        self._recv_views = [memoryview(bytearray(UDP_BUFFER_SIZE)) for _ in range(UDP_RECV_BATCH)]
+        # Receive thread only decodes and enqueues; parsing, CSV and WebSocket run on the processing thread
+        self._pending = queue.Queue(maxsize=UDP_PENDING_BATCHES)
+        self._dropped_batches = 0  # dropped since the last warning, see _enqueue()
+        self._last_drop_report = 0.0
         self.running = False
         self.thread = None
+        self.process_thread = None
         print(f"UDPReceiver initialized: IP={ip}, Port={port}")
 
     def set_data_manager(self, data_manager):
         """Switch to a different data manager (e.g., for step response mode)"""
         with self.data_manager_lock:
+            self.data_manager.flush_csv()  # Outgoing manager receives no more rows
             self.data_manager = data_manager
             print(f"UDP receiver now using {data_manager.__class__.__name__}")
 
@@ -1047,12 +1574,16 @@ class UDPReceiver:
                 print(f"Created new CSV file: {os.path.basename(csv_path)}")
                 self.data_manager.set_csv_file(csv_path)
 
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.bind((self.ip, self.port))
-            self.socket.settimeout(1.0)  # 1 second timeout for graceful shutdown
+            self.socket = self._create_socket()
+            self.selector = selectors.DefaultSelector()  # epoll on Linux
+            self.selector.register(self.socket, selectors.EVENT_READ)
             self.running = True
 
-            self.thread = threading.Thread(target=self._receive_loop, daemon=True)
+            self.process_thread = threading.Thread(target=self._process_loop, daemon=True,
+                                                   name=f"udp-process-{self.port}")
+            self.process_thread.start()
+            self.thread = threading.Thread(target=self._receive_loop, daemon=True,
+                                           name=f"udp-receiver-{self.port}")
             self.thread.start()
 
             print(f"UDP receiver started on {self.ip}:{self.port}")
@@ -1068,6 +1599,36 @@ class UDPReceiver:
             self.socket.close()
         if self.thread:
             self.thread.join(timeout=2)
+        if self.process_thread:
+            self.process_thread.join(timeout=2)
+
+    def _create_socket(self):
+        """Create the non-blocking UDP socket with an enlarged receive buffer"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            # Absorb ESP32 bursts in the kernel instead of dropping them while the receiver is busy
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_SIZE)
+            granted = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            print(f"UDP receive buffer: {granted // 1024} KB")
+        except OSError as e:
+            print(f"Could not enlarge UDP receive buffer: {e}")
+        sock.bind((self.ip, self.port))
+        sock.setblocking(False)  # Receive loop waits on the selector with UDP_TIMEOUT for graceful shutdown
+        return sock
+
+    def _drain_pending(self):
+        """Collect datagrams already queued in the kernel, up to one batch
+
+        Returns views into the pooled buffers; they are only valid until the next drain.
+        """
+        batch = []
+        for view in self._recv_views:
+            try:
+                nbytes = self.socket.recv_into(view)
+            except (BlockingIOError, InterruptedError):
+                break
+            batch.append(view[:nbytes])
+        return batch
 
     def _receive_loop(self):
         """Main UDP receiving loop"""
@@ -1076,21 +1637,25 @@ class UDPReceiver:
 
         while self.running:
             try:
-                data, addr = self.socket.recvfrom(1024)
-                data_string = data.decode('utf-8')
-                # Data processing now handled in DataManager with reduced console output
-                # Thread-safe access to data manager
-                with self.data_manager_lock:
-                    self.data_manager.add_data(data_string)
+                # Wait for readability, then drain the whole burst in one pass
+                if not self.selector.select(UDP_TIMEOUT):
+                    timeout_count += 1
+                    # Report status every 30 timeouts (30 seconds)
+                    if timeout_count % 30 == 0:
+                        logger.debug("UDP receiver still listening on %s:%s (no data for %ss)",
+                                     self.ip, self.port, timeout_count)
+                    continue  # Keep running, just timeout
+
+                batch = self._drain_pending()
+                if batch:  # A wakeup can find nothing left to read
+                    # Stamp arrival once per batch, before any parsing/CSV work can skew it
+                    received_at = time.monotonic()
+                    # Copy out now: the pooled buffers are reused by the next drain.
+                    # Datagrams stay bytes through parsing and CSV writing; only display fields are decoded.
+                    self._enqueue((received_at, [bytes(data) for data in batch]))
                 timeout_count = 0  # Reset timeout counter on successful receive
 
-            except socket.timeout:
-                timeout_count += 1
-                # Print status every 30 timeouts (30 seconds)
-                if timeout_count % 30 == 0:
-                    print(f"UDP receiver still listening on {self.ip}:{self.port} (no data for {timeout_count}s)")
-                continue  # Keep running, just timeout
-            except OSError as e:
+            except (OSError, ValueError) as e:
                 # Socket was closed, exit gracefully
                 if self.running:
                     print(f"UDP socket closed: {e}")
@@ -1099,8 +1664,39 @@ class UDPReceiver:
                 if self.running:  # Only print error if we're supposed to be running
                     print(f"UDP receive error: {e}")
                 break
+        self.selector.close()
         print("UDP receiver stopped")
 
+    def _enqueue(self, item):
+        """Queue a received batch for processing, dropping the oldest one if processing fell behind"""
+        while True:
+            try:
+                self._pending.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                except queue.Empty:
+                    continue
+                # Overload path: count drops and warn at most every UDP_DROP_REPORT_INTERVAL
+                self._dropped_batches += 1
+                now = time.monotonic()
+                if now - self._last_drop_report >= UDP_DROP_REPORT_INTERVAL:
+                    logger.warning("UDP processing backlog full - dropped %d oldest batch(es)", self._dropped_batches)
+                    self._dropped_batches = 0
+                    self._last_drop_report = now
+
+    def _process_loop(self):
+        """Parse received batches, write CSV and push WebSocket updates off the receive thread"""
+        while self.running or not self._pending.empty():
+            try:
+                received_at, lines = self._pending.get(timeout=UDP_TIMEOUT)
+            except queue.Empty:
+                continue
+            # Thread-safe access to data manager (one acquisition per batch)
+            with self.data_manager_lock:
+                self.data_manager.add_batch(lines, received_at)
+
 class TrainControlDashboard:
     """Enhanced Dash dashboard with network configuration and language support"""
 
@@ -1148,11 +1744,22 @@ class TrainControlDashboard:
             'kd': 0.0,
             'reference': 10.0
         }
+        # ESP32-confirmed (kp, ki, kd, reference) as display strings, formatted once per confirmation
+        self._confirmed_display = ('N/A',) * len(CONFIRMED_DISPLAY_KEYS)
 
         # Initialize MQTT sync now if not skipping setup
         if not skip_setup:
             self._initialize_mqtt_sync()
 
+        # Callbacks only queue publishes; one background thread sends them (see _drain_outbox)
+        self._pub_outbox = collections.deque()
+        self._pub_wakeup = threading.Event()
+        self._pub_thread = None
+        # Trailing-edge debounce of slider publishes (topic -> latest payload), flushed by the same thread
+        self._pending_publishes = {}
+        self._pending_deadline = None
+        self._publish_lock = threading.Lock()
+
         # Store zoom state to preserve user zoom when data updates (separate for each graph)
         self.zoom_state = {
             'realtime-graph': {
@@ -1171,335 +1778,31 @@ class TrainControlDashboard:
             }
         }
 
-        # Language dictionaries
-        self.translations = {
-            'es': {
-                'title': 'Sistema de Control PID para Tren',
-                'subtitle': 'Plataforma unificada para experimentos de control de tren basados en ESP32 con configuración de red',
-                'network_tab': '🔧 Configuración de Red',
-                'control_tab': '🎛️ Control PID',
-                'data_tab': '📊 Visualización de Datos',
-                'network_config': 'Configuración de Red',
-                'welcome': '👋 ¡Bienvenido! Comience configurando su conexión de red:',
-                'select_interface': '1. Seleccione su interfaz de red del menú desplegable',
-                'note_ip': '2. Anote la dirección IP para configurar en su ESP32',
-                'apply_config': '3. Haga clic en "Aplicar Configuración"',
-                'auto_saved': '4. ¡Su configuración se guarda automáticamente y se restaurará la próxima vez!',
-                'select_network': 'Seleccionar Interfaz de Red:',
-                'refresh_interfaces': 'Actualizar Interfaces',
-                'apply_configuration': 'Aplicar Configuración',
-                'udp_port': 'Puerto UDP:',
-                'mqtt_port': 'Puerto MQTT:',
-                'status': 'Estado',
-                'ip_address': 'Dirección IP',
-                'esp32_setup': 'Configuración ESP32',
-                'pid_control': 'Control PID',
-                'start_experiment': 'Iniciar Experimento',
-                'stop_experiment': 'Detener Experimento',
-                'kp_param': 'Parámetro Kp',
-                'ki_param': 'Parámetro Ki',
-                'kd_param': 'Parámetro Kd',
-                'reference_distance': 'Distancia de Referencia (cm)',
-                'realtime_graph': 'Gráfico en Tiempo Real',
-                'historical_graph': 'Gráfico Histórico',
-                'connection_status': 'Estado de Conexión',
-                'total_packets': 'Total de Paquetes',
-                'configure_network': 'Configure la red en la pestaña \'Red\' para comenzar',
-                'distance_data_realtime': 'Datos del Sensor de Distancia en Tiempo Real',
-                'time': 'Tiempo',
-                'distance_cm': 'Distancia (cm)',
-                'experiment_files_not_found': 'No se encontraron archivos de experimento - inicie el receptor UDP',
-                'data_format_problem': 'Problema de formato de datos - columnas esperadas: time_event, input',
-                'waiting_esp32_data': 'Esperando datos del ESP32... (archivo CSV vacío)',
-                'waiting_data_file': 'Esperando datos...',
-                'data_read_error': 'Error leyendo datos',
-                'points': 'puntos',
-                'csv_file_path': 'Archivo CSV',
-                'language': 'Idioma',
-                'configure_network_first': 'Configure la red primero para habilitar el registro de datos',
-                'no_active_experiment': 'No hay experimento activo',
-                'waiting_for_data': 'Esperando datos del ESP32...',
-                'experiment_started': '¡Experimento iniciado!',
-                'experiment_stopped': '¡Experimento detenido!',
-                'configure_network_warning': '¡Configure la red primero!',
-                'configuration_applied': '¡Configuración aplicada y guardada!',
-                'udp_start_failed': 'Error al iniciar el receptor UDP',
-                'connected': 'Conectado',
-                'connection_lost': 'Conexión perdida',
-                'receiving_data': 'Recibiendo datos',
-                'waiting_for_data_status': 'Esperando datos',
-                'packets': 'Paquetes',
-                'last': 'Último',
-                'never': 'Nunca',
-                'status_unavailable': 'Estado no disponible',
-                'download_csv': 'Descargar CSV',
-                'download_experiment_data': 'Descargar Datos del Experimento',
-                'no_data_to_download': 'No hay datos para descargar',
-                'esp32_parameters': 'Parámetros ESP32',
-                'esp32_confirmed_parameters': 'Parámetros ESP32 Confirmados',
-                'esp32_waiting_parameters': 'ESP32: Esperando parámetros...',
-                'network_not_configured': '⚠️ Red no configurada',
-                'go_to_network_tab': 'Vaya a la pestaña Configuración de Red para configurar la conexión.',
-                'esp32_connection_status': 'Estado de Conexión ESP32',
-                'historical_data': 'Datos Históricos',
-                'data_current_session': 'Datos de la sesión de experimento actual.',
-                'data_storage': 'Almacenamiento de Datos',
-                'total_packets_label': 'Total de Paquetes',
-                'last_received': 'Último Recibido',
-                'experiment_label': 'Experimento',
-                'latest_data': 'Datos Más Recientes',
-                'active': 'Activo',
-                'stopped': 'Detenido',
-                'welcome_network': '👋 ¡Bienvenido! Comience configurando su conexión de red:',
-                'step_select_interface': '1. Seleccione su interfaz de red del menú desplegable a continuación',
-                'step_note_ip': '2. Anote la dirección IP para configurar en su ESP32',
-                'step_apply_config': '3. Haga clic en "Aplicar Configuración" para iniciar el sistema',
-                'esp32_configuration': 'Configuración ESP32',
-                'use_ip_address': 'Use esta dirección IP en su código ESP32 antes de flashear.',
-                'port_configuration': 'Configuración de Puertos',
-                'pid_parameters': 'Parámetros PID',
-                'ip_address_to_configure': 'Dirección IP para configurar en ESP32:',
-                'csv_file_path_label': 'Ruta del Archivo CSV:',
-                'test_connection': 'Probar Conexión',
-                'experiment_data_connection_status': 'Datos del Experimento y Estado de Conexión',
-                'parameters_sent_esp32': 'Parámetros enviados al ESP32',
-                'mqtt_communication_error': 'Error de comunicación MQTT',
-                'parameters_configured': 'Parámetros configurados',
-                'ready_to_start': 'Listo para iniciar experimento',
-                'select_interface_placeholder': 'Seleccionar interfaz de red...',
-                'mqtt_sync_not_available': 'MQTT sync no disponible',
-                'connection_waiting_confirmation': 'Conectado, esperando confirmación...',
-                'mqtt_not_connected': 'MQTT no conectado',
-                'mqtt_not_available': 'MQTT: No disponible',
-                'esp32_label': 'ESP32: ',
-                'auto_loaded': 'Auto-cargado',
-                'selected': 'Seleccionado',
-                'interfaces_refreshed': 'Interfaces actualizadas',
-                'network_interfaces_updated': 'Interfaces de red actualizadas',
-                'select_an_interface': 'Seleccionar una interfaz',
-                'configuration_applied_saved_mqtt': 'Configuración aplicada y guardada! MQTT sync habilitado.',
-                'udp_started_mqtt_failed': 'UDP iniciado pero MQTT sync falló',
-                'ready_apply_configuration': 'Listo para aplicar configuración',
-                'current': 'Actual',
-                'current_configuration_loaded': 'Configuración actual cargada',
-                'no_interface_selected': 'Ninguna interfaz seleccionada',
-                'configure_network_settings_above': 'Configure los ajustes de red arriba',
-                'tab_not_found': 'Pestaña no encontrada',
-                'pid_red_no_configurada': 'PID: Kp={kp:.1f}, Ki={ki:.1f}, Kd={kd:.1f}, Ref={ref}cm (Red no configurada)',
-                'no_data_received': 'No se recibieron datos',
-                'kp_label': 'Kp',
-                'ki_label': 'Ki',
-                'kd_label': 'Kd',
-                'ref_label': 'Ref (cm)',
-                'send_button': 'Enviar',
-                'distance_label': 'Distancia',
-                'reference_label': 'Referencia',
-                'step_response_tab': '📈 Respuesta al Escalón',
-                'step_response_title': 'Experimento de Respuesta al Escalón',
-                'step_response_config': 'Configuración del Escalón',
-                'battery_voltage': 'Voltaje de Batería (V)',
-                'step_amplitude': 'Amplitud del Escalón (V)',
-                'step_duration': 'Duración del Escalón (s)',
-                'motor_direction': 'Dirección del Motor',
-                'forward': 'Avanzar',
-                'reverse': 'Retroceder',
-                'step_response_graph': 'Gráfico de Respuesta al Escalón',
-                'distance_response': 'Respuesta de Distancia',
-                'step_input_label': 'Entrada Escalón',
-                'pwm_input_label': 'Entrada PWM',
-                'no_step_data': 'No hay datos de respuesta al escalón',
-                'step_experiment_firmware': 'Requiere firmware de Respuesta al Escalón (trenUDP_esp)',
-                'step_test_active': 'Prueba de escalón activa',
-                'step_test_stopped': 'Prueba de escalón detenida',
-                'step_esp32_status': 'Estado ESP32 (Escalón)',
-                'configure_step_first': 'Configure los parámetros del escalón primero',
-
-                # Deadband Calibration
-                'deadband_tab': '🔧 Calibración Deadband',
-                'deadband_title': 'Calibración de Zona Muerta',
-                'deadband_config': 'Configuración de Calibración',
-                'start_calibration': 'Iniciar Calibración',
-                'stop_calibration': 'Detener Calibración',
-                'motion_threshold': 'Umbral de Movimiento (cm)',
-                'deadband_direction': 'Dirección',
-                'calibration_result': 'Resultado de Calibración',
-                'apply_to_pid': 'Aplicar a PID',
-                'deadband_value': 'Valor Deadband',
-                'calibration_in_progress': '🔄 Calibración en progreso...',
-                'calibration_complete': '✓ Calibración completa',
-                'deadband_pwm_graph': 'PWM vs Tiempo',
-                'deadband_distance_graph': 'Distancia vs Tiempo',
-                'deadband_curve_graph': 'Curva de Calibración (PWM vs Distancia)',
-                'pwm_value': 'PWM',
-                'initial_distance': 'Distancia Inicial',
-                'motion_detected': 'Movimiento Detectado',
-                'calibrating': 'Calibrando...',
-                'deadband_applied': '✓ Deadband aplicado al modo PID'
-            },
-            'en': {
-                'title': 'Train PID Control System',
-                'subtitle': 'Unified platform for ESP32-based train control experiments with network configuration',
-                'network_tab': '🔧 Network Configuration',
-                'control_tab': '🎛️ PID Control',
-                'data_tab': '📊 Data Visualization',
-                'network_config': 'Network Configuration',
-                'welcome': '👋 Welcome! Start by configuring your network connection:',
-                'select_interface': '1. Select your network interface from the dropdown below',
-                'note_ip': '2. Note the IP address to configure in your ESP32',
-                'apply_config': '3. Click "Apply Configuration"',
-                'auto_saved': '4. Your settings are automatically saved and will be restored next time!',
-                'select_network': 'Select Network Interface:',
-                'refresh_interfaces': 'Refresh Interfaces',
-                'apply_configuration': 'Apply Configuration',
-                'udp_port': 'UDP Port:',
-                'mqtt_port': 'MQTT Port:',
-                'status': 'Status',
-                'ip_address': 'IP Address',
-                'esp32_setup': 'ESP32 Setup',
-                'pid_control': 'PID Control',
-                'start_experiment': 'Start Experiment',
-                'stop_experiment': 'Stop Experiment',
-                'kp_param': 'Kp Parameter',
-                'ki_param': 'Ki Parameter',
-                'kd_param': 'Kd Parameter',
-                'reference_distance': 'Reference Distance (cm)',
-                'realtime_graph': 'Real-time Graph',
-                'historical_graph': 'Historical Graph',
-                'connection_status': 'Connection Status',
-                'total_packets': 'Total Packets',
-                'configure_network': 'Configure network in the \'Network\' tab to start',
-                'distance_data_realtime': 'Real-time Distance Sensor Data',
-                'time': 'Time',
-                'distance_cm': 'Distance (cm)',
-                'experiment_files_not_found': 'No experiment files found - start UDP receiver',
-                'data_format_problem': 'Data format problem - expected columns: time_event, input',
-                'waiting_esp32_data': 'Waiting for ESP32 data... (empty CSV file)',
-                'waiting_data_file': 'Waiting for data...',
-                'data_read_error': 'Error reading data',
-                'points': 'points',
-                'csv_file_path': 'CSV File Path',
-                'language': 'Language',
-                'configure_network_first': 'Configure network first to enable data logging',
-                'no_active_experiment': 'No active experiment',
-                'waiting_for_data': 'Waiting for data from ESP32...',
-                'experiment_started': 'Experiment started!',
-                'experiment_stopped': 'Experiment stopped!',
-                'configure_network_warning': 'Configure network first!',
-                'configuration_applied': 'Configuration applied and saved!',
-                'udp_start_failed': 'Failed to start UDP receiver',
-                'connected': 'Connected',
-                'connection_lost': 'Connection lost',
-                'receiving_data': 'Receiving data',
-                'waiting_for_data_status': 'Waiting for data',
-                'packets': 'Packets',
-                'last': 'Last',
-                'never': 'Never',
-                'status_unavailable': 'Status unavailable',
-                'download_csv': 'Download CSV',
-                'download_experiment_data': 'Download Experiment Data',
-                'no_data_to_download': 'No data to download',
-                'esp32_parameters': 'ESP32 Parameters',
-                'esp32_confirmed_parameters': 'ESP32 Confirmed Parameters',
-                'esp32_waiting_parameters': 'ESP32: Waiting for parameters...',
-                'network_not_configured': '⚠️ Network not configured',
-                'go_to_network_tab': 'Go to Network Configuration tab to set up connection.',
-                'esp32_connection_status': 'ESP32 Connection Status',
-                'historical_data': 'Historical Data',
-                'data_current_session': 'Data from current experiment session.',
-                'data_storage': 'Data Storage',
-                'total_packets_label': 'Total Packets',
-                'last_received': 'Last Received',
-                'experiment_label': 'Experiment',
-                'latest_data': 'Latest Data',
-                'active': 'Active',
-                'stopped': 'Stopped',
-                'welcome_network': '👋 Welcome! Start by configuring your network connection:',
-                'step_select_interface': '1. Select your network interface from the dropdown below',
-                'step_note_ip': '2. Note the IP address to configure in your ESP32',
-                'step_apply_config': '3. Click "Apply Configuration" to start the system',
-                'esp32_configuration': 'ESP32 Configuration',
-                'use_ip_address': 'Use this IP address in your ESP32 code before flashing.',
-                'port_configuration': 'Port Configuration',
-                'pid_parameters': 'PID Parameters',
-                'ip_address_to_configure': 'IP Address to configure in ESP32:',
-                'csv_file_path_label': 'CSV File Path:',
-                'test_connection': 'Test Connection',
-                'experiment_data_connection_status': 'Experiment Data & Connection Status',
-                'parameters_sent_esp32': 'Parameters sent to ESP32',
-                'mqtt_communication_error': 'MQTT communication error',
-                'parameters_configured': 'Parameters configured',
-                'ready_to_start': 'Ready to start experiment',
-                'select_interface_placeholder': 'Select network interface...',
-                'mqtt_sync_not_available': 'MQTT sync not available',
-                'connection_waiting_confirmation': 'Connected, waiting for confirmation...',
-                'mqtt_not_connected': 'MQTT not connected',
-                'mqtt_not_available': 'MQTT: Not available',
-                'esp32_label': 'ESP32: ',
-                'auto_loaded': 'Auto-loaded',
-                'selected': 'Selected',
-                'interfaces_refreshed': 'Interfaces refreshed',
-                'network_interfaces_updated': 'Network interfaces updated',
-                'select_an_interface': 'Select an interface',
-                'configuration_applied_saved_mqtt': 'Configuration applied and saved! MQTT sync enabled.',
-                'udp_started_mqtt_failed': 'UDP started but MQTT sync failed',
-                'ready_apply_configuration': 'Ready to apply configuration',
-                'current': 'Current',
-                'current_configuration_loaded': 'Current configuration loaded',
-                'no_interface_selected': 'No interface selected',
-                'configure_network_settings_above': 'Configure network settings above',
-                'tab_not_found': 'Tab not found',
-                'pid_red_no_configurada': 'PID: Kp={kp:.1f}, Ki={ki:.1f}, Kd={kd:.1f}, Ref={ref}cm (Network not configured)',
-                'no_data_received': 'No data received',
-                'kp_label': 'Kp',
-                'ki_label': 'Ki',
-                'kd_label': 'Kd',
-                'ref_label': 'Ref (cm)',
-                'send_button': 'Send',
-                'distance_label': 'Distance',
-                'reference_label': 'Reference',
-                'step_response_tab': '📈 Step Response',
-                'step_response_title': 'Step Response Experiment',
-                'step_response_config': 'Step Configuration',
-                'battery_voltage': 'Battery Voltage (V)',
-                'step_amplitude': 'Step Amplitude (V)',
-                'step_duration': 'Step Duration (s)',
-                'motor_direction': 'Motor Direction',
-                'forward': 'Forward',
-                'reverse': 'Reverse',
-                'step_response_graph': 'Step Response Graph',
-                'distance_response': 'Distance Response',
-                'step_input_label': 'Step Input',
-                'pwm_input_label': 'PWM Input',
-                'no_step_data': 'No step response data available',
-                'step_experiment_firmware': 'Requires Step Response firmware (trenUDP_esp)',
-                'step_test_active': 'Step test active',
-                'step_test_stopped': 'Step test stopped',
-                'step_esp32_status': 'ESP32 Status (Step)',
-                'configure_step_first': 'Configure step parameters first',
-
-                # Deadband Calibration
-                'deadband_tab': '🔧 Deadband Calibration',
-                'deadband_title': 'Deadband Calibration',
-                'deadband_config': 'Calibration Configuration',
-                'start_calibration': 'Start Calibration',
-                'stop_calibration': 'Stop Calibration',
-                'motion_threshold': 'Motion Threshold (cm)',
-                'deadband_direction': 'Direction',
-                'calibration_result': 'Calibration Result',
-                'apply_to_pid': 'Apply to PID',
-                'deadband_value': 'Deadband Value',
-                'calibration_in_progress': '🔄 Calibration in progress...',
-                'calibration_complete': '✓ Calibration complete',
-                'deadband_pwm_graph': 'PWM vs Time',
-                'deadband_distance_graph': 'Distance vs Time',
-                'deadband_curve_graph': 'Calibration Curve (PWM vs Distance)',
-                'pwm_value': 'PWM',
-                'initial_distance': 'Initial Distance',
-                'motion_detected': 'Motion Detected',
-                'calibrating': 'Calibrating...',
-                'deadband_applied': '✓ Deadband applied to PID mode'
-            }
-        }
+        # experiment_type -> (newest CSV path, time.monotonic() of the scan), see _find_active_csv();
+        # only consulted while the matching data manager has no session file open
+        self._active_csv = {}
+        # path -> {'offset', 'header', 'df'}: parsed rows of the session CSV, see _read_csv_incremental()
+        self._csv_cache = {}
+        # (language, title key) -> styled placeholder figure, cloned by _empty_figure()
+        self._empty_figures = {}
+        # language -> layout kwargs shared by the distance graphs, see _distance_layout()
+        self._distance_layouts = {}
+        # (state key, figure) prepared off the request thread, see _graph_builder_loop()
+        self._prebuilt_realtime = None
+        # Rendered parameter status components keyed by their inputs, see _get_parameter_status_display()
+        self._status_cache = {}
+        # (language, tab value) -> static tab layout, see _cached_tab()
+        self._tab_layouts = {}
+        # language -> main tab headers, see _main_tabs()
+        self._tabs_by_lang = {}
+        # tab value -> mode badge, see _mode_badge()
+        self._mode_badges = {}
+        # Language of the last "network not configured" step status sent, see update_step_parameters
+        self._step_warning_language = None
+        self._graph_builder = None
+
+        # Language dictionaries (module-wide catalog, loaded from translations/<lang>.json on first use)
+        self.translations = TRANSLATIONS
 
         # Dashboard initialization (debug output reduced)
         # print(f"Dashboard initialized with data_manager: {id(self.data_manager)}")
@@ -1519,30 +1822,22 @@ class TrainControlDashboard:
         log = logging.getLogger('werkzeug')
         log.setLevel(logging.ERROR)
 
-        # Setup message queue for push notifications
-        self.websocket_messages = queue.Queue(maxsize=100)
+        # Push notifications are only counted (payloads are not needed: the graphs read the telemetry
+        # ring); event streams wait on the count (see _event_stream)
+        self.websocket_message_count = 0
+        self.websocket_message_pushed = threading.Condition()
 
         # Connect callback to data sources
+        # (mqtt_sync gets its callback in _initialize_mqtt_sync)
         self.data_manager.websocket_callback = self._push_websocket_message
-        if self.mqtt_sync:  # Only if already initialized (single-train mode)
-            self.mqtt_sync.websocket_callback = self._push_websocket_message
         self.step_data_manager.websocket_callback = self._push_websocket_message
 
         # Modern color scheme
-        self.colors = {
-            'primary': '#1f2937',      # Dark gray
-            'secondary': '#3b82f6',    # Blue
-            'accent': '#10b981',       # Green
-            'background': '#f8fafc',   # Light gray
-            'surface': '#ffffff',      # White
-            'text': '#1f2937',         # Dark gray
-            'text_light': '#6b7280',   # Medium gray
-            'success': '#10b981',      # Green
-            'warning': '#f59e0b',      # Yellow
-            'danger': '#ef4444',       # Red
-            'train_primary': '#dc2626', # Train red
-            'train_secondary': '#1e40af' # Train blue
-        }
+        self.colors = UI_COLORS
+        # Figure styling reads these on every render; plain attributes skip the dict lookup
+        self._c_surface = self.colors['surface']
+        self._c_background = self.colors['background']
+        self._c_text = self.colors['text']
 
         if not skip_setup:
             self.setup_layout()
@@ -1638,6 +1933,25 @@ class TrainControlDashboard:
         else:
             return base_pattern
 
+    def _find_active_csv(self, experiment_type='pid'):
+        """Newest CSV for an experiment type, or None; rescans at most every ACTIVE_CSV_RECHECK_INTERVAL"""
+        # The file our own data manager is writing is the newest one; no directory scan needed
+        manager = {'pid': self.data_manager, 'step': self.step_data_manager,
+                   'deadband': self.deadband_data_manager}.get(experiment_type)
+        if manager and manager.active_csv_path:
+            return manager.active_csv_path
+
+        # Otherwise fall back to files left by earlier sessions
+        now = time.monotonic()
+        cached = self._active_csv.get(experiment_type)
+        if cached and now - cached[1] < ACTIVE_CSV_RECHECK_INTERVAL and os.path.exists(cached[0]):
+            return cached[0]
+
+        csv_files = glob.glob(self._get_csv_glob_pattern(experiment_type))
+        active_csv = max(csv_files, key=os.path.getmtime) if csv_files else None
+        self._active_csv[experiment_type] = (active_csv, now) if active_csv else None
+        return active_csv
+
     def get_topic(self, topic_key):
         """
         Get train-specific MQTT topic if available, else global topic.
@@ -1663,32 +1977,101 @@ class TrainControlDashboard:
             return self.mqtt_topics.get(topic_key, MQTT_TOPICS[topic_key])
         return MQTT_TOPICS[topic_key]
 
-    def _handle_zoom_state(self, graph_id, relayout_data):
-        """Handle zoom state updates for a specific graph"""
-        if relayout_data and graph_id in self.zoom_state:
+    def _get_publish_client(self):
+        """Return the connected persistent MQTT client, or None if only one-shot publishes are possible"""
+        client = self.mqtt_sync.client if self.mqtt_sync else None
+        if client and client.is_connected():
+            return client
+        return None
+
+    def _publish(self, topic, payload):
+        """Queue one MQTT message for the publisher thread (returns immediately)"""
+        self._discard_pending((topic,))
+        self._pub_outbox.append((topic, payload))
+        self._wake_publisher()
+
+    def _publish_many(self, messages):
+        """Queue several (topic, payload) pairs; they are sent together, in order"""
+        self._discard_pending([topic for topic, _ in messages])
+        self._pub_outbox.extend(messages)
+        self._wake_publisher()
+
+    def _publish_debounced(self, topic, payload):
+        """Queue a slider value; only the last value per topic is sent once the slider has been quiet"""
+        with self._publish_lock:
+            self._pending_publishes[topic] = payload
+            self._pending_deadline = time.monotonic() + MQTT_PUBLISH_DEBOUNCE
+        self._wake_publisher()
+
+    def _discard_pending(self, topics):
+        """Drop debounced slider values superseded by an immediate publish to the same topic"""
+        if self._pending_publishes:
+            with self._publish_lock:
+                for topic in topics:
+                    self._pending_publishes.pop(topic, None)
+
+    def _wake_publisher(self):
+        """Start the publisher thread on first use and wake it up"""
+        if self._pub_thread is None:
+            with self._publish_lock:
+                if self._pub_thread is None:
+                    self._pub_thread = threading.Thread(target=self._drain_outbox, name="mqtt-publisher", daemon=True)
+                    self._pub_thread.start()
+        self._pub_wakeup.set()
+
+    def _drain_outbox(self):
+        """Publisher thread: send queued messages in bursts and flush debounced slider values once quiet"""
+        while True:
+            timeout = None
+            with self._publish_lock:
+                if self._pending_publishes:
+                    remaining = self._pending_deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._pub_outbox.extend(self._pending_publishes.items())
+                        self._pending_publishes = {}
+                    else:
+                        timeout = remaining
+            while self._pub_outbox:
+                batch = []
+                while self._pub_outbox and len(batch) < MQTT_OUTBOX_BATCH:
+                    batch.append(self._pub_outbox.popleft())
+                try:
+                    self._send_messages(batch)
+                except Exception as e:
+                    print(f"[MQTT ERROR] Publish failed: {e}")
+            self._pub_wakeup.wait(timeout)
+            self._pub_wakeup.clear()
+
+    def _send_messages(self, messages):
+        """Publish (topic, payload) pairs over the persistent connection (one-shot connection as fallback)"""
+        # Control-plane messages must arrive; parameter values are superseded by the next one anyway
+        control_topics = {self.get_topic(key) for key in MQTT_CONTROL_TOPIC_KEYS}
+        client = self._get_publish_client()
+        if client:
+            last_control = None
+            for topic, payload in messages:
+                if topic in control_topics:
+                    last_control = client.publish(topic, payload, qos=1)
+                else:
+                    client.publish(topic, payload, qos=0)
+            # QoS 1 messages are acknowledged in order: waiting on the last one covers the whole burst
+            if last_control is not None:
+                last_control.wait_for_publish(timeout=MQTT_CONTROL_ACK_TIMEOUT)
+                if not last_control.is_published():
+                    print(f"[MQTT WARNING] Control message not acknowledged within {MQTT_CONTROL_ACK_TIMEOUT}s")
+        else:
+            # No live persistent connection (not configured yet or reconnecting): one-shot connection
+            publish.multiple([{'topic': topic, 'payload': payload, 'qos': 1 if topic in control_topics else 0}
+                              for topic, payload in messages],
+                             hostname=self.network_manager.mqtt_broker_ip, port=self.network_manager.mqtt_port)
+
+    def _handle_zoom_state(self, graph_id, zoom_data):
+        """Adopt the zoom state tracked in the browser (see ZOOM_STATE_CLIENTSIDE_JS) for a specific graph"""
+        if zoom_data and graph_id in self.zoom_state:
             zoom_state = self.zoom_state[graph_id]
-
-            # User interacted with the graph (zoomed, panned, etc.)
-            if 'xaxis.range[0]' in relayout_data:
-                zoom_state['xaxis.range[0]'] = relayout_data['xaxis.range[0]']
-                zoom_state['user_has_zoomed'] = True
-            if 'xaxis.range[1]' in relayout_data:
-                zoom_state['xaxis.range[1]'] = relayout_data['xaxis.range[1]']
-                zoom_state['user_has_zoomed'] = True
-            if 'yaxis.range[0]' in relayout_data:
-                zoom_state['yaxis.range[0]'] = relayout_data['yaxis.range[0]']
-                zoom_state['user_has_zoomed'] = True
-            if 'yaxis.range[1]' in relayout_data:
-                zoom_state['yaxis.range[1]'] = relayout_data['yaxis.range[1]']
-                zoom_state['user_has_zoomed'] = True
-
-            # Handle double-click (zoom reset)
-            if 'xaxis.autorange' in relayout_data or 'yaxis.autorange' in relayout_data:
-                zoom_state['user_has_zoomed'] = False
-                zoom_state['xaxis.range[0]'] = None
-                zoom_state['xaxis.range[1]'] = None
-                zoom_state['yaxis.range[0]'] = None
-                zoom_state['yaxis.range[1]'] = None
+            for key in ZOOM_RANGE_KEYS:
+                zoom_state[key] = zoom_data.get(key)
+            zoom_state['user_has_zoomed'] = bool(zoom_data.get('user_has_zoomed'))
 
     def _apply_zoom_state(self, layout_config, graph_id):
         """Apply saved zoom state to layout configuration"""
@@ -1700,132 +2083,339 @@ class TrainControlDashboard:
                 if zoom_state['yaxis.range[0]'] is not None and zoom_state['yaxis.range[1]'] is not None:
                     layout_config['yaxis_range'] = [zoom_state['yaxis.range[0]'], zoom_state['yaxis.range[1]']]
 
+    def _distance_layout(self, title):
+        """Fresh layout kwargs for a distance graph, copied from a per-language template"""
+        base = self._distance_layouts.get(self.current_language)
+        if base is None:
+            base = self._distance_layouts[self.current_language] = dict(
+                xaxis_title=self.t('time'),
+                yaxis_title=self.t('distance_cm'),
+                plot_bgcolor=self._c_surface,
+                paper_bgcolor=self._c_background,
+                font_color=self._c_text,
+                showlegend=True,
+                margin=GRAPH_MARGIN
+            )
+        layout_config = base.copy()
+        layout_config['title'] = title
+        return layout_config
+
+    def _empty_figure(self, title_key):
+        """Placeholder figure titled with a translated message, built once per language and cloned"""
+        cache_key = (self.current_language, title_key)
+        template = self._empty_figures.get(cache_key)
+        if template is None:
+            template = go.Figure()
+            template.update_layout(
+                title=self.t(title_key),
+                plot_bgcolor=self._c_surface,
+                paper_bgcolor=self._c_background,
+                font_color=self._c_text,
+                margin=GRAPH_MARGIN
+            )
+            self._empty_figures[cache_key] = template
+        return go.Figure(template)
+
+    def _realtime_figure_key(self):
+        """Everything the realtime figure depends on; a prebuilt figure is reusable while this is unchanged"""
+        ring = self.data_manager.telemetry
+        return (self.data_manager.initialized, id(ring), ring.head, ring.generation,
+                self.current_language, tuple(self.zoom_state['realtime-graph'].values()))
+
+    def _realtime_sync_base(self):
+        """Realtime figure key minus the sample count: a client figure with the same base can be extended in place"""
+        key = self._realtime_figure_key()
+        return repr(key[:2] + key[3:])
+
+    def _realtime_graph_update(self, sync):
+        """Return (figure or Patch, sync) for the realtime graph
+
+        `sync` records what the browser already holds: the ring's sample counter (`head`, the
+        data version) its figure was built from, and how many leading samples it plots as-is
+        (`points`). Nothing is sent while no sample arrived. While the ring has not wrapped, no
+        downsampling applies and samples arrived in order, only the new samples are sent
+        as a Patch; anything else (zoom, language, session, overflow) gets a full figure.
+        """
+        base = self._realtime_sync_base()
+        ring = self.data_manager.telemetry
+        head = ring.head
+        synced = self.data_manager.initialized and sync and sync.get('base') == base
+        if synced and sync.get('head') == head:
+            return dash.no_update, dash.no_update  # Idle: no sample since the browser's figure
+        sent = sync.get('points', 0) if synced else 0
+        if 0 < sent < head <= min(ring.capacity, PLOT_MAX_POINTS):
+            time_event = ring.columns['time_event'][:head]
+            if np.all(time_event[1:] >= time_event[:-1]):
+                patched = Patch()
+                new_x = time_event[sent:].tolist()
+                patched['data'][0]['x'].extend(new_x)
+                patched['data'][0]['y'].extend(ring.columns['input'][sent:head].tolist())
+                patched['data'][1]['x'].extend(new_x)
+                patched['data'][1]['y'].extend(ring.columns['referencia'][sent:head].tolist())
+                patched['layout']['title']['text'] = self._realtime_title(head)
+                return patched, {'base': base, 'head': head, 'points': head}
+
+        key, fig = self._get_realtime_figure()
+        points = 0
+        if self.data_manager.initialized and fig['data'] and ring.head <= ring.capacity:
+            # Without wrap-around or downsampling the trace holds exactly the first len(x) samples
+            plotted = fig['data'][0].get('x')
+            if isinstance(plotted, list) and len(plotted) < PLOT_MAX_POINTS:
+                points = len(plotted)
+        return fig, {'base': base, 'head': key[2], 'points': points}
+
+    def _ensure_graph_builder(self):
+        """Start the background realtime figure builder on first use"""
+        if self._graph_builder is None:
+            self._graph_builder = threading.Thread(target=self._graph_builder_loop, name="graph-builder", daemon=True)
+            self._graph_builder.start()
+
+    def _graph_builder_loop(self):
+        """Rebuild the realtime figure off the Dash request thread whenever new samples arrive"""
+        while True:
+            time.sleep(GRAPH_BUILD_INTERVAL)
+            key = self._realtime_figure_key()
+            prebuilt = self._prebuilt_realtime
+            if prebuilt is not None and prebuilt[0] == key:
+                continue
+            try:
+                self._prebuilt_realtime = (key, self._create_realtime_graph('realtime-graph').to_plotly_json())
+            except Exception as e:
+                logger.warning("Background graph build failed: %s", e)
+
+    def _get_realtime_figure(self):
+        """(key, figure dict): the prebuilt realtime figure if it is current, otherwise one built now
+
+        Figures are kept as plain dicts (`to_plotly_json()` once per build): Dash then only
+        JSON-encodes them instead of walking the graph_objects tree on every response.
+        """
+        self._ensure_graph_builder()
+        key = self._realtime_figure_key()
+        prebuilt = self._prebuilt_realtime
+        if prebuilt is not None and prebuilt[0] == key:
+            return prebuilt
+        self._prebuilt_realtime = prebuilt = (key, self._create_realtime_graph('realtime-graph').to_plotly_json())
+        return prebuilt
+
+    def _create_realtime_graph(self, graph_id, title_prefix=""):
+        """Create the live distance graph straight from the in-memory telemetry ring"""
+        if not self.data_manager.initialized:
+            return self._create_data_graph(graph_id, title_prefix)
+
+        samples = self.data_manager.telemetry.snapshot(('time_event', 'input', 'referencia'))
+        time_event = samples['time_event']
+        if len(time_event) == 0:
+            return self._empty_figure('waiting_esp32_data')
+        fig = go.Figure()
+
+        # UDP can reorder datagrams; only pay for a sort when it actually happened
+        order = None
+        if len(time_event) > 1 and np.any(time_event[1:] < time_event[:-1]):
+            order = np.argsort(time_event, kind='stable')
+            time_event = time_event[order]
+        distance = samples['input'] if order is None else samples['input'][order]
+        reference = samples['referencia'] if order is None else samples['referencia'][order]
+
+        # WebGL traces stay responsive with thousands of points; longer runs are downsampled
+        distance_x, distance = downsample_series(time_event, distance)
+        reference_x, reference = downsample_series(time_event, reference)
+        if len(time_event) < PLOT_MAX_POINTS:
+            # Windows that can still grow by Patch appends ship plain lists: Plotly encodes numpy
+            # arrays as base64 typed arrays, which a Patch cannot extend in the browser
+            distance_x, distance = distance_x.tolist(), distance.tolist()
+            reference_x, reference = reference_x.tolist(), reference.tolist()
+        fig.add_trace(go.Scattergl(
+            x=distance_x,
+            y=distance,
+            mode='lines+markers',
+            name=self.t('distance_label'),
+            line=dict(color='blue'),
+            marker=dict(size=4)
+        ))
+        fig.add_trace(go.Scattergl(
+            x=reference_x,
+            y=reference,
+            mode='lines',
+            name=self.t('reference_label'),
+            line=dict(color='red', dash='dash')
+        ))
+
+        layout_config = self._distance_layout(f'{title_prefix}{self._realtime_title(len(time_event))}')
+
+        # Apply user zoom state if they have zoomed
+        self._apply_zoom_state(layout_config, graph_id)
+
+        fig.update_layout(**layout_config)
+        return fig
+
+    def _realtime_title(self, count):
+        """Title of the live distance graph"""
+        return f'{self.t("distance_data_realtime")} ({count} {self.t("points")})'
+
+    def _load_step_csv_columns(self):
+        """Read (time_event, output_G) arrays from the newest step CSV, or (None, None) if there is none"""
+        active_csv = self._find_active_csv('step')
+        if not active_csv:
+            return None, None
+
+        empty = np.empty(0, dtype=np.float64)
+        if os.path.getsize(active_csv) < 150:  # File has only headers
+            return empty, empty
+
+        # Read and parse data, skipping any duplicate header rows (and undecodable datagram bytes)
+        df = pd.read_csv(active_csv, on_bad_lines='skip', usecols=['time_event', 'output_G'], encoding_errors='replace')
+        time_event = pd.to_numeric(df['time_event'], errors='coerce').to_numpy(dtype=np.float64)
+        output_g = pd.to_numeric(df['output_G'], errors='coerce').to_numpy(dtype=np.float64)
+        valid = np.isfinite(time_event) & np.isfinite(output_g)
+        return time_event[valid], output_g[valid]
+
+    def _read_csv_incremental(self, csv_path):
+        """Return the parsed CSV, parsing only the complete lines appended since the previous call"""
+        entry = self._csv_cache.get(csv_path)
+        if entry is None or os.path.getsize(csv_path) < entry['offset']:
+            # New or rotated/truncated file: start over (older files are no longer plotted)
+            self._csv_cache.clear()
+            entry = self._csv_cache[csv_path] = {'offset': 0, 'header': None, 'df': pd.DataFrame()}
+
+        with open(csv_path, 'rb') as f:
+            f.seek(entry['offset'])
+            new_bytes = f.read()
+        # The writer may be mid-row; leave the unterminated tail for the next call
+        end = new_bytes.rfind(b'\n') + 1
+        if not end:
+            return entry['df']
+
+        header = entry['header']
+        if header is None:
+            header = pd.read_csv(io.BytesIO(new_bytes[:end]), nrows=0, encoding_errors='replace').columns.tolist()
+        new_df = self._parse_csv_chunk(new_bytes[:end], header, first=entry['header'] is None)
+        # Only consume the chunk once it parsed, so a failure never drops its rows for good
+        entry['header'] = header
+        entry['offset'] += end
+        if not new_df.empty:
+            entry['df'] = new_df if entry['df'].empty else pd.concat([entry['df'], new_df], ignore_index=True)
+        return entry['df']
+
+    @staticmethod
+    def _parse_csv_chunk(data, header, first):
+        """Plotted columns of a run of complete CSV lines as float64; malformed rows are dropped"""
+        # Raw datagram bytes reach the CSV, so a stray non-UTF-8 byte must not fail the whole chunk
+        options = dict(usecols=lambda c: c in HISTORICAL_CSV_COLUMNS, engine='c', encoding_errors='replace')
+        if not first:
+            options.update(names=header, header=None)
+        try:
+            # Fast path: parsed straight to float64 with the C engine (no type inference pass)
+            return pd.read_csv(io.BytesIO(data), dtype=_HISTORICAL_CSV_DTYPES, **options)
+        except ValueError:
+            # A garbled datagram row (or repeated header) in the chunk: keep its valid rows
+            df = pd.read_csv(io.BytesIO(data), dtype=str, on_bad_lines='skip', **options)
+            df = df.apply(pd.to_numeric, errors='coerce').dropna()
+            return df.astype(np.float64)
+
     def _create_data_graph(self, graph_id, title_prefix=""):
         """Generic method to create a data graph with zoom preservation"""
         # Check if system is properly initialized
         if not self.data_manager.initialized:
-            fig = px.line(title=self.t('configure_network'))
-            fig.update_layout(
-                plot_bgcolor=self.colors['surface'],
-                paper_bgcolor=self.colors['background'],
-                font_color=self.colors['text'],
-                margin=dict(l=40, r=20, t=40, b=40)
-            )
-            return fig
+            return self._empty_figure('configure_network')
 
-        # Create a basic figure to start with
-        fig = go.Figure()
+        # Find the actual file being written to (most recently modified)
+        active_csv = self._find_active_csv('pid')
+        if not active_csv:
+            return self._empty_figure('experiment_files_not_found')
 
-        # Try to read current CSV data
         try:
-            # Find the actual file being written to
-            csv_files = glob.glob(self._get_csv_glob_pattern('pid'))
-            if not csv_files:
-                fig.update_layout(
-                    title=self.t('experiment_files_not_found'),
-                    plot_bgcolor=self.colors['surface'],
-                    paper_bgcolor=self.colors['background'],
-                    font_color=self.colors['text'],
-                    margin=dict(l=40, r=20, t=40, b=40)
-                )
-                return fig
-
-            # Find the file that's actively being written (most recently modified)
-            active_csv = max(csv_files, key=os.path.getmtime)
             file_size = os.path.getsize(active_csv)
+        except OSError as e:  # Rotated away between the lookup and the stat
+            return self._data_error_figure(e)
 
-            # Always read from the active file (the one being written to)
-            if file_size > 100:  # File has more than just headers
-                df = pd.read_csv(active_csv)
-
-                if not df.empty:
-                    # Check what columns we have and adapt accordingly
-                    if 'time_event' in df.columns and 'input' in df.columns:
-                        # Sort by time
-                        df = df.sort_values('time_event')
-
-                        # Add distance sensor data
-                        fig.add_trace(go.Scatter(
-                            x=df['time_event'],
-                            y=df['input'],
-                            mode='lines+markers',
-                            name=self.t('distance_label'),
-                            line=dict(color='blue'),
-                            marker=dict(size=4)
-                        ))
-
-                        # Add reference line if available
-                        if 'referencia' in df.columns:
-                            fig.add_trace(go.Scatter(
-                                x=df['time_event'],
-                                y=df['referencia'],
-                                mode='lines',
-                                name=self.t('reference_label'),
-                                line=dict(color='red', dash='dash')
-                            ))
-
-                        # Base layout configuration
-                        layout_config = dict(
-                            title=f'{title_prefix}{self.t("distance_data_realtime")} ({len(df)} {self.t("points")})',
-                            xaxis_title=self.t('time'),
-                            yaxis_title=self.t('distance_cm'),
-                            plot_bgcolor=self.colors['surface'],
-                            paper_bgcolor=self.colors['background'],
-                            font_color=self.colors['text'],
-                            showlegend=True,
-                            margin=dict(l=40, r=20, t=40, b=40)
-                        )
+        if file_size <= 100:
+            # File exists but is too small (just headers) - no need to involve pandas
+            fig = go.Figure()
+            fig.update_layout(
+                title=f"{self.t('waiting_data_file')} (Archivo: {os.path.basename(active_csv)})",
+                plot_bgcolor=self._c_surface,
+                paper_bgcolor=self._c_background,
+                font_color=self._c_text,
+                margin=GRAPH_MARGIN
+            )
+            return fig
 
-                        # Apply user zoom state if they have zoomed
-                        self._apply_zoom_state(layout_config, graph_id)
+        # Only the parse can fail on a half-written or malformed file (pandas errors are ValueErrors)
+        try:
+            df = self._read_csv_incremental(active_csv)
+        except (OSError, ValueError) as e:
+            return self._data_error_figure(e)
 
-                        fig.update_layout(**layout_config)
-                        return fig
+        if df.empty:
+            # CSV exists but is empty
+            return self._empty_figure('waiting_esp32_data')
 
-                    else:
-                        # Columns don't match expected format
-                        fig.update_layout(
-                            title=self.t('data_format_problem'),
-                            plot_bgcolor=self.colors['surface'],
-                            paper_bgcolor=self.colors['background'],
-                            font_color=self.colors['text'],
-                            margin=dict(l=40, r=20, t=40, b=40)
-                        )
-                        return fig
+        # Check what columns we have and adapt accordingly
+        if 'time_event' not in df.columns or 'input' not in df.columns:
+            return self._empty_figure('data_format_problem')
 
-                else:
-                    # CSV exists but is empty
-                    fig.update_layout(
-                        title=self.t('waiting_esp32_data'),
-                        plot_bgcolor=self.colors['surface'],
-                        paper_bgcolor=self.colors['background'],
-                        font_color=self.colors['text'],
-                        margin=dict(l=40, r=20, t=40, b=40)
-                    )
-                    return fig
+        # Plain float arrays skip pandas indexing and take Plotly's fast array encoding
+        try:
+            time_event = df['time_event'].to_numpy(dtype=np.float64)
+            distance = df['input'].to_numpy(dtype=np.float64)
+            reference = df['referencia'].to_numpy(dtype=np.float64) if 'referencia' in df.columns else None
+        except ValueError as e:  # Non-numeric rows (e.g. a repeated header)
+            return self._data_error_figure(e)
+
+        # Rows are appended in arrival order; only sort if UDP reordered some
+        if len(time_event) > 1 and np.any(time_event[1:] < time_event[:-1]):
+            order = np.argsort(time_event, kind='stable')
+            time_event, distance = time_event[order], distance[order]
+            if reference is not None:
+                reference = reference[order]
 
-            else:
-                # File exists but is too small (just headers)
-                fig.update_layout(
-                    title=f"{self.t('waiting_data_file')} (Archivo: {os.path.basename(active_csv)})",
-                    plot_bgcolor=self.colors['surface'],
-                    paper_bgcolor=self.colors['background'],
-                    font_color=self.colors['text'],
-                    margin=dict(l=40, r=20, t=40, b=40)
-                )
-                return fig
+        fig = go.Figure()
 
-        except Exception as e:
-            # Show error in graph title for debugging
-            print(f"Graph update error: {e}")
-            fig.update_layout(
-                title=f"{self.t('data_read_error')}: {str(e)}",
-                plot_bgcolor=self.colors['surface'],
-                paper_bgcolor=self.colors['background'],
-                font_color=self.colors['text'],
-                margin=dict(l=40, r=20, t=40, b=40)
-            )
-            return fig
+        # Add distance sensor data (downsampled to what the screen can show); numpy columns are
+        # serialized as binary typed arrays and drawn with WebGL like the realtime graph
+        distance_x, distance = downsample_series(time_event, distance)
+        fig.add_trace(go.Scattergl(
+            x=distance_x,
+            y=distance,
+            mode='lines+markers',
+            name=self.t('distance_label'),
+            line=dict(color='blue'),
+            marker=dict(size=4)
+        ))
+
+        # Add reference line if available
+        if reference is not None:
+            reference_x, reference = downsample_series(time_event, reference)
+            fig.add_trace(go.Scattergl(
+                x=reference_x,
+                y=reference,
+                mode='lines',
+                name=self.t('reference_label'),
+                line=dict(color='red', dash='dash')
+            ))
+
+        # Base layout configuration
+        layout_config = self._distance_layout(
+            f'{title_prefix}{self.t("distance_data_realtime")} ({len(df)} {self.t("points")})')
+
+        # Apply user zoom state if they have zoomed
+        self._apply_zoom_state(layout_config, graph_id)
+
+        fig.update_layout(**layout_config)
+        return fig
+
+    def _data_error_figure(self, error):
+        """Figure reporting a CSV read error in its title (for debugging)"""
+        print(f"Graph update error: {error}")
+        fig = go.Figure()
+        fig.update_layout(
+            title=f"{self.t('data_read_error')}: {str(error)}",
+            plot_bgcolor=self._c_surface,
+            paper_bgcolor=self._c_background,
+            font_color=self._c_text,
+            margin=GRAPH_MARGIN
+        )
+        return fig
 
     def _on_params_confirmed(self, confirmed_params):
         """Called when Arduino confirms parameter values via MQTT"""
@@ -1834,9 +2424,14 @@ class TrainControlDashboard:
             if value is not None:
                 self.confirmed_params[key] = value
 
+        # Format for the status display once here rather than on every render
+        self._confirmed_display = tuple(
+            f"{confirmed_params[key]:.1f}" if confirmed_params.get(key) is not None else 'N/A'
+            for key in CONFIRMED_DISPLAY_KEYS)
+
         # Store timestamp of last confirmation
         self.last_confirmation_time = time.time()
-        print(f"[{time.strftime('%H:%M:%S')}] Dashboard synced with Arduino parameters: {self.confirmed_params}")
+        logger.debug("Dashboard synced with Arduino parameters: %s", self.confirmed_params)
 
     def _get_parameter_status_display(self):
         """Generate parameter status display showing confirmed vs sent values"""
@@ -1848,10 +2443,18 @@ class TrainControlDashboard:
 
         # Check MQTT connection status
         mqtt_connected = self.mqtt_sync.connected if hasattr(self.mqtt_sync, 'connected') else False
-        confirmed = self.mqtt_sync.confirmed_params
+        shown = self._confirmed_display  # Replaced wholesale by _on_params_confirmed
+
+        # The display only changes with these inputs; reuse the component tree while they hold
+        cache_key = (self.current_language, mqtt_connected, shown)
+        display = self._status_cache.get(cache_key)
+        if display is not None:
+            return display
+        if len(self._status_cache) >= STATUS_CACHE_SIZE:
+            self._status_cache.clear()
 
         # Check if we have any confirmed parameters
-        has_confirmed = any(v is not None for v in confirmed.values())
+        has_confirmed = any(v != 'N/A' for v in shown)
 
         # Debug info with timestamp (comment out verbose debug logging)
         # current_time = time.strftime('%H:%M:%S')
@@ -1862,13 +2465,10 @@ class TrainControlDashboard:
         # print(f"[DEBUG {current_time}] Time since last confirmation: {time_since_confirm:.1f}s")
 
         if has_confirmed:
-            # Display confirmed parameters with better formatting
-            confirmed_kp = f"{confirmed['kp']:.1f}" if confirmed['kp'] is not None else 'N/A'
-            confirmed_ki = f"{confirmed['ki']:.1f}" if confirmed['ki'] is not None else 'N/A'
-            confirmed_kd = f"{confirmed['kd']:.1f}" if confirmed['kd'] is not None else 'N/A'
-            confirmed_ref = f"{confirmed['reference']:.1f}" if confirmed['reference'] is not None else 'N/A'
+            # Display confirmed parameters (already formatted to one decimal)
+            confirmed_kp, confirmed_ki, confirmed_kd, confirmed_ref = shown
 
-            return html.Div([
+            display = html.Div([
                 html.Strong(self.t('esp32_confirmed_parameters') + ": ", style={'color': self.colors['text'], 'fontSize': '14px'}),
                 html.Br(),
                 html.Span(f"Kp={confirmed_kp}, Ki={confirmed_ki}, Kd={confirmed_kd}, Ref={confirmed_ref}cm",
@@ -1878,50 +2478,188 @@ class TrainControlDashboard:
             ])
         else:
             connection_msg = self.t('connection_waiting_confirmation') if mqtt_connected else self.t('mqtt_not_connected')
-            return html.Div([
+            display = html.Div([
                 html.Strong(self.t('esp32_parameters') + ": ", style={'color': self.colors['text'], 'fontSize': '14px'}),
                 html.Br(),
                 html.Span(connection_msg, style={'color': self.colors['warning'], 'fontStyle': 'italic'})
             ])
+        self._status_cache[cache_key] = display
+        return display
+
+    def _connection_indicator(self, stats):
+        """Compact UDP status line shown above the realtime graph"""
+        # Status color and message based on connection (now translated)
+        if stats['status'] == 'Connected':
+            color = self.colors['success']
+            icon = '🟢'
+            status_text = self.t('connected')
+        elif stats['status'] == 'Connection lost':
+            color = self.colors['danger']
+            icon = '🔴'
+            status_text = self.t('connection_lost')
+        elif stats['total_packets'] > 0:
+            color = self.colors['success']
+            icon = '🟢'
+            status_text = self.t('receiving_data')
+        else:
+            color = self.colors['text']
+            icon = '🟡'
+            status_text = self.t('waiting_for_data_status')
 
-    def _get_pid_connection_status(self):
-        """Get compact MQTT parameter status for PID Control tab"""
-        if not hasattr(self, 'mqtt_sync') or not self.mqtt_sync:
-            return html.Span(self.t('mqtt_not_available'),
-                           style={'color': self.colors['warning'], 'fontSize': '13px'})
+        # Format last packet time with translation
+        last_time = stats['last_packet_time'] if stats['last_packet_time'] != "Never" else self.t('never')
 
-        confirmed = self.mqtt_sync.confirmed_params
-        has_confirmed = any(v is not None for v in confirmed.values())
+        return html.Div([
+            # UDP Connection status
+            html.Div([
+                html.Span(f"{icon} {status_text}",
+                         style={'color': color, 'fontWeight': 'bold', 'marginRight': '20px'}),
+                html.Span(f"{self.t('packets')}: {stats['total_packets']}",
+                         style={'color': self.colors['text'], 'marginRight': '20px'}),
+                html.Span(f"{self.t('last')}: {last_time}",
+                         style={'color': self.colors['text']})
+            ], style={'fontSize': '14px', 'marginBottom': '8px'})
+        ])
 
-        # Only print when parameters actually change, not every 200ms (reduced verbosity)
-        # timestamp = time.strftime('%H:%M:%S')
-        # if not hasattr(self, '_last_pid_params') or self._last_pid_params != confirmed:
-        #     print(f"[PID CONNECTION STATUS {timestamp}] DISPLAY UPDATED: {confirmed}")
-        #     self._last_pid_params = confirmed.copy()
+    def _detailed_connection_status(self, stats):
+        """Connection, packet and parameter summary for the data tab"""
+        if not self.data_manager.initialized:
+            return html.Div([
+                html.P(self.t('network_not_configured'), style={'color': self.colors['warning'], 'marginBottom': '5px'}),
+                html.P(self.t('go_to_network_tab'), style={'color': self.colors['text']})
+            ])
 
-        if has_confirmed:
-            # Format confirmed parameters compactly for PID tab
-            kp_val = f"{confirmed['kp']:.1f}" if confirmed['kp'] is not None else "?"
-            ki_val = f"{confirmed['ki']:.1f}" if confirmed['ki'] is not None else "?"
-            kd_val = f"{confirmed['kd']:.1f}" if confirmed['kd'] is not None else "?"
-            ref_val = f"{confirmed['reference']:.1f}" if confirmed['reference'] is not None else "?"
-
-            # Add timestamp to show when display was last updated
-            current_time = time.strftime('%H:%M:%S')
-            return html.Span([
-                self.t('esp32_label'),
-                html.Span(f"Kp={kp_val}, Ki={ki_val}, Kd={kd_val}, Ref={ref_val}cm",
-                         style={'color': self.colors['success'], 'fontWeight': 'bold'}),
-                html.Span(" ✓", style={'color': self.colors['success'], 'marginLeft': '5px'}),
-                html.Span(f" ({current_time})", style={'color': self.colors['text_light'], 'fontSize': '11px', 'marginLeft': '8px'})
-            ], style={'fontSize': '13px'})
-        else:
-            return html.Span(self.t('esp32_waiting_parameters'),
-                           style={'color': self.colors['warning'], 'fontSize': '13px'})
+        latest_data = self.data_manager.get_latest_data()
+
+        # Status sections
+        status_color = self.colors['success'] if stats['status'] == 'Connected' else self.colors['danger']
+
+        return html.Div([
+            # Connection status
+            html.Div([
+                html.Strong(self.t('status') + ": ", style={'color': self.colors['text']}),
+                html.Span(stats['status'], style={'color': status_color, 'fontWeight': 'bold'})
+            ], style={'marginBottom': '10px'}),
+
+            # Statistics
+            html.Div([
+                html.Div([
+                    html.Strong(self.t('total_packets_label') + ": ", style={'color': self.colors['text']}),
+                    html.Span(str(stats['total_packets']))
+                ], style={'display': 'inline-block', 'marginRight': '30px'}),
+
+                html.Div([
+                    html.Strong(self.t('last_received') + ": ", style={'color': self.colors['text']}),
+                    html.Span(stats['last_packet_time'])
+                ], style={'display': 'inline-block', 'marginRight': '30px'}),
+
+                html.Div([
+                    html.Strong(self.t('experiment_label') + ": ", style={'color': self.colors['text']}),
+                    html.Span(self.t('active') if stats['experiment_active'] else self.t('stopped'),
+                            style={'color': self.colors['success'] if stats['experiment_active'] else self.colors['text']})
+                ], style={'display': 'inline-block'})
+            ], style={'marginBottom': '10px'}),
+
+            # Latest data
+            html.Div([
+                html.Strong(self.t('latest_data') + ": ", style={'color': self.colors['text']}),
+                html.Span(latest_data.get('full_data', self.t('no_data_received')) if latest_data else self.t('no_data_received'),
+                        style={'fontFamily': 'monospace', 'backgroundColor': '#f1f1f1', 'padding': '2px 5px', 'borderRadius': '3px'})
+            ]) if latest_data else html.Div([
+                html.Strong(self.t('latest_data') + ": ", style={'color': self.colors['text']}),
+                html.Span(self.t('no_data_received'), style={'color': self.colors['warning']})
+            ]),
+
+            # MQTT Parameter Status
+            html.Div([
+                html.Hr(style={'margin': '15px 0'}),
+                self._get_parameter_status_display()
+            ], style={'marginTop': '15px'})
+        ])
+
+    def _historical_version(self):
+        """Everything the historical figure depends on; the CSV size acts as its data version"""
+        active_csv = self._find_active_csv('pid') if self.data_manager.initialized else None
+        try:
+            size = os.path.getsize(active_csv) if active_csv else None
+        except OSError:
+            size = None
+        return repr((self.data_manager.initialized, active_csv, size, self.current_language,
+                     tuple(self.zoom_state['historical-graph'].values())))
+
+    def _csv_path_text(self):
+        """Path and size of the CSV the data tab is reading"""
+        # Show the actual active file being read from
+        active_csv = self._find_active_csv('pid')
+        if active_csv:
+            file_size = os.path.getsize(active_csv)
+            return f"{active_csv} ({file_size} bytes)"
+        return self.t('configure_network_enable_logging')
+
+    def _pid_status_payload(self):
+        """Data for the PID tab's compact MQTT parameter line, rendered in the browser"""
+        colors = {name: self.colors[name] for name in ('success', 'warning', 'text_light')}
+        if not hasattr(self, 'mqtt_sync') or not self.mqtt_sync:
+            return {'key': [self.current_language, 'unavailable'], 'state': 'unavailable',
+                    'text': self.t('mqtt_not_available'), 'colors': colors}
+
+        confirmed = self.mqtt_sync.confirmed_params
+        if not any(v is not None for v in confirmed.values()):
+            return {'key': [self.current_language, 'waiting'], 'state': 'waiting',
+                    'text': self.t('esp32_waiting_parameters'), 'colors': colors}
+
+        # Format confirmed parameters compactly for PID tab
+        kp_val = f"{confirmed['kp']:.1f}" if confirmed['kp'] is not None else "?"
+        ki_val = f"{confirmed['ki']:.1f}" if confirmed['ki'] is not None else "?"
+        kd_val = f"{confirmed['kd']:.1f}" if confirmed['kd'] is not None else "?"
+        ref_val = f"{confirmed['reference']:.1f}" if confirmed['reference'] is not None else "?"
+        params = f"Kp={kp_val}, Ki={ki_val}, Kd={kd_val}, Ref={ref_val}cm"
+        return {'key': [self.current_language, params], 'state': 'confirmed', 'label': self.t('esp32_label'),
+                'params': params, 'time': format_clock(), 'colors': colors}
+
+    def _event_stream_path(self):
+        """URL of this dashboard's event stream (train-prefixed in multi-train mode)"""
+        return f"/sse/{self._make_id('events')}"
+
+    def _event_stream(self):
+        """Server-Sent Events: 'pid' per ESP32 confirmation, 'data' when new data is queued; nothing while idle"""
+        if not _SSE_SLOTS.acquire(blocking=False):
+            print(f"[SSE] Refusing event stream: {SSE_MAX_STREAMS} streams already open")
+            return Response(status=503, headers={'Retry-After': str(int(SSE_REFUSED_RETRY))})
+
+        def generate():
+            confirmed = watched = None
+            pushed = count = self.websocket_message_count
+            deadline = time.monotonic() + SSE_MAX_LIFETIME
+            yield "retry: 2000\n\n"
+            while time.monotonic() < deadline:
+                # Confirmations also push a queue message (mqtt_update), which wakes the wait below
+                sync = self.mqtt_sync
+                if sync is not watched:  # Reconnected with a new client: resend the current state
+                    confirmed, watched = None, sync
+                if sync is not None and sync.confirmation_count != confirmed:
+                    confirmed = sync.confirmation_count
+                    yield f"event: pid\ndata: {json.dumps(self._pid_status_payload())}\n\n"
+
+                if count != pushed:
+                    yield f"event: data\ndata: {json.dumps({'count': count})}\n\n"
+                    pushed = count
+                    time.sleep(SSE_DATA_MIN_INTERVAL)
+
+                wait = min(SSE_KEEPALIVE, max(deadline - time.monotonic(), 0))
+                count = self._wait_for_websocket_message(pushed, wait)
+                if count == pushed:
+                    yield ": keepalive\n\n"  # A write to a closed tab ends this generator
+
+        response = Response(generate(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        # Runs when the server closes the response: stream ended, or the tab went away
+        response.call_on_close(_SSE_SLOTS.release)
+        return response
 
     def t(self, key):
         """Get translation for current language"""
-        return self.translations[self.current_language].get(key, key)
+        return translate(self.current_language, key)
     
     def switch_experiment_mode(self, new_mode):
         """Safely switch between PID, Step Response, and Deadband experiment modes"""
@@ -1938,16 +2676,16 @@ class TrainControlDashboard:
                     # Stop current mode on ESP32 first
                     if self.experiment_mode == 'pid':
                         print("[MODE SWITCH] Stopping PID mode on ESP32...")
-                        publish.single(self.get_topic('sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish(self.get_topic('sync'), MQTT_PAYLOAD_FALSE)
                         time.sleep(0.3)
                     elif self.experiment_mode == 'step':
                         print("[MODE SWITCH] Stopping Step Response mode on ESP32...")
-                        publish.single(self.get_topic('step_sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish(self.get_topic('step_sync'), MQTT_PAYLOAD_FALSE)
                         time.sleep(0.3)
                     elif self.experiment_mode == 'deadband':
                         print("[MODE SWITCH] Stopping Deadband mode on ESP32...")
                         # Stop deadband sync if implemented
-                        # publish.single(self.get_topic('deadband_sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                        # self._publish(self.get_topic('deadband_sync'), MQTT_PAYLOAD_FALSE)
                         time.sleep(0.3)
 
                     # Send default parameters and request confirmation for new mode
@@ -1959,15 +2697,17 @@ class TrainControlDashboard:
                         default_direction = 1  # Forward
                         default_vbatt = 8.4
 
-                        publish.single(self.get_topic('step_amplitude'), str(default_amplitude), hostname=self.network_manager.mqtt_broker_ip)
-                        publish.single(self.get_topic('step_time'), str(default_duration), hostname=self.network_manager.mqtt_broker_ip)
-                        publish.single(self.get_topic('step_direction'), str(default_direction), hostname=self.network_manager.mqtt_broker_ip)
-                        publish.single(self.get_topic('step_vbatt'), str(default_vbatt), hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish_many([
+                            (self.get_topic('step_amplitude'), encode_mqtt_number(default_amplitude)),
+                            (self.get_topic('step_time'), encode_mqtt_number(default_duration)),
+                            (self.get_topic('step_direction'), encode_mqtt_number(default_direction)),
+                            (self.get_topic('step_vbatt'), encode_mqtt_number(default_vbatt)),
+                        ])
                         print(f"[MODE SWITCH] Sent defaults: amp={default_amplitude}V, time={default_duration}s, dir={default_direction}, vbatt={default_vbatt}V")
                         time.sleep(0.3)  # Wait for ESP32 to process and confirm
                     elif new_mode == 'pid':
                         print("[MODE SWITCH] Requesting current PID parameters from ESP32...")
-                        publish.single(self.get_topic('request_params'), '1', hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish(self.get_topic('request_params'), MQTT_PAYLOAD_REQUEST)
                         time.sleep(0.2)
                     # Deadband mode doesn't need parameter request
 
@@ -1984,23 +2724,15 @@ class TrainControlDashboard:
                 time.sleep(0.5)  # Give time for thread to stop
 
             # Clear data queues
-            while not self.data_manager.data_queue.empty():
-                try:
-                    self.data_manager.data_queue.get_nowait()
-                except:
-                    pass
-
-            while not self.step_data_manager.data_queue.empty():
-                try:
-                    self.step_data_manager.data_queue.get_nowait()
-                except:
-                    pass
+            self.data_manager.data_queue.clear()
+            self.step_data_manager.data_queue.clear()
 
             # Switch data manager based on mode
             if new_mode == 'step':
                 print("[MODE SWITCH] Switching to Step Response mode")
                 # Create new CSV for step response
                 csv_path = self.step_data_manager.create_step_csv()
+                self._active_csv.clear()
                 print(f"[MODE SWITCH] Created step response CSV: {csv_path}")
 
                 # Set UDP receiver to use step data manager
@@ -2028,6 +2760,7 @@ class TrainControlDashboard:
                 csv_filename = f"experiment_{timestamp}.csv"
                 csv_path = os.path.join(os.getcwd(), csv_filename)
                 self.data_manager.set_csv_file(csv_path)
+                self._active_csv.clear()
                 print(f"[MODE SWITCH] Created PID CSV: {csv_path}")
 
                 # Set UDP receiver to use regular data manager
@@ -2052,18 +2785,16 @@ class TrainControlDashboard:
             return True
 
     def _push_websocket_message(self, message):
-        """Push message to WebSocket queue"""
-        try:
-            self.websocket_messages.put_nowait(message)
-        except queue.Full:
-            pass  # Drop message if queue is full
-    
-    def _get_websocket_message(self):
-        """Get message from WebSocket queue (non-blocking)"""
-        try:
-            return self.websocket_messages.get_nowait()
-        except queue.Empty:
-            return None
+        """Count a push notification from a data source or MQTT and wake the event streams"""
+        with self.websocket_message_pushed:
+            self.websocket_message_count += 1
+            self.websocket_message_pushed.notify_all()
+
+    def _wait_for_websocket_message(self, seen, timeout):
+        """Block until websocket_message_count differs from `seen` (or timeout); return the current count"""
+        with self.websocket_message_pushed:
+            self.websocket_message_pushed.wait_for(lambda: self.websocket_message_count != seen, timeout)
+            return self.websocket_message_count
 
     def _initialize_mqtt_sync(self):
         """
@@ -2135,12 +2866,22 @@ class TrainControlDashboard:
         self.layout = html.Div([
 
             dcc.Store(id=self._make_id('language-store'), data={'language': 'es'}),
+            dcc.Store(id=self._make_id('language-strings'), data=self._language_strings()),
             dcc.Store(id=self._make_id('network-config-store'), data={}),
             dcc.Store(id=self._make_id('mqtt-params-store'), data={'last_update': 0}),
+            dcc.Store(id=self._make_id('pid-confirmed-store')),
+            dcc.Store(id=self._make_id('event-stream-config'),
+                      data={'url': self._event_stream_path(), 'retry': int(SSE_REFUSED_RETRY * 1000),
+                            'fallback': self._make_id('fast-update-check'),
+                            'stores': {'pid': self._make_id('pid-confirmed-store'),
+                                       'data': self._make_id('ws-message-store')}}),
+            # Validated typed values from the send buttons (see SEND_GATE_CLIENTSIDE_JS)
+            *[dcc.Store(id=self._make_id(f'{name}-send-store')) for name in TYPED_SEND_CONTROLS],
             
-            # Data availability trigger for efficient updates
+            # Data availability trigger for efficient updates (written by the event stream's data events)
             dcc.Store(id=self._make_id('ws-message-store'), data={}),
-            dcc.Interval(id=self._make_id('fast-update-check'), interval=100, n_intervals=0),  # 100ms check for new data
+            # Fallback 100ms check, disabled by the page while its event stream is open
+            dcc.Interval(id=self._make_id('fast-update-check'), interval=100, n_intervals=0),
 
             # Global data refresh interval (always present)
             dcc.Interval(
@@ -2189,10 +2930,7 @@ class TrainControlDashboard:
                               style={'color': 'white', 'marginRight': '10px', 'fontSize': '14px'}),
                     dcc.Dropdown(
                         id=self._make_id('language-dropdown'),
-                        options=[
-                            {'label': '🇪🇸 Español', 'value': 'es'},
-                            {'label': '🇺🇸 English', 'value': 'en'}
-                        ],
+                        options=LANGUAGE_OPTIONS,
                         value=self.current_language,
                         style={
                             'width': '120px',
@@ -2231,13 +2969,7 @@ class TrainControlDashboard:
             ]),
 
             # Tabs - Simple design matching minimal working example (NO custom styles)
-            dcc.Tabs(id=self._make_id('main-tabs'), value='control-tab', children=[
-                dcc.Tab(label=self.t('network_tab'), value='network-tab'),
-                dcc.Tab(label=self.t('deadband_tab'), value='deadband-tab'),
-                dcc.Tab(label=self.t('control_tab'), value='control-tab'),
-                dcc.Tab(label=self.t('step_response_tab'), value='step-response-tab'),
-                dcc.Tab(label=self.t('data_tab'), value='data-tab')
-            ]),
+            dcc.Tabs(id=self._make_id('main-tabs'), value='control-tab', children=self._main_tabs()),
 
             # Experiment mode store
             dcc.Store(id=self._make_id('experiment-mode-store'), data={'mode': 'pid'}),
@@ -2256,9 +2988,74 @@ class TrainControlDashboard:
             self.app.layout = self.layout
         # Multi-train mode - layout stored but not assigned to shared app
 
+    def _single_flight(self, func):
+        """Callback decorator: drop an interval tick while the previous call of the same callback is still running
+
+        Ticks that arrive while a slow call is in progress would otherwise queue up behind it.
+        Calls triggered by anything other than an Interval (zoom, language, clicks) always run.
+        """
+        in_flight = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not in_flight.acquire(blocking=False):
+                if all(t['prop_id'].endswith('.n_intervals') for t in callback_context.triggered):
+                    raise PreventUpdate
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                in_flight.release()
+        return wrapper
+
+    def _mode_badge(self, active_tab):
+        """Header badge naming the experiment mode of the active tab (one component per tab)"""
+        badge = self._mode_badges.get(active_tab)
+        if badge is None:
+            mode_text, badge_color = MODE_BADGES.get(active_tab, MODE_BADGES['control-tab'])
+            badge = self._mode_badges[active_tab] = html.Span(mode_text, style={
+                'backgroundColor': badge_color,
+                'color': 'white',
+                'padding': '3px 8px',
+                'borderRadius': '12px',
+                'fontSize': '12px',
+                'fontWeight': 'bold',
+                'marginLeft': '15px',
+                'verticalAlign': 'middle',
+                'transition': 'all 0.3s ease'
+            })
+        return badge
+
+    def _main_tabs(self):
+        """Main tab headers for the current language, built once per language"""
+        tabs = self._tabs_by_lang.get(self.current_language)
+        if tabs is None:
+            tabs = self._tabs_by_lang[self.current_language] = [
+                dcc.Tab(label=self.t(label_key), value=value) for label_key, value in MAIN_TABS]
+        return tabs
+
+    @staticmethod
+    def _language_strings():
+        """Header texts and tab labels for every selectable language (shipped once in the layout)"""
+        return {option['value']: {'header': [translate(option['value'], key) for key in LANGUAGE_HEADER_KEYS],
+                                  'tabs': [[translate(option['value'], key), value] for key, value in MAIN_TABS]}
+                for option in LANGUAGE_OPTIONS}
+
+    def _cached_tab(self, tab_name, builder):
+        """Tab layout built once per language and shared afterwards (Dash only serializes it)
+
+        Only for tabs that depend on nothing but the language; the network tab lists live
+        interfaces and is always rebuilt.
+        """
+        cache_key = (self.current_language, tab_name)
+        layout = self._tab_layouts.get(cache_key)
+        if layout is None:
+            layout = self._tab_layouts[cache_key] = builder()
+        return layout
+
     def create_network_tab(self):
         """Create network configuration tab content"""
-        # Force fresh interface detection when creating the tab
+        # Interface scan is reused for NETWORK_IFADDRS_TTL; the Refresh button forces a new one
         self.network_manager.detect_interfaces()
         current_options = self.network_manager.get_interface_options()
         print(f"[CREATE_NETWORK_TAB] Got {len(current_options)} options for dropdown:")
@@ -2351,9 +3148,9 @@ class TrainControlDashboard:
                         # Kp slider + input
                         html.Div([
                             html.Div([
-                                html.Label(f"{self.t('kp_label')}: ", style={'fontWeight': '500', 'color': self.colors['text'], 'fontSize': '12px', 'marginBottom': '4px'}),
+                                html.Label(f"{self.t('kp_label')}: ", style=STYLE_LABEL_SMALL),
                                 html.Div([
-                                    dcc.Input(id=self._make_id('kp-input'), type='number', value=0, min=0, max=250, step=0.1,
+                                    dcc.Input(id=self._make_id('kp-input'), type='number', debounce=True, value=0, min=0, max=250, step=0.1,
                                              style={'width': '70px', 'height': '24px', 'fontSize': '11px', 'padding': '2px 4px', 'marginRight': '4px'}),
                                     html.Button(self.t('send_button'), id=self._make_id('kp-send-btn'), n_clicks=0,
                                                style={'height': '24px', 'fontSize': '10px', 'padding': '0 6px', 'backgroundColor': self.colors['accent'],
@@ -2362,6 +3159,7 @@ class TrainControlDashboard:
                             ], style={'marginBottom': '6px'}),
                             dcc.Slider(
                                 id=self._make_id('kp-slider'),
+                                updatemode='mouseup',  # publish once on release, not on every drag step
                                 min=0, max=150, value=0, step=0.1,
                                 marks={i*100: str(i*100) for i in range(3)},
                                 tooltip={'placement': 'bottom', 'always_visible': False}
@@ -2371,9 +3169,9 @@ class TrainControlDashboard:
                         # Ki slider + input
                         html.Div([
                             html.Div([
-                                html.Label(f"{self.t('ki_label')}: ", style={'fontWeight': '500', 'color': self.colors['text'], 'fontSize': '12px', 'marginBottom': '4px'}),
+                                html.Label(f"{self.t('ki_label')}: ", style=STYLE_LABEL_SMALL),
                                 html.Div([
-                                    dcc.Input(id=self._make_id('ki-input'), type='number', value=0, min=0, max=250, step=0.1,
+                                    dcc.Input(id=self._make_id('ki-input'), type='number', debounce=True, value=0, min=0, max=250, step=0.1,
                                              style={'width': '70px', 'height': '24px', 'fontSize': '11px', 'padding': '2px 4px', 'marginRight': '4px'}),
                                     html.Button(self.t('send_button'), id=self._make_id('ki-send-btn'), n_clicks=0,
                                                style={'height': '24px', 'fontSize': '10px', 'padding': '0 6px', 'backgroundColor': self.colors['accent'],
@@ -2382,6 +3180,7 @@ class TrainControlDashboard:
                             ], style={'marginBottom': '6px'}),
                             dcc.Slider(
                                 id=self._make_id('ki-slider'),
+                                updatemode='mouseup',
                                 min=0, max=150, value=0, step=0.1,
                                 marks={i*100: str(i*100) for i in range(3)},
                                 tooltip={'placement': 'bottom', 'always_visible': False}
@@ -2391,9 +3190,9 @@ class TrainControlDashboard:
                         # Kd slider + input
                         html.Div([
                             html.Div([
-                                html.Label(f"{self.t('kd_label')}: ", style={'fontWeight': '500', 'color': self.colors['text'], 'fontSize': '12px', 'marginBottom': '4px'}),
+                                html.Label(f"{self.t('kd_label')}: ", style=STYLE_LABEL_SMALL),
                                 html.Div([
-                                    dcc.Input(id=self._make_id('kd-input'), type='number', value=0, min=0, max=250, step=0.1,
+                                    dcc.Input(id=self._make_id('kd-input'), type='number', debounce=True, value=0, min=0, max=250, step=0.1,
                                              style={'width': '70px', 'height': '24px', 'fontSize': '11px', 'padding': '2px 4px', 'marginRight': '4px'}),
                                     html.Button(self.t('send_button'), id=self._make_id('kd-send-btn'), n_clicks=0,
                                                style={'height': '24px', 'fontSize': '10px', 'padding': '0 6px', 'backgroundColor': self.colors['accent'],
@@ -2402,6 +3201,7 @@ class TrainControlDashboard:
                             ], style={'marginBottom': '6px'}),
                             dcc.Slider(
                                 id=self._make_id('kd-slider'),
+                                updatemode='mouseup',
                                 min=0, max=150, value=0, step=0.1,
                                 marks={i*100: str(i*100) for i in range(3)},
                                 tooltip={'placement': 'bottom', 'always_visible': False}
@@ -2411,9 +3211,9 @@ class TrainControlDashboard:
                         # Reference distance + input
                         html.Div([
                             html.Div([
-                                html.Label(f"{self.t('ref_label')}: ", style={'fontWeight': '500', 'color': self.colors['text'], 'fontSize': '12px', 'marginBottom': '4px'}),
+                                html.Label(f"{self.t('ref_label')}: ", style=STYLE_LABEL_SMALL),
                                 html.Div([
-                                    dcc.Input(id=self._make_id('ref-input'), type='number', value=10, min=1, max=100, step=0.5,
+                                    dcc.Input(id=self._make_id('ref-input'), type='number', debounce=True, value=10, min=1, max=100, step=0.5,
                                              style={'width': '70px', 'height': '24px', 'fontSize': '11px', 'padding': '2px 4px', 'marginRight': '4px'}),
                                     html.Button(self.t('send_button'), id=self._make_id('ref-send-btn'), n_clicks=0,
                                                style={'height': '24px', 'fontSize': '10px', 'padding': '0 6px', 'backgroundColor': self.colors['accent'],
@@ -2422,6 +3222,7 @@ class TrainControlDashboard:
                             ], style={'marginBottom': '6px'}),
                             dcc.Slider(
                                 id=self._make_id('reference-slider'),
+                                updatemode='mouseup',
                                 min=1, max=100, value=10, step=0.5,
                                 marks={i*50: f"{i*50}" for i in range(3)},
                                 tooltip={'placement': 'bottom', 'always_visible': False}
@@ -2434,7 +3235,13 @@ class TrainControlDashboard:
                     # Connection Status Card
                     html.Div([
                         html.H4(self.t('connection_status'), style={'color': self.colors['primary'], 'marginBottom': '15px'}),
-                        html.Div(id=self._make_id('connection-status-indicator'), style={'marginBottom': '10px'}),
+                        html.Div(id=self._make_id('connection-status-indicator')),
+                        # Inputs of the indicator the browser already shows (see refresh_control_tab)
+                        dcc.Store(id=self._make_id('connection-status-sync')),
+                        # MQTT Parameter Status - shows current ESP32 values, rendered clientside
+                        html.Div(id=self._make_id('pid-params-status'),
+                                 style={'fontSize': '14px', 'borderTop': '1px solid #eee', 'paddingTop': '8px',
+                                        'marginBottom': '10px'}),
                         html.Div(id=self._make_id('data-status'), style={'color': self.colors['text_light'], 'fontSize': '14px'})
                     ], style={'background': 'white', 'padding': '20px', 'borderRadius': '12px',
                              'boxShadow': '0 2px 8px rgba(0,0,0,0.1)', 'marginBottom': '20px'}),
@@ -2469,7 +3276,10 @@ class TrainControlDashboard:
                         html.H4(self.t('realtime_graph'), style={'textAlign': 'center', 'color': self.colors['primary'], 'marginBottom': '8px', 'fontSize': '16px'}),
                         dcc.Graph(id=self._make_id('realtime-graph'),
                                  figure=px.line(),
-                                 style={'height': '350px'})
+                                 style={'height': '350px'}),
+                        # What the browser's realtime figure already holds (see _realtime_graph_update)
+                        dcc.Store(id=self._make_id('realtime-graph-sync')),
+                        dcc.Store(id=self._make_id('realtime-graph-zoom'))
                     ], style={'background': 'white', 'padding': '12px', 'borderRadius': '8px',
                              'boxShadow': '0 1px 4px rgba(0,0,0,0.1)', 'marginBottom': '12px'})
                 ], style={'width': '65%'})
@@ -2494,7 +3304,10 @@ class TrainControlDashboard:
                 html.H4(self.t('historical_data'), style={'color': self.colors['text']}),
                 html.P(self.t('data_current_session'),
                       style={'color': self.colors['text']}),
-                dcc.Graph(id=self._make_id('historical-graph'), figure=px.line())
+                dcc.Graph(id=self._make_id('historical-graph'), figure=px.line()),
+                # Data version of the browser's historical figure (see _historical_version)
+                dcc.Store(id=self._make_id('historical-graph-sync')),
+                dcc.Store(id=self._make_id('historical-graph-zoom'))
             ], style={'marginBottom': '20px'}),
 
             # File information and download
@@ -2540,9 +3353,9 @@ class TrainControlDashboard:
                         html.Div([
                             html.Div([
                                 html.Label(f"{self.t('step_amplitude')}", 
-                                         style={'fontWeight': '500', 'fontSize': '13px'}),
+                                         style=STYLE_LABEL_FIELD),
                                 html.Div([
-                                    dcc.Input(id=self._make_id('amplitude-input'), type='number',
+                                    dcc.Input(id=self._make_id('amplitude-input'), type='number', debounce=True,
                                             value=3.0, min=0, max=8.4, step=0.1,
                                             style={'width': '60px', 'height': '28px', 'fontSize': '12px',
                                                   'padding': '4px', 'marginRight': '6px'}),
@@ -2554,7 +3367,7 @@ class TrainControlDashboard:
                                 ], style={'display': 'flex', 'alignItems': 'center'})
                             ], style={'display': 'flex', 'alignItems': 'center', 'justifyContent': 'space-between',
                                      'marginBottom': '8px'}),
-                            dcc.Slider(id=self._make_id('amplitude-slider'), min=0, max=8.4, value=3.0, step=0.1,
+                            dcc.Slider(id=self._make_id('amplitude-slider'), updatemode='mouseup', min=0, max=8.4, value=3.0, step=0.1,
                                      marks={i: f'{i}V' for i in range(0, 9, 2)},
                                      tooltip={'placement': 'bottom', 'always_visible': True})
                         ], style={'marginBottom': '15px', 'padding': '10px', 'backgroundColor': '#f8f9fa', 
@@ -2564,9 +3377,9 @@ class TrainControlDashboard:
                         html.Div([
                             html.Div([
                                 html.Label(f"{self.t('step_duration')}", 
-                                         style={'fontWeight': '500', 'fontSize': '13px'}),
+                                         style=STYLE_LABEL_FIELD),
                                 html.Div([
-                                    dcc.Input(id=self._make_id('duration-input'), type='number',
+                                    dcc.Input(id=self._make_id('duration-input'), type='number', debounce=True,
                                             value=2.0, min=0.5, max=5.0, step=0.1,
                                             style={'width': '60px', 'height': '28px', 'fontSize': '12px',
                                                   'padding': '4px', 'marginRight': '6px'}),
@@ -2578,7 +3391,7 @@ class TrainControlDashboard:
                                 ], style={'display': 'flex', 'alignItems': 'center'})
                             ], style={'display': 'flex', 'alignItems': 'center', 'justifyContent': 'space-between',
                                      'marginBottom': '8px'}),
-                            dcc.Slider(id=self._make_id('duration-slider'), min=0.5, max=5.0, value=2.0, step=0.1,
+                            dcc.Slider(id=self._make_id('duration-slider'), updatemode='mouseup', min=0.5, max=5.0, value=2.0, step=0.1,
                                      marks={0.5: '0.5s', 1: '1s', 2: '2s', 3: '3s', 4: '4s', 5: '5s'},
                                      tooltip={'placement': 'bottom', 'always_visible': True})
                         ], style={'marginBottom': '15px', 'padding': '10px', 'backgroundColor': '#f8f9fa',
@@ -2587,8 +3400,7 @@ class TrainControlDashboard:
                         # Motor Direction - simplified radio buttons
                         html.Div([
                             html.Label(f"{self.t('motor_direction')}", 
-                                     style={'fontWeight': '500', 'fontSize': '13px', 'marginBottom': '8px',
-                                           'display': 'block'}),
+                                     style=STYLE_LABEL_BLOCK),
                             dcc.RadioItems(
                                 id=self._make_id('direction-radio'),
                                 options=[
@@ -2608,7 +3420,7 @@ class TrainControlDashboard:
                             html.Label(f"{self.t('battery_voltage')}: 8.4V", 
                                      style={'fontSize': '11px', 'color': '#6b7280', 'marginBottom': '5px',
                                            'display': 'block'}),
-                            dcc.Slider(id=self._make_id('vbatt-slider'), min=7.0, max=8.4, value=8.4, step=0.1,
+                            dcc.Slider(id=self._make_id('vbatt-slider'), updatemode='mouseup', min=7.0, max=8.4, value=8.4, step=0.1,
                                      marks={7.0: '7.0V', 8.4: '8.4V'},
                                      tooltip={'placement': 'bottom', 'always_visible': False})
                         ], style={'marginBottom': '15px'}),
@@ -2680,8 +3492,7 @@ class TrainControlDashboard:
                     # Direction
                     html.Div([
                         html.Label(f"{self.t('deadband_direction')}:",
-                                 style={'fontWeight': '500', 'fontSize': '13px', 'marginBottom': '8px',
-                                       'display': 'block'}),
+                                 style=STYLE_LABEL_BLOCK),
                         dcc.RadioItems(
                             id=self._make_id('deadband-direction-radio'),
                             options=[
@@ -2699,8 +3510,7 @@ class TrainControlDashboard:
                     # Motion Threshold
                     html.Div([
                         html.Label(f"{self.t('motion_threshold')}:",
-                                 style={'fontWeight': '500', 'fontSize': '13px', 'marginBottom': '8px',
-                                       'display': 'block'}),
+                                 style=STYLE_LABEL_BLOCK),
                         dcc.Input(id=self._make_id('deadband-threshold-input'), type='number',
                                 value=0.08, min=0.01, max=1.0, step=0.01,
                                 style={'width': '80px', 'height': '28px', 'fontSize': '12px',
@@ -2813,52 +3623,24 @@ class TrainControlDashboard:
     def setup_callbacks(self):
         """Setup all dashboard callbacks"""
 
-        # Fast data availability check - triggers updates when new data arrives
+        # Fallback data availability check while the page has no open event stream: compares the
+        # push count with what this page last saw (nothing is drained, so every tab sees every push)
         @self.app.callback(
             Output(self._make_id('ws-message-store'), 'data'),
             Input(self._make_id('fast-update-check'), 'n_intervals'),
+            State(self._make_id('ws-message-store'), 'data'),
             prevent_initial_call=True
         )
-        def check_data_availability(n):
-            """Check if new data is available and trigger updates"""
-            # Try to get message from queue (non-blocking)
-            message = self._get_websocket_message()
-            if message:
-                return {'timestamp': time.time(), 'message': message, 'n': n}
-            raise PreventUpdate
-
-        # Mode indicator update callback
-        @self.app.callback(
-            Output(self._make_id('mode-indicator'), 'children'),
-            [Input(self._make_id('main-tabs'), 'value'),
-             Input(self._make_id('language-store'), 'data')]
-        )
-        def update_mode_indicator(active_tab, language_data):
-            """Update the mode indicator badge based on active tab"""
-            if active_tab == 'step-response-tab':
-                mode_text = 'Step Response'
-                badge_color = '#28A745'
-            elif active_tab == 'deadband-tab':
-                mode_text = 'Deadband Cal'
-                badge_color = '#FFA500'  # Orange
-            else:
-                mode_text = 'PID Control'
-                badge_color = '#007BFF'  # Green for step, blue for PID
-            
-            return html.Span(mode_text, style={
-                'backgroundColor': badge_color,
-                'color': 'white',
-                'padding': '3px 8px',
-                'borderRadius': '12px',
-                'fontSize': '12px',
-                'fontWeight': 'bold',
-                'marginLeft': '15px',
-                'verticalAlign': 'middle',
-                'transition': 'all 0.3s ease'
-            })
+        @self._single_flight
+        def check_data_availability(n, seen):
+            count = self.websocket_message_count
+            if seen and seen.get('count') == count:
+                raise PreventUpdate
+            return {'count': count}
 
-        # Language change callback
-        @self.app.callback(
+        # Language change: header and tab labels are swapped in the browser (no round trip)
+        self.app.clientside_callback(
+            LANGUAGE_CLIENTSIDE_JS,
             [Output(self._make_id('language-store'), 'data'),
              Output(self._make_id('app-title'), 'children'),
              Output(self._make_id('app-subtitle'), 'children'),
@@ -2866,40 +3648,18 @@ class TrainControlDashboard:
              Output(self._make_id('start-experiment-btn'), 'children'),
              Output(self._make_id('stop-experiment-btn'), 'children'),
              Output(self._make_id('main-tabs'), 'children')],
-             Input(self._make_id('language-dropdown'), 'value')
+            Input(self._make_id('language-dropdown'), 'value'),
+            State(self._make_id('language-strings'), 'data')
         )
-        def change_language(selected_language):
-            self.current_language = selected_language
-            self.network_manager.set_language(selected_language)
-            return (
-                {'language': selected_language},
-                self.t('title'),
-                self.t('subtitle'),
-                self.t('language'),
-                self.t('start_experiment'),
-                self.t('stop_experiment'),
-                [
-                    dcc.Tab(label=self.t('network_tab'), value='network-tab'),
-                    dcc.Tab(label=self.t('deadband_tab'), value='deadband-tab'),
-                    dcc.Tab(label=self.t('control_tab'), value='control-tab'),
-                    dcc.Tab(label=self.t('step_response_tab'), value='step-response-tab'),
-                    dcc.Tab(label=self.t('data_tab'), value='data-tab')
-                ]
-            )
 
-        # Slider value display callbacks
+        # The server keeps following the selected language (server-rendered text, saved config)
         @self.app.callback(
-            [Output('kp-value', 'children'),
-             Output('ki-value', 'children'),
-             Output('kd-value', 'children'),
-             Output('ref-value', 'children')],
-            [Input(self._make_id('kp-slider'), 'value'),
-             Input(self._make_id('ki-slider'), 'value'),
-             Input(self._make_id('kd-slider'), 'value'),
-             Input(self._make_id('reference-slider'), 'value')]
+            Input(self._make_id('language-store'), 'data')
         )
-        def update_slider_values(kp, ki, kd, ref):
-            return f"{kp:.1f}", f"{ki:.1f}", f"{kd:.1f}", f"{ref:.1f}cm"
+        def change_language(language_data):
+            if language_data and 'language' in language_data:
+                self.current_language = language_data['language']
+                self.network_manager.set_language(language_data['language'])
 
         # Track active tab for experiment mode
         @self.app.callback(
@@ -2923,11 +3683,11 @@ class TrainControlDashboard:
                     if self.experiment_mode == 'pid' and self.data_manager.experiment_active:
                         print(f"[MODE SWITCH] Stopping PID experiment before switching to {new_mode}")
                         self.data_manager.stop_experiment()
-                        publish.single(self.get_topic('sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish(self.get_topic('sync'), MQTT_PAYLOAD_FALSE)
                     elif self.experiment_mode == 'step' and self.step_data_manager.experiment_active:
                         print(f"[MODE SWITCH] Stopping Step Response experiment before switching to {new_mode}")
                         self.step_data_manager.stop_experiment()
-                        publish.single(self.get_topic('step_sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish(self.get_topic('step_sync'), MQTT_PAYLOAD_FALSE)
                     elif self.experiment_mode == 'deadband' and self.deadband_data_manager.experiment_active:
                         print(f"[MODE SWITCH] Stopping Deadband experiment before switching to {new_mode}")
                         self.deadband_data_manager.stop_experiment()
@@ -2944,9 +3704,17 @@ class TrainControlDashboard:
             else:
                 return {'mode': 'pid'}
         
-        # Track active tab for experiment mode
+        # Single tab dispatcher: tab content and the mode badge both follow the active tab
+        static_tabs = {
+            'control-tab': self.create_control_tab,
+            'data-tab': self.create_data_tab,
+            'step-response-tab': self.create_step_response_tab,
+            'deadband-tab': self.create_deadband_tab,
+        }
+
         @self.app.callback(
-            Output(self._make_id('tab-content'), 'children'),
+            [Output(self._make_id('tab-content'), 'children'),
+             Output(self._make_id('mode-indicator'), 'children')],
             [Input(self._make_id('main-tabs'), 'value'),
              Input(self._make_id('language-store'), 'data')]
         )
@@ -2956,17 +3724,14 @@ class TrainControlDashboard:
                 self.current_language = language_data.get('language', 'en')
 
             if active_tab == 'network-tab':
+                # Rebuilt every time: it lists the host's current network interfaces
                 print("[RENDER_TAB] Creating network tab...")
-                return self.create_network_tab()
-            elif active_tab == 'control-tab':
-                return self.create_control_tab()
-            elif active_tab == 'data-tab':
-                return self.create_data_tab()
-            elif active_tab == 'step-response-tab':
-                return self.create_step_response_tab()
-            elif active_tab == 'deadband-tab':
-                return self.create_deadband_tab()
-            return html.Div(self.t('tab_not_found'))
+                content = self.create_network_tab()
+            elif active_tab in static_tabs:
+                content = self._cached_tab(active_tab, static_tabs[active_tab])
+            else:
+                content = html.Div(self.t('tab_not_found'))
+            return content, self._mode_badge(active_tab)
 
         # Network configuration callbacks
         @self.app.callback(
@@ -2994,7 +3759,7 @@ class TrainControlDashboard:
                 base_id = self._get_base_id(trigger_id)
 
                 if base_id == 'refresh-interfaces-btn':
-                    self.network_manager.detect_interfaces()
+                    self.network_manager.detect_interfaces(force=True)
                     # Preserve current selection if available
                     current_ip = self.network_manager.selected_ip
                     if current_ip:
@@ -3046,16 +3811,20 @@ class TrainControlDashboard:
 
             return self.t('select_an_interface'), self.t('no_interface_selected'), self.t('configure_network_settings_above')
 
-        # Populate dropdown on page load and when refresh button is clicked
+        # Populate dropdown on page load and when refresh button is clicked; the refresh button (and the
+        # initial call) also reloads the saved ports, in the same request
         @self.app.callback(
             [Output(self._make_id('interface-dropdown'), 'options'),
-             Output(self._make_id('interface-dropdown'), 'value')],
+             Output(self._make_id('interface-dropdown'), 'value'),
+             Output(self._make_id('udp-port-input'), 'value'),
+             Output(self._make_id('mqtt-port-input'), 'value')],
             [Input(self._make_id('page-load-trigger'), 'n_intervals'),
              Input(self._make_id('main-tabs'), 'value'),
              Input(self._make_id('refresh-interfaces-btn'), 'n_clicks')]
         )
         def populate_interface_dropdown(n_intervals, tab_value, n_clicks):
             ctx = callback_context
+            base_id = None
             if ctx.triggered:
                 trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
                 base_id = self._get_base_id(trigger_id)
@@ -3076,15 +3845,11 @@ class TrainControlDashboard:
                 if self.network_manager.selected_ip in available_ips:
                     default_value = self.network_manager.selected_ip
             print(f"[CALLBACK] Returning {len(options)} options, default_value={default_value}")
-            return options, default_value
 
-        @self.app.callback(
-            [Output(self._make_id('udp-port-input'), 'value'),
-             Output(self._make_id('mqtt-port-input'), 'value')],
-            Input(self._make_id('refresh-interfaces-btn'), 'n_clicks')
-        )
-        def load_saved_ports(n_clicks):
-            return self.network_manager.udp_port, self.network_manager.mqtt_port
+            # Page-load and tab triggers leave typed (not yet applied) ports alone
+            if base_id in (None, 'refresh-interfaces-btn'):
+                return options, default_value, self.network_manager.udp_port, self.network_manager.mqtt_port
+            return options, default_value, dash.no_update, dash.no_update
 
         # PID control callbacks - step parameters sent automatically via MQTT callbacks
         @self.app.callback(
@@ -3112,14 +3877,13 @@ class TrainControlDashboard:
                             
                             # CRITICAL: Stop PID mode on ESP32 first
                             print("[STEP START] Stopping PID on ESP32...")
-                            publish.single(self.get_topic('sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                            self._publish(self.get_topic('sync'), MQTT_PAYLOAD_FALSE)
                             time.sleep(0.2)  # Wait for ESP32 to stop
                             
                             # Parameters are already on ESP32 via individual MQTT callbacks
                             # Just request a refresh to ensure sync before starting
                             print(f"[STEP START] Starting experiment with confirmed params: {confirmed}")
-                            publish.single(self.get_topic('step_request_params'), '1',
-                                         hostname=self.network_manager.mqtt_broker_ip)
+                            self._publish(self.get_topic('step_request_params'), MQTT_PAYLOAD_REQUEST)
                             time.sleep(0.2)  # Wait for confirmation
                             
                             # Switch UDP receiver to step response data manager
@@ -3127,24 +3891,27 @@ class TrainControlDashboard:
                             self.step_data_manager.start_experiment()
                             # Create new step response CSV
                             csv_path = self.step_data_manager.create_step_csv()
+                            self._active_csv.clear()
                             print(f"[STEP START] Created new CSV: {csv_path}")
                             
                             # Start the experiment
                             print("[STEP START] Starting step response mode on ESP32...")
-                            publish.single(self.get_topic('step_sync'), 'True', 
-                                         hostname=self.network_manager.mqtt_broker_ip)
+                            self._publish(self.get_topic('step_sync'), MQTT_PAYLOAD_TRUE)
                         else:
                             # PID mode - create new CSV and switch data manager
                             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                             csv_filename = f"experiment_{timestamp}.csv"
                             csv_path = os.path.join(os.getcwd(), csv_filename)
                             self.data_manager.set_csv_file(csv_path)
+                            self._active_csv.clear()
                             print(f"[PID START] Created new CSV: {csv_path}")
                             
                             # CRITICAL: Stop step response mode on ESP32 first
                             print("[PID START] Stopping step response on ESP32...")
-                            publish.single(self.get_topic('step_sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
-                            publish.single(self.get_topic('step_amplitude'), 0.0, hostname=self.network_manager.mqtt_broker_ip)
+                            self._publish_many([
+                                (self.get_topic('step_sync'), MQTT_PAYLOAD_FALSE),
+                                (self.get_topic('step_amplitude'), encode_mqtt_number(0)),
+                            ])
                             time.sleep(0.2)  # Wait for ESP32 to stop
                             
                             # Switch UDP receiver to PID data manager
@@ -3153,7 +3920,7 @@ class TrainControlDashboard:
                             
                             # Start PID experiment on ESP32
                             print("[PID START] Starting PID mode on ESP32...")
-                            publish.single(self.get_topic('sync'), 'True', hostname=self.network_manager.mqtt_broker_ip)
+                            self._publish(self.get_topic('sync'), MQTT_PAYLOAD_TRUE)
                         return html.Div(self.t('experiment_started'), style={'color': self.colors['success']})
                     else:
                         return html.Div(self.t('configure_network_warning'), style={'color': self.colors['danger']})
@@ -3161,12 +3928,12 @@ class TrainControlDashboard:
                 elif base_id == 'stop-experiment-btn' and stop_clicks:
                     if self.experiment_mode == 'step':
                         self.step_data_manager.stop_experiment()
-                        publish.single(self.get_topic('step_sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish(self.get_topic('step_sync'), MQTT_PAYLOAD_FALSE)
                         print("[STEP STOP] Stopped step response experiment")
                         return html.Div(self.t('experiment_stopped'), style={'color': self.colors['danger']})
                     else:
                         self.data_manager.stop_experiment()
-                        publish.single(self.get_topic('sync'), 'False', hostname=self.network_manager.mqtt_broker_ip)
+                        self._publish(self.get_topic('sync'), MQTT_PAYLOAD_FALSE)
                         print("[PID STOP] Stopped PID experiment")
                         return html.Div(self.t('experiment_stopped'), style={'color': self.colors['danger']})
 
@@ -3179,69 +3946,40 @@ class TrainControlDashboard:
              Input(self._make_id('ki-slider'), 'value'),
              Input(self._make_id('kd-slider'), 'value'),
              Input(self._make_id('reference-slider'), 'value'),
-             Input(self._make_id('kp-send-btn'), 'n_clicks'),
-             Input(self._make_id('ki-send-btn'), 'n_clicks'),
-             Input(self._make_id('kd-send-btn'), 'n_clicks'),
-             Input(self._make_id('ref-send-btn'), 'n_clicks')],
-            [State(self._make_id('kp-input'), 'value'),
-             State(self._make_id('ki-input'), 'value'),
-             State(self._make_id('kd-input'), 'value'),
-             State(self._make_id('ref-input'), 'value')]
+             Input(self._make_id('kp-send-store'), 'data'),
+             Input(self._make_id('ki-send-store'), 'data'),
+             Input(self._make_id('kd-send-store'), 'data'),
+             Input(self._make_id('ref-send-store'), 'data')]
         )
         def update_pid_parameters(kp_slider, ki_slider, kd_slider, ref_slider,
-                                 kp_send_clicks, ki_send_clicks, kd_send_clicks, ref_send_clicks,
-                                 kp_input, ki_input, kd_input, ref_input):
+                                 kp_sent, ki_sent, kd_sent, ref_sent):
             ctx = callback_context
+            values = {'kp': kp_slider, 'ki': ki_slider, 'kd': kd_slider, 'reference': ref_slider}
+            typed = {'kp': kp_sent, 'ki': ki_sent, 'kd': kd_sent, 'reference': ref_sent}
 
-            # Determine which control was used based on what triggered the callback
+            # Every slider / send-store pair maps onto one parameter; a send store carries the validated typed value
+            param = None
             if ctx.triggered:
                 trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
                 base_id = self._get_base_id(trigger_id)
-
-                # Handle different triggers: sliders vs send buttons
-                if base_id == 'kp-slider':
-                    kp, ki, kd, reference = kp_slider, ki_slider, kd_slider, ref_slider
-                elif base_id == 'kp-send-btn':
-                    kp, ki, kd, reference = kp_input if kp_input is not None else kp_slider, ki_slider, kd_slider, ref_slider
-                elif base_id == 'ki-slider':
-                    kp, ki, kd, reference = kp_slider, ki_slider, kd_slider, ref_slider
-                elif base_id == 'ki-send-btn':
-                    kp, ki, kd, reference = kp_slider, ki_input if ki_input is not None else ki_slider, kd_slider, ref_slider
-                elif base_id == 'kd-slider':
-                    kp, ki, kd, reference = kp_slider, ki_slider, kd_slider, ref_slider
-                elif base_id == 'kd-send-btn':
-                    kp, ki, kd, reference = kp_slider, ki_slider, kd_input if kd_input is not None else kd_slider, ref_slider
-                elif base_id == 'reference-slider':
-                    kp, ki, kd, reference = kp_slider, ki_slider, kd_slider, ref_slider
-                elif base_id == 'ref-send-btn':
-                    kp, ki, kd, reference = kp_slider, ki_slider, kd_slider, ref_input if ref_input is not None else ref_slider
-                else:
-                    # Default to slider values
-                    kp, ki, kd, reference = kp_slider, ki_slider, kd_slider, ref_slider
-            else:
-                # Default to slider values when no trigger (shouldn't happen)
-                kp, ki, kd, reference = kp_slider, ki_slider, kd_slider, ref_slider
+                param = PID_PARAM_CONTROLS.get(base_id)
+                if param and base_id.endswith('-send-store'):
+                    if not typed[param]:
+                        raise PreventUpdate
+                    values[param] = typed[param]['value']
 
             # Show parameters but don't send MQTT if not configured
             if not self.network_manager.selected_ip:
-                return self.t('pid_red_no_configurada').format(kp=kp, ki=ki, kd=kd, ref=reference)
+                return self.t('pid_red_no_configurada').format(kp=values['kp'], ki=values['ki'], kd=values['kd'],
+                                                                ref=values['reference'])
 
-            if ctx.triggered:
+            if param:
                 try:
-                    # Send MQTT only for sliders (immediate) and send buttons (on click)
-                    # Use base_id to handle both single-train and multi-train component IDs
-                    if base_id in ['kp-slider', 'kp-send-btn']:
-                        print(f"[PID MQTT] Sending Kp={kp} to {self.get_topic('kp')} @ {self.network_manager.mqtt_broker_ip}")
-                        publish.single(self.get_topic('kp'), kp, hostname=self.network_manager.mqtt_broker_ip)
-                    elif base_id in ['ki-slider', 'ki-send-btn']:
-                        print(f"[PID MQTT] Sending Ki={ki} to {self.get_topic('ki')} @ {self.network_manager.mqtt_broker_ip}")
-                        publish.single(self.get_topic('ki'), ki, hostname=self.network_manager.mqtt_broker_ip)
-                    elif base_id in ['kd-slider', 'kd-send-btn']:
-                        print(f"[PID MQTT] Sending Kd={kd} to {self.get_topic('kd')} @ {self.network_manager.mqtt_broker_ip}")
-                        publish.single(self.get_topic('kd'), kd, hostname=self.network_manager.mqtt_broker_ip)
-                    elif base_id in ['reference-slider', 'ref-send-btn']:
-                        print(f"[PID MQTT] Sending Ref={reference} to {self.get_topic('reference')} @ {self.network_manager.mqtt_broker_ip}")
-                        publish.single(self.get_topic('reference'), reference, hostname=self.network_manager.mqtt_broker_ip)
+                    # Slider moves are coalesced (only the final value goes out); send buttons publish at once
+                    publish_fn = self._publish_debounced if base_id.endswith('-slider') else self._publish
+                    topic = self.get_topic(param)
+                    print(f"[PID MQTT] Sending {PID_PARAM_LABELS[param]}={values[param]} to {topic} @ {self.network_manager.mqtt_broker_ip}")
+                    publish_fn(topic, encode_mqtt_number(values[param]))
 
                     # Simple status since ESP32 parameters are now shown above
                     return self.t('parameters_sent_esp32')
@@ -3253,193 +3991,146 @@ class TrainControlDashboard:
             # Simple default status
             return self.t('parameters_configured')
 
-        # Real-time data visualization with zoom preservation
+        # Control tab refresh: realtime graph and connection line share one request per tick
         @self.app.callback(
-            Output(self._make_id('realtime-graph'), 'figure'),
+            [Output(self._make_id('realtime-graph'), 'figure'),
+             Output(self._make_id('realtime-graph-sync'), 'data'),
+             Output(self._make_id('connection-status-indicator'), 'children'),
+             Output(self._make_id('connection-status-sync'), 'data')],
             [Input(self._make_id('data-refresh-interval'), 'n_intervals'),
-             Input(self._make_id('realtime-graph'), 'relayoutData'),
-             Input(self._make_id('ws-message-store'), 'data')],
-            prevent_initial_call=True
+             Input(self._make_id('ws-message-store'), 'data'),
+             Input(self._make_id('language-store'), 'data')],
+            [State(self._make_id('realtime-graph-sync'), 'data'),
+             State(self._make_id('realtime-graph-zoom'), 'data'),
+             State(self._make_id('connection-status-sync'), 'data')],
+            prevent_initial_call=False
         )
-        def update_realtime_graph(n_intervals, relayout_data, ws_data):
-            # Handle zoom state updates from user interaction
+        @self._single_flight
+        def refresh_control_tab(n_intervals, ws_data, language_data, sync, zoom_data, status_key):
+            # Update current language from store
+            if language_data and 'language' in language_data:
+                self.current_language = language_data['language']
+
+            base_id = None
             ctx = callback_context
-            if ctx.triggered:
+            if ctx.triggered and ctx.triggered[0]['prop_id'] != '.':
                 trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
                 base_id = self._get_base_id(trigger_id)
-                if base_id == 'realtime-graph':
-                    self._handle_zoom_state('realtime-graph', relayout_data)
+            # Zoom is tracked in the browser; it only matters when a figure is (re)built
+            self._handle_zoom_state('realtime-graph', zoom_data)
 
-            return self._create_data_graph('realtime-graph')
+            # New samples are appended in place; full figures usually come prebuilt from the background builder
+            figure, sync = self._realtime_graph_update(sync)
 
-        # Connection status callback - now responds to language changes and MQTT updates
+            # New-data pushes only concern the graph
+            if base_id == 'ws-message-store':
+                return figure, sync, dash.no_update, dash.no_update
+            try:
+                stats = self.data_manager.get_connection_stats()
+                # The line only depends on these; an idle link keeps the browser's copy
+                key = [stats['status'], stats['total_packets'], stats['last_packet_time'], self.current_language]
+                if key == status_key:
+                    return figure, sync, dash.no_update, dash.no_update
+                return figure, sync, self._connection_indicator(stats), key
+            except Exception:
+                indicator = html.Div(self.t('status_unavailable'),
+                                     style={'color': self.colors['danger'], 'fontSize': '14px'})
+                return figure, sync, indicator, None
+
+        # MQTT parameter status for the PID tab: the server only ships the values when they change,
+        # the browser renders the line (clientside callback below)
+        # Confirmations arrive over the event stream (see _event_stream); this fills the first
+        # payload and re-renders on language changes
         @self.app.callback(
-            Output(self._make_id('connection-status-indicator'), 'children'),
-            [Input(self._make_id('data-refresh-interval'), 'n_intervals'),
-             Input(self._make_id('mqtt-status-refresh'), 'n_intervals'),
-             Input(self._make_id('language-store'), 'data')],
+            Output(self._make_id('pid-confirmed-store'), 'data'),
+            Input(self._make_id('language-store'), 'data'),
+            State(self._make_id('pid-confirmed-store'), 'data'),
             prevent_initial_call=False
         )
-        def update_connection_status(n_intervals, mqtt_intervals, language_data):
-            try:
-                # Update current language from store
-                if language_data and 'language' in language_data:
-                    self.current_language = language_data['language']
-
-                stats = self.data_manager.get_connection_stats()
-
-                # Status color and message based on connection (now translated)
-                if stats['status'] == 'Connected':
-                    color = self.colors['success']
-                    icon = '🟢'
-                    status_text = self.t('connected')
-                elif stats['status'] == 'Connection lost':
-                    color = self.colors['danger']
-                    icon = '🔴'
-                    status_text = self.t('connection_lost')
-                elif stats['total_packets'] > 0:
-                    color = self.colors['success']
-                    icon = '🟢'
-                    status_text = self.t('receiving_data')
-                else:
-                    color = self.colors['text']
-                    icon = '🟡'
-                    status_text = self.t('waiting_for_data_status')
+        def update_pid_confirmed_store(language_data, current):
+            if language_data and 'language' in language_data:
+                self.current_language = language_data['language']
+            payload = self._pid_status_payload()
+            # Compared per browser (State), so every client still receives the first payload
+            if current and current.get('key') == payload['key']:
+                raise PreventUpdate
+            return payload
+
+        # Pan/zoom gestures stay in the browser; the graph callbacks read the stores as State
+        for graph_id in ('realtime-graph', 'historical-graph'):
+            self.app.clientside_callback(
+                ZOOM_STATE_CLIENTSIDE_JS,
+                Output(self._make_id(f'{graph_id}-zoom'), 'data'),
+                Input(self._make_id(graph_id), 'relayoutData'),
+                State(self._make_id(f'{graph_id}-zoom'), 'data'),
+                prevent_initial_call=True
+            )
 
-                # Format last packet time with translation
-                last_time = stats['last_packet_time'] if stats['last_packet_time'] != "Never" else self.t('never')
+        # Typed values are validated in the browser; only usable ones reach the parameter callbacks
+        for name in TYPED_SEND_CONTROLS:
+            self.app.clientside_callback(
+                SEND_GATE_CLIENTSIDE_JS,
+                Output(self._make_id(f'{name}-send-store'), 'data'),
+                Input(self._make_id(f'{name}-send-btn'), 'n_clicks'),
+                State(self._make_id(f'{name}-input'), 'value'),
+                prevent_initial_call=True
+            )
 
-                # Add MQTT parameter status (the main thing the user wants to see!)
-                mqtt_status = self._get_pid_connection_status()
+        # New data and PID confirmations are pushed over one event stream per page (no polling interval)
+        self.app.server.add_url_rule(self._event_stream_path(), endpoint=self._make_id('event-stream'),
+                                     view_func=self._event_stream)
+        self.app.clientside_callback(
+            EVENT_STREAM_CLIENTSIDE_JS,
+            Input(self._make_id('event-stream-config'), 'data')
+        )
 
-                return html.Div([
-                    # UDP Connection status
-                    html.Div([
-                        html.Span(f"{icon} {status_text}",
-                                 style={'color': color, 'fontWeight': 'bold', 'marginRight': '20px'}),
-                        html.Span(f"{self.t('packets')}: {stats['total_packets']}",
-                                 style={'color': self.colors['text'], 'marginRight': '20px'}),
-                        html.Span(f"{self.t('last')}: {last_time}",
-                                 style={'color': self.colors['text']})
-                    ], style={'fontSize': '14px', 'marginBottom': '8px'}),
-
-                    # MQTT Parameter Status (NEW - this is what shows current ESP32 values)
-                    html.Div([
-                        mqtt_status
-                    ], style={'fontSize': '14px', 'borderTop': '1px solid #eee', 'paddingTop': '8px'})
-                ])
-            except Exception as e:
-                return html.Div(self.t('status_unavailable'),
-                               style={'color': self.colors['danger'], 'fontSize': '14px'})
+        self.app.clientside_callback(
+            PID_STATUS_CLIENTSIDE_JS,
+            Output(self._make_id('pid-params-status'), 'children'),
+            Input(self._make_id('pid-confirmed-store'), 'data')
+        )
 
-        # Detailed connection status for data tab
+        # Data tab refresh: status, historical graph and CSV path share one request per tick
         @self.app.callback(
-            Output(self._make_id('detailed-connection-status'), 'children'),
+            [Output(self._make_id('detailed-connection-status'), 'children'),
+             Output(self._make_id('historical-graph'), 'figure'),
+             Output(self._make_id('historical-graph-sync'), 'data'),
+             Output(self._make_id('csv-file-path'), 'children')],
             [Input(self._make_id('data-refresh-interval'), 'n_intervals'),
              Input(self._make_id('mqtt-status-refresh'), 'n_intervals')],
+            [State(self._make_id('historical-graph-sync'), 'data'),
+             State(self._make_id('historical-graph-zoom'), 'data')],
             prevent_initial_call=True
         )
-        def update_detailed_connection_status(n_intervals, mqtt_intervals):
-            # Reduced verbosity - comment out repetitive status prints
-            # timestamp = time.strftime('%H:%M:%S')
-            # print(f"[CONNECTION STATUS {timestamp}] Callback triggered - intervals: data={n_intervals}, mqtt={mqtt_intervals}")
-            # print(f"[CONNECTION STATUS {timestamp}] MQTT sync confirmed params: {self.mqtt_sync.confirmed_params if hasattr(self, 'mqtt_sync') else 'N/A'}")
-
-            if not self.data_manager.initialized:
-                # print(f"[CONNECTION STATUS] Data manager not initialized")
-                return html.Div([
-                    html.P(self.t('network_not_configured'), style={'color': self.colors['warning'], 'marginBottom': '5px'}),
-                    html.P(self.t('go_to_network_tab'), style={'color': self.colors['text']})
-                ])
-
-            stats = self.data_manager.get_connection_stats()
-            latest_data = self.data_manager.get_latest_data()
-
-            # Status sections
-            status_color = self.colors['success'] if stats['status'] == 'Connected' else self.colors['danger']
-
-            return html.Div([
-                # Connection status
-                html.Div([
-                    html.Strong(self.t('status') + ": ", style={'color': self.colors['text']}),
-                    html.Span(stats['status'], style={'color': status_color, 'fontWeight': 'bold'})
-                ], style={'marginBottom': '10px'}),
-
-                # Statistics
-                html.Div([
-                    html.Div([
-                        html.Strong(self.t('total_packets_label') + ": ", style={'color': self.colors['text']}),
-                        html.Span(str(stats['total_packets']))
-                    ], style={'display': 'inline-block', 'marginRight': '30px'}),
-
-                    html.Div([
-                        html.Strong(self.t('last_received') + ": ", style={'color': self.colors['text']}),
-                        html.Span(stats['last_packet_time'])
-                    ], style={'display': 'inline-block', 'marginRight': '30px'}),
-
-                    html.Div([
-                        html.Strong(self.t('experiment_label') + ": ", style={'color': self.colors['text']}),
-                        html.Span(self.t('active') if stats['experiment_active'] else self.t('stopped'),
-                                style={'color': self.colors['success'] if stats['experiment_active'] else self.colors['text']})
-                    ], style={'display': 'inline-block'})
-                ], style={'marginBottom': '10px'}),
-
-                # Latest data
-                html.Div([
-                    html.Strong(self.t('latest_data') + ": ", style={'color': self.colors['text']}),
-                    html.Span(latest_data.get('full_data', self.t('no_data_received')) if latest_data else self.t('no_data_received'),
-                            style={'fontFamily': 'monospace', 'backgroundColor': '#f1f1f1', 'padding': '2px 5px', 'borderRadius': '3px'})
-                ]) if latest_data else html.Div([
-                    html.Strong(self.t('latest_data') + ": ", style={'color': self.colors['text']}),
-                    html.Span(self.t('no_data_received'), style={'color': self.colors['warning']})
-                ]),
-
-                # MQTT Parameter Status
-                html.Div([
-                    html.Hr(style={'margin': '15px 0'}),
-                    self._get_parameter_status_display()
-                ], style={'marginTop': '15px'})
-            ])
-
-        # Historical graph for data tab with zoom preservation
-        @self.app.callback(
-            Output(self._make_id('historical-graph'), 'figure'),
-            [Input(self._make_id('data-refresh-interval'), 'n_intervals'),
-             Input(self._make_id('historical-graph'), 'relayoutData')]
-        )
-        def update_historical_graph(n_intervals, relayout_data):
-            # Handle zoom state updates from user interaction for historical graph
+        @self._single_flight
+        def refresh_data_tab(n_intervals, mqtt_intervals, graph_version, zoom_data):
             ctx = callback_context
-            if ctx.triggered:
-                trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-                base_id = self._get_base_id(trigger_id)
-                if base_id == 'historical-graph':
-                    self._handle_zoom_state('historical-graph', relayout_data)
+            trigger_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else ''
+            base_id = self._get_base_id(trigger_id)
+            # Zoom is tracked in the browser; it only matters when the figure is rebuilt
+            self._handle_zoom_state('historical-graph', zoom_data)
 
-            return self._create_data_graph('historical-graph', title_prefix="Historical: ")
+            status = self._detailed_connection_status(self.data_manager.get_connection_stats())
+            # The fast MQTT tick only refreshes the parameter status; graph and file follow the data tick
+            if base_id == 'mqtt-status-refresh':
+                return status, dash.no_update, dash.no_update, dash.no_update
 
-        # Data tab callbacks
-        @self.app.callback(
-            Output(self._make_id('csv-file-path'), 'children'),
-            Input(self._make_id('data-refresh-interval'), 'n_intervals'),
-            prevent_initial_call=True
-        )
-        def update_csv_path(n_intervals):
-            # Show the actual active file being read from
-            csv_files = glob.glob(self._get_csv_glob_pattern('pid'))
-            if csv_files:
-                active_csv = max(csv_files, key=os.path.getmtime)
-                file_size = os.path.getsize(active_csv)
-                return f"{active_csv} ({file_size} bytes)"
-            return self.t('configure_network_enable_logging')
+            # Skip building and shipping the figure while the CSV has not grown since the browser's copy
+            version = self._historical_version()
+            if version == graph_version:
+                return status, dash.no_update, dash.no_update, self._csv_path_text()
+            return (status, self._create_data_graph('historical-graph', title_prefix="Historical: "), version,
+                    self._csv_path_text())
 
         # CSV download callbacks - one for each tab
         def create_download_callback():
             """Shared download logic for all tabs"""
+            # Buffered rows must be on disk before the file is sent
+            for manager in (self.data_manager, self.step_data_manager, self.deadband_data_manager):
+                manager.flush_csv()
+
             # Find the active CSV file (either PID or Step Response mode)
-            pid_files = glob.glob(self._get_csv_glob_pattern('pid'))
-            step_files = glob.glob(self._get_csv_glob_pattern('step'))
-            all_csv_files = pid_files + step_files
+            all_csv_files = [path for path in (self._find_active_csv('pid'), self._find_active_csv('step')) if path]
 
             if all_csv_files:
                 # Get the most recently modified CSV file
@@ -3504,20 +4195,26 @@ class TrainControlDashboard:
         @self.app.callback(
             Output(self._make_id('step-esp32-status'), 'children'),
             [Input(self._make_id('amplitude-slider'), 'value'),
-             Input(self._make_id('amplitude-send-btn'), 'n_clicks'),
+             Input(self._make_id('amplitude-send-store'), 'data'),
              Input(self._make_id('duration-slider'), 'value'),
-             Input(self._make_id('duration-send-btn'), 'n_clicks'),
+             Input(self._make_id('duration-send-store'), 'data'),
              Input(self._make_id('vbatt-slider'), 'value'),
              Input(self._make_id('direction-radio'), 'value'),
-             Input(self._make_id('mqtt-status-refresh'), 'n_intervals')],
-            [State(self._make_id('amplitude-input'), 'value'),
-             State(self._make_id('duration-input'), 'value')]
+             Input(self._make_id('mqtt-status-refresh'), 'n_intervals')]
         )
-        def update_step_parameters(amp_slider, amp_clicks, dur_slider, dur_clicks,
-                                  vbatt, direction, mqtt_intervals, 
-                                  amp_input, dur_input):
+        def update_step_parameters(amp_slider, amp_sent, dur_slider, dur_sent,
+                                  vbatt, direction, mqtt_intervals):
             ctx = callback_context
 
+            # Without a network there is nothing to send: the warning only changes with the language
+            if not self.network_manager.selected_ip:
+                if ctx.triggered and self._step_warning_language == self.current_language:
+                    raise PreventUpdate
+                self._step_warning_language = self.current_language
+                return html.Div(self.t('network_not_configured'),
+                                style={'color': self.colors['warning']})
+            self._step_warning_language = None
+
             if ctx.triggered:
                 trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
                 base_id = self._get_base_id(trigger_id)
@@ -3527,91 +4224,66 @@ class TrainControlDashboard:
                     print(f"[STEP PARAM] Callback triggered by: {trigger_id}")
 
                 # Send MQTT updates
-                if self.network_manager.selected_ip:
-                    try:
-                        if base_id == 'amplitude-slider':
-                            publish.single(self.get_topic('step_amplitude'), str(amp_slider),
-                                         hostname=self.network_manager.mqtt_broker_ip)
-                            print(f"[STEP PARAM] Sent amplitude = {amp_slider}")
-                        elif base_id == 'amplitude-send-btn' and amp_input is not None:
-                            publish.single(self.get_topic('step_amplitude'), str(amp_input),
-                                         hostname=self.network_manager.mqtt_broker_ip)
-                            print(f"[STEP PARAM] Sent amplitude = {amp_input}")
-                        elif base_id == 'duration-slider':
-                            publish.single(self.get_topic('step_time'), str(dur_slider),
-                                         hostname=self.network_manager.mqtt_broker_ip)
-                            print(f"[STEP PARAM] Sent time = {dur_slider}")
-                        elif base_id == 'duration-send-btn' and dur_input is not None:
-                            publish.single(self.get_topic('step_time'), str(dur_input),
-                                         hostname=self.network_manager.mqtt_broker_ip)
-                            print(f"[STEP PARAM] Sent time = {dur_input}")
-                        elif base_id == 'vbatt-slider':
-                            publish.single(self.get_topic('step_vbatt'), str(vbatt),
-                                         hostname=self.network_manager.mqtt_broker_ip)
-                            print(f"[STEP PARAM] Sent vbatt = {vbatt}")
-                        elif base_id == 'direction-radio':
-                            publish.single(self.get_topic('step_direction'), direction,
-                                         hostname=self.network_manager.mqtt_broker_ip)
-                            print(f"[STEP PARAM] Sent direction = {direction}")
-                    except Exception as e:
-                        print(f"[STEP PARAM ERROR] Failed to send {trigger_id}: {e}")
-                        pass  # Handle MQTT errors
-            
+                try:
+                    # Slider values are coalesced (only the final value goes out); typed values publish at once
+                    if base_id == 'amplitude-slider':
+                        self._publish_debounced(self.get_topic('step_amplitude'), encode_mqtt_number(amp_slider))
+                        print(f"[STEP PARAM] Sent amplitude = {amp_slider}")
+                    elif base_id == 'amplitude-send-store' and amp_sent:
+                        self._publish(self.get_topic('step_amplitude'), encode_mqtt_number(amp_sent['value']))
+                        print(f"[STEP PARAM] Sent amplitude = {amp_sent['value']}")
+                    elif base_id == 'duration-slider':
+                        self._publish_debounced(self.get_topic('step_time'), encode_mqtt_number(dur_slider))
+                        print(f"[STEP PARAM] Sent time = {dur_slider}")
+                    elif base_id == 'duration-send-store' and dur_sent:
+                        self._publish(self.get_topic('step_time'), encode_mqtt_number(dur_sent['value']))
+                        print(f"[STEP PARAM] Sent time = {dur_sent['value']}")
+                    elif base_id == 'vbatt-slider':
+                        self._publish_debounced(self.get_topic('step_vbatt'), encode_mqtt_number(vbatt))
+                        print(f"[STEP PARAM] Sent vbatt = {vbatt}")
+                    elif base_id == 'direction-radio':
+                        self._publish(self.get_topic('step_direction'), encode_mqtt_number(direction))
+                        print(f"[STEP PARAM] Sent direction = {direction}")
+                except Exception as e:
+                    print(f"[STEP PARAM ERROR] Failed to send {trigger_id}: {e}")
+                    pass  # Handle MQTT errors
+
             # ESP32 status
-            if not self.network_manager.selected_ip:
-                return html.Div(self.t('network_not_configured'), 
-                              style={'color': self.colors['warning']})
-            else:
-                return self._get_step_parameter_status_display()
+            return self._get_step_parameter_status_display()
 
         # Step Response Graph Update
         @self.app.callback(
             Output(self._make_id('step-response-graph'), 'figure'),
-            [Input(self._make_id('data-refresh-interval'), 'n_intervals')]
+            [Input(self._make_id('data-refresh-interval'), 'n_intervals')],
+            prevent_initial_call=True
         )
+        @self._single_flight
         def update_step_graph(n_intervals):
             """Update step response graph with 3 traces: distance, step input, PWM"""
             try:
-                # Find step response CSV files
-                csv_files = glob.glob(self._get_csv_glob_pattern('step'))
-                if not csv_files:
-                    fig = px.line(title=self.t('no_step_data'))
-                    fig.update_layout(
-                        plot_bgcolor=self.colors['surface'],
-                        paper_bgcolor=self.colors['background'],
-                        font_color=self.colors['text']
-                    )
-                    return fig
-                
-                # Get most recent file
-                active_csv = max(csv_files, key=os.path.getmtime)
-                file_size = os.path.getsize(active_csv)
-                
-                if file_size < 150:  # File has only headers
-                    fig = px.line(title=self.t('waiting_for_data'))
-                    fig.update_layout(
-                        plot_bgcolor=self.colors['surface'],
-                        paper_bgcolor=self.colors['background'],
-                        font_color=self.colors['text']
-                    )
-                    return fig
-                
-                # Read and parse data, skipping any duplicate header rows
-                df = pd.read_csv(active_csv, on_bad_lines='skip')
-                
-                # Filter out rows where time_event is not numeric (duplicate headers)
-                df = df[pd.to_numeric(df['time_event'], errors='coerce').notna()]
-                
-                # Convert columns to numeric
-                numeric_cols = ['time2sinc', 'time_event', 'motor_dir', 'v_batt', 'output_G', 'step_input', 'PWM_input']
-                for col in numeric_cols:
-                    if col in df.columns:
-                        df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-                # Remove any rows with NaN values
-                df = df.dropna()
-                
-                if df.empty:
+                step_manager = self.step_data_manager
+                if step_manager.initialized and len(step_manager.telemetry):
+                    # Live run: plot straight from the in-memory ring, no CSV re-read
+                    samples = step_manager.telemetry.snapshot(('time_event', 'output_G'))
+                    valid = np.isfinite(samples['time_event']) & np.isfinite(samples['output_G'])
+                    time_event = samples['time_event'][valid]
+                    output_g = samples['output_G'][valid]
+                    if len(time_event) > 1 and np.any(time_event[1:] < time_event[:-1]):
+                        order = np.argsort(time_event, kind='stable')
+                        time_event, output_g = time_event[order], output_g[order]
+                else:
+                    # No live run in this session: show the most recent step CSV on disk
+                    time_event, output_g = self._load_step_csv_columns()
+                    if time_event is None:
+                        fig = px.line(title=self.t('no_step_data'))
+                        fig.update_layout(
+                            plot_bgcolor=self.colors['surface'],
+                            paper_bgcolor=self.colors['background'],
+                            font_color=self.colors['text']
+                        )
+                        return fig
+
+                if len(time_event) == 0:
                     fig = px.line(title=self.t('waiting_for_data'))
                     fig.update_layout(
                         plot_bgcolor=self.colors['surface'],
@@ -3623,9 +4295,9 @@ class TrainControlDashboard:
                 fig = go.Figure()
                 
                 # Plot only distance response (output_G) - user knows step and PWM values
-                fig.add_trace(go.Scatter(
-                    x=df['time_event'] / 1000,  # Convert ms to seconds
-                    y=df['output_G'],
+                fig.add_trace(go.Scattergl(
+                    x=time_event / 1000,  # Convert ms to seconds
+                    y=output_g,
                     mode='lines+markers',
                     name=self.t('distance_response'),
                     line=dict(color='blue', width=2),
@@ -3633,14 +4305,14 @@ class TrainControlDashboard:
                 ))
                 
                 fig.update_layout(
-                    title=f"{self.t('step_response_graph')} ({len(df)} {self.t('points')})",
+                    title=f"{self.t('step_response_graph')} ({len(time_event)} {self.t('points')})",
                     xaxis_title=f"{self.t('time')} (s)",
                     yaxis_title=self.t('distance_cm'),
                     plot_bgcolor=self.colors['surface'],
                     paper_bgcolor=self.colors['background'],
                     font_color=self.colors['text'],
                     showlegend=False,
-                    margin=dict(l=40, r=20, t=40, b=40),
+                    margin=GRAPH_MARGIN,
                     hovermode='x unified'
                 )
                 
@@ -3703,23 +4375,21 @@ class TrainControlDashboard:
 
                     # Create new CSV file
                     csv_path = self.deadband_data_manager.create_deadband_csv()
+                    self.deadband_data_manager.start_experiment()
                     print(f"Deadband calibration CSV: {csv_path}")
 
                     # Send configuration via MQTT
                     print(f"[DEADBAND] Sending direction={direction} to {self.get_topic('deadband_direction')} @ {self.network_manager.mqtt_broker_ip}")
-                    publish.single(self.get_topic('deadband_direction'), str(direction),
-                                 hostname=self.network_manager.mqtt_broker_ip)
+                    self._publish(self.get_topic('deadband_direction'), encode_mqtt_number(direction))
                     time.sleep(0.05)
 
                     print(f"[DEADBAND] Sending threshold={threshold} to {self.get_topic('deadband_threshold')} @ {self.network_manager.mqtt_broker_ip}")
-                    publish.single(self.get_topic('deadband_threshold'), str(threshold),
-                                 hostname=self.network_manager.mqtt_broker_ip)
+                    self._publish(self.get_topic('deadband_threshold'), encode_mqtt_number(threshold))
                     time.sleep(0.05)
 
                     # Start calibration
                     print(f"[DEADBAND] Sending sync=True to {self.get_topic('deadband_sync')} @ {self.network_manager.mqtt_broker_ip}")
-                    publish.single(self.get_topic('deadband_sync'), "True",
-                                 hostname=self.network_manager.mqtt_broker_ip)
+                    self._publish(self.get_topic('deadband_sync'), MQTT_PAYLOAD_TRUE)
                     print("[DEADBAND] Calibration start command sent to ESP32")
         
                     return (html.Div(self.t('calibration_in_progress'),
@@ -3734,8 +4404,8 @@ class TrainControlDashboard:
             elif base_id == 'deadband-stop-btn' and stop_clicks > 0:
                 try:
                     print(f"[DEADBAND] Sending sync=False to {self.get_topic('deadband_sync')} @ {self.network_manager.mqtt_broker_ip}")
-                    publish.single(self.get_topic('deadband_sync'), "False",
-                                 hostname=self.network_manager.mqtt_broker_ip)
+                    self._publish(self.get_topic('deadband_sync'), MQTT_PAYLOAD_FALSE)
+                    self.deadband_data_manager.stop_experiment()
                     print("[DEADBAND] Calibration stop command sent to ESP32")
 
                     return (html.Div(self.t('calibration_complete'),
@@ -3780,8 +4450,7 @@ class TrainControlDashboard:
             if n_clicks > 0 and result_text:
                 try:
                     # Send apply command via MQTT
-                    publish.single(self.get_topic('deadband_apply'), "True",
-                                 hostname=self.network_manager.mqtt_broker_ip)
+                    self._publish(self.get_topic('deadband_apply'), MQTT_PAYLOAD_TRUE)
         
                     return html.Div(self.t('deadband_applied'),
                                    style={'color': '#28A745', 'fontWeight': 'bold'})
@@ -3799,8 +4468,10 @@ class TrainControlDashboard:
         
         @self.app.callback(
             Output(self._make_id('deadband-pwm-graph'), 'figure'),
-            Input(self._make_id('graph-update-interval'), 'n_intervals')
+            Input(self._make_id('graph-update-interval'), 'n_intervals'),
+            prevent_initial_call=True
         )
+        @self._single_flight
         def update_deadband_pwm_graph(n):
             """Update PWM vs Time graph"""
             try:
@@ -3829,8 +4500,8 @@ class TrainControlDashboard:
                 ))
         
                 # Mark motion detection point
-                if 1 in data['motion_detected']:
-                    idx = data['motion_detected'].index(1)
+                idx = self.deadband_data_manager.motion_index
+                if idx is not None and idx < len(data['time']):
                     fig.add_trace(go.Scatter(
                         x=[data['time'][idx]],
                         y=[data['pwm'][idx]],
@@ -3863,8 +4534,10 @@ class TrainControlDashboard:
         
         @self.app.callback(
             Output(self._make_id('deadband-distance-graph'), 'figure'),
-            Input(self._make_id('graph-update-interval'), 'n_intervals')
+            Input(self._make_id('graph-update-interval'), 'n_intervals'),
+            prevent_initial_call=True
         )
+        @self._single_flight
         def update_deadband_distance_graph(n):
             """Update Distance vs Time graph"""
             try:
@@ -3914,8 +4587,8 @@ class TrainControlDashboard:
                     )
         
                 # Mark motion detection point
-                if 1 in data['motion_detected']:
-                    idx = data['motion_detected'].index(1)
+                idx = self.deadband_data_manager.motion_index
+                if idx is not None and idx < len(data['time']):
                     fig.add_trace(go.Scatter(
                         x=[data['time'][idx]],
                         y=[data['distance'][idx]],
@@ -3946,8 +4619,10 @@ class TrainControlDashboard:
         
         @self.app.callback(
             Output(self._make_id('deadband-curve-graph'), 'figure'),
-            Input(self._make_id('graph-update-interval'), 'n_intervals')
+            Input(self._make_id('graph-update-interval'), 'n_intervals'),
+            prevent_initial_call=True
         )
+        @self._single_flight
         def update_deadband_curve_graph(n):
             """Update PWM vs Distance calibration curve"""
             try:
@@ -3976,8 +4651,8 @@ class TrainControlDashboard:
                 ))
         
                 # Mark deadband point
-                if 1 in data['motion_detected']:
-                    idx = data['motion_detected'].index(1)
+                idx = self.deadband_data_manager.motion_index
+                if idx is not None and idx < len(data['time']):
                     deadband_pwm = data['pwm'][idx]
                     deadband_distance = data['distance'][idx]
         
@@ -4022,8 +4697,21 @@ class TrainControlDashboard:
                            style={'color': self.colors['warning']})
         
         confirmed = self.mqtt_sync.step_confirmed_params
+
+        # Polled every 200 ms but only changes on confirmation; reuse the component for identical values
+        cache_key = ('step', self.current_language, confirmed.get('amplitude'), confirmed.get('time'),
+                     confirmed.get('direction'), confirmed.get('vbatt'))
+        display = self._status_cache.get(cache_key)
+        if display is None:
+            if len(self._status_cache) >= STATUS_CACHE_SIZE:
+                self._status_cache.clear()
+            display = self._status_cache[cache_key] = self._build_step_parameter_status(confirmed)
+        return display
+
+    def _build_step_parameter_status(self, confirmed):
+        """Component tree for the confirmed step response parameters"""
         has_confirmed = any(v is not None for v in confirmed.values())
-        
+
         if has_confirmed:
             amp = f"{confirmed['amplitude']:.1f}" if confirmed['amplitude'] is not None else "?"
             time_val = f"{confirmed['time']:.1f}" if confirmed['time'] is not None else "?"
@@ -4046,9 +4734,9 @@ class TrainControlDashboard:
                            style={'color': self.colors['warning'], 'fontSize': '11px'})
 
 
-    def run(self, host='127.0.0.1', port=8050, debug=True, use_reloader=True):
+    def run(self, host='127.0.0.1', port=8050, debug=True, use_reloader=True, dev_server=False):
         """Run the dashboard"""
-        self.app.run(host=host, port=port, debug=debug, use_reloader=use_reloader)
+        serve_dash_app(self.app, host, port, debug=debug, use_reloader=use_reloader, dev_server=dev_server)
 
 # Global instances
 network_manager = NetworkManager()
@@ -4102,7 +4790,9 @@ if __name__ == '__main__':
     log.setLevel(logging.ERROR)  # Only show errors, not every request
 
     try:
-        dashboard.run(debug=False, use_reloader=False)  # CRITICAL: use_reloader=False prevents WSL context reload
+        # --dev keeps the Flask development server instead of waitress
+        dashboard.run(debug=False, use_reloader=False,  # CRITICAL: use_reloader=False prevents WSL context reload
+                      dev_server='--dev' in sys.argv)
     except KeyboardInterrupt:
         print("\nShutting down...")
         udp_receiver.stop()
\ No newline at end of file